@@ -0,0 +1,39 @@
+import asyncio
+import sys
+import time
+from typing import List
+
+from symba.aio import inverse
+from symba.base import sqrt
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+async def measure_latency(done: asyncio.Event) -> List[float]:
+    result = []
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        result.append(time.perf_counter() - start)
+    return result
+
+
+async def run(size: int) -> None:
+    expression = sum(sqrt(prime) for prime in _PRIMES[:size]) + 1
+    done = asyncio.Event()
+    latencies_task = asyncio.ensure_future(measure_latency(done))
+    start = time.perf_counter()
+    await inverse(expression)
+    elapsed = time.perf_counter() - start
+    done.set()
+    latencies = await latencies_task
+    print(f'inverse of {size}-terms form: {elapsed:.3f}s, '
+          f'max event loop latency: {max(latencies) * 1000:.1f}ms')
+
+
+def main(size: int) -> None:
+    asyncio.run(run(size))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
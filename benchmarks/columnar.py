@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from symba.base import sqrt
+from symba.columnar import (ColumnarStore,
+                            dump)
+
+
+def main(size: int) -> None:
+    bases = [sqrt(2) + sqrt(3) - 1, sqrt(5) - sqrt(7), 2 * sqrt(11) + 3]
+    tracemalloc.start()
+    expressions = [bases[value % len(bases)] * value
+                   for value in range(1, size + 1)]
+    objects_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{size} degree-1 expressions')
+    print(f'objects: {objects_size / size:.1f} bytes per expression')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'store.bin')
+        with open(path, 'wb') as file:
+            print('dump: {:.3f}s'.format(
+                    timeit.timeit(lambda: dump(expressions, file),
+                                  number=1)
+            ))
+        print('store: {:.1f} bytes per expression'.format(
+                os.path.getsize(path) / size
+        ))
+        with ColumnarStore(path) as store:
+            print('materialize all: {:.3f}s'.format(
+                    timeit.timeit(lambda: list(store),
+                                  number=1)
+            ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
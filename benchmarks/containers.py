@@ -0,0 +1,53 @@
+import heapq
+import random
+import sys
+import timeit
+from typing import List
+
+from symba.base import (Expression,
+                        sqrt)
+from symba.containers import Heap
+
+
+def generate_distances(count: int, seed: int = 0) -> List[Expression]:
+    generator = random.Random(seed)
+    return [sqrt(generator.randint(0, 10 ** 6) ** 2
+                 + generator.randint(0, 10 ** 6) ** 2)
+            + sqrt(generator.randint(0, 10 ** 6) ** 2
+                   + generator.randint(0, 10 ** 6) ** 2)
+            for _ in range(count)]
+
+
+def run_heapq(distances: List[Expression]) -> None:
+    heap: List[Expression] = []
+    for distance in distances:
+        heapq.heappush(heap, distance)
+    while heap:
+        heapq.heappop(heap)
+
+
+def run_heap(distances: List[Expression]) -> Heap[None]:
+    heap: Heap[None] = Heap()
+    for distance in distances:
+        heap.push(distance)
+    while heap:
+        heap.pop()
+    return heap
+
+
+def main(count: int) -> None:
+    distances = generate_distances(count)
+    print(f'{count} sums of distances')
+    print('heapq: {:.3f}s'.format(
+            timeit.timeit(lambda: run_heapq(distances),
+                          number=1)
+    ))
+    print('symba.containers.Heap: {:.3f}s'.format(
+            timeit.timeit(lambda: run_heap(distances),
+                          number=1)
+    ))
+    print(run_heap(distances).statistics)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,39 @@
+import random
+import sys
+import timeit
+from typing import (List,
+                    Tuple)
+
+from symba.base import (Expression,
+                        dot,
+                        sqrt)
+
+Vector = Tuple[Expression, Expression, Expression]
+
+
+def generate_vectors(count: int, seed: int = 0) -> List[Vector]:
+    generator = random.Random(seed)
+    return [(sqrt(generator.randint(1, 100)) + generator.randint(-10, 10),
+             sqrt(generator.randint(1, 100)) + generator.randint(-10, 10),
+             sqrt(generator.randint(1, 100)) + generator.randint(-10, 10))
+            for _ in range(count)]
+
+
+def main(count: int) -> None:
+    vectors = generate_vectors(count)
+    pairs = list(zip(vectors, vectors[1:]))
+    print(f'{len(pairs)} dot products of 3D vectors')
+    print('sum of products: {:.3f}s'.format(
+            timeit.timeit(lambda: [sum(x * y for x, y in zip(left, right))
+                                   for left, right in pairs],
+                          number=1)
+    ))
+    print('dot: {:.3f}s'.format(
+            timeit.timeit(lambda: [dot(left, right)
+                                   for left, right in pairs],
+                          number=1)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,38 @@
+import sys
+import timeit
+
+from symba.base import (ExpressionArray,
+                        sqrt)
+
+
+def main(size: int) -> None:
+    radicals = [sqrt(2), sqrt(3), sqrt(5), sqrt(6)]
+    left = [value * radicals[value % len(radicals)] + value
+            for value in range(1, size + 1)]
+    right = [radicals[(value + 1) % len(radicals)] - value
+             for value in range(1, size + 1)]
+    left_array = ExpressionArray(left)
+    right_array = ExpressionArray(right, left_array.kernels)
+    print(f'{size} degree-1 expressions')
+    for name, function, array_function in [
+        ('add', lambda: [left_value + right_value
+                         for left_value, right_value in zip(left, right)],
+         lambda: left_array + right_array),
+        ('mul', lambda: [left_value * right_value
+                         for left_value, right_value in zip(left, right)],
+         lambda: left_array * right_array),
+        ('lt', lambda: [left_value < right_value
+                        for left_value, right_value in zip(left, right)],
+         lambda: left_array < right_array),
+    ]:
+        print('{} expressions: {:.3f}s, array: {:.3f}s'.format(
+                name,
+                timeit.timeit(function,
+                              number=1),
+                timeit.timeit(array_function,
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,41 @@
+import sys
+import timeit
+
+from symba import parallel
+from symba.base import (Expression,
+                        fsum,
+                        sqrt)
+
+
+def to_form(size: int, offset: int) -> Expression:
+    radicands = [value
+                 for value in range(offset, offset + 3 * size)
+                 if round(value ** 0.5) ** 2 != value][:size]
+    return fsum([(radicand % 7 - 3 or 1) * sqrt(radicand)
+                 for radicand in radicands])
+
+
+def main(max_size: int) -> None:
+    sizes = []
+    size = 4
+    while size <= max_size:
+        sizes.append(size)
+        size *= 2
+    forms_pairs = [(to_form(size, 2), to_form(size, 3)) for size in sizes]
+    serial_times = [timeit.timeit(lambda: left * right,
+                                  number=1)
+                    for left, right in forms_pairs]
+    with parallel.forms_multiplication(threshold=1):
+        # starts workers before measurements
+        _ = forms_pairs[0][0] * forms_pairs[0][1]
+        parallel_times = [timeit.timeit(lambda: left * right,
+                                        number=1)
+                          for left, right in forms_pairs]
+    for size, serial_time, parallel_time in zip(sizes, serial_times,
+                                                parallel_times):
+        print(f'{size}x{size} terms serial: {serial_time:.3f}s, '
+              f'parallel: {parallel_time:.3f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 32)
@@ -0,0 +1,28 @@
+import random
+import sys
+import timeit
+from typing import List
+
+from symba.base import (Expression,
+                        fsum,
+                        sqrt)
+
+
+def generate_segments_lengths(count: int, seed: int = 0) -> List[Expression]:
+    generator = random.Random(seed)
+    return [sqrt(generator.randint(-100, 100) ** 2
+                 + generator.randint(-100, 100) ** 2)
+            for _ in range(count)]
+
+
+def main(count: int) -> None:
+    lengths = generate_segments_lengths(count)
+    print(f'polyline of {count} segments')
+    print('sum: {:.3f}s'.format(timeit.timeit(lambda: sum(lengths),
+                                              number=1)))
+    print('fsum: {:.3f}s'.format(timeit.timeit(lambda: fsum(lengths),
+                                               number=1)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,41 @@
+import random
+import sys
+import timeit
+from typing import (List,
+                    Tuple)
+
+from symba.base import sqrt
+from symba.geometry import (DistanceMatrix,
+                            hypot)
+
+
+def generate_points(size: int, seed: int = 0) -> List[Tuple[int, int]]:
+    generator = random.Random(seed)
+    return [(generator.randint(-100, 100), generator.randint(-100, 100))
+            for _ in range(size)]
+
+
+def main(sizes: List[int]) -> None:
+    for size in sizes:
+        points = generate_points(size)
+        pairs = [(point, other_point)
+                 for index, point in enumerate(points)
+                 for other_point in points[index + 1:]]
+        print(f'{size} points: '
+              'sqrt {:.3f}s, hypot {:.3f}s, matrix {:.3f}s'.format(
+                timeit.timeit(lambda: [sqrt((x - other_x) * (x - other_x)
+                                            + (y - other_y) * (y - other_y))
+                                       for (x, y), (other_x, other_y)
+                                       in pairs],
+                              number=1),
+                timeit.timeit(lambda: [hypot(x - other_x, y - other_y)
+                                       for (x, y), (other_x, other_y)
+                                       in pairs],
+                              number=1),
+                timeit.timeit(lambda: DistanceMatrix(points),
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [10, 100, 300])
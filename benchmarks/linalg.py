@@ -0,0 +1,38 @@
+import random
+import sys
+import timeit
+from typing import List
+
+from symba.base import (Expression,
+                        sqrt)
+from symba.linalg import (det,
+                          rank,
+                          solve)
+
+
+def generate_matrix(size: int, seed: int = 0) -> List[List[Expression]]:
+    generator = random.Random(seed)
+    radicals = [sqrt(2), sqrt(3), sqrt(5)]
+    return [[generator.randint(-5, 5) * generator.choice(radicals)
+             + generator.randint(-5, 5)
+             for _ in range(size)]
+            for _ in range(size)]
+
+
+def main(sizes: List[int]) -> None:
+    for size in sizes:
+        matrix = generate_matrix(size)
+        vector = [1] * size
+        print(f'{size}x{size}: '
+              'det {:.3f}s, rank {:.3f}s, solve {:.3f}s'.format(
+                timeit.timeit(lambda: det(matrix),
+                              number=1),
+                timeit.timeit(lambda: rank(matrix),
+                              number=1),
+                timeit.timeit(lambda: solve(matrix, vector),
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [4, 6, 8, 10, 12])
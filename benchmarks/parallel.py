@@ -0,0 +1,38 @@
+import sys
+import timeit
+from operator import truediv
+
+from symba import parallel
+from symba.base import (Expression,
+                        sort,
+                        sqrt)
+
+
+def inverse(value: Expression) -> Expression:
+    return truediv(1, value)
+
+
+def main(size: int) -> None:
+    radicals = [sqrt(2), sqrt(3), sqrt(5), sqrt(7)]
+    expressions = [value * radicals[value % len(radicals)]
+                   + radicals[(value + 1) % len(radicals)]
+                   - radicals[(value + 2) % len(radicals)] + value
+                   for value in range(1, size + 1)]
+    print(f'{size} expressions')
+    for name, function, parallel_function in [
+        ('inverse', lambda: [inverse(value) for value in expressions],
+         lambda: parallel.map(inverse, expressions)),
+        ('sort', lambda: sort(expressions),
+         lambda: parallel.sort(expressions)),
+    ]:
+        print('{} sequential: {:.3f}s, parallel: {:.3f}s'.format(
+                name,
+                timeit.timeit(function,
+                              number=1),
+                timeit.timeit(parallel_function,
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,23 @@
+import sys
+import tempfile
+import time
+
+from symba.base import (parse_lines,
+                        sqrt)
+
+
+def main(size: int) -> None:
+    bases = [sqrt(2) + sqrt(3) - 1, sqrt(sqrt(2) + 1) - sqrt(5), 2 * sqrt(7)]
+    with tempfile.TemporaryFile('w+') as file:
+        for value in range(1, size + 1):
+            file.write(f'{bases[value % len(bases)] * value}\n')
+        file.seek(0)
+        start = time.perf_counter()
+        count = sum(1 for _ in parse_lines(file))
+        elapsed = time.perf_counter() - start
+    print(f'parsed {count} lines in {elapsed:.3f}s: '
+          f'{count / elapsed:.0f} expressions per second')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,25 @@
+import pickle
+import sys
+import timeit
+
+from symba.base import sqrt
+
+
+def main(size: int) -> None:
+    base = sqrt(sqrt(2) + 1) + sqrt(sqrt(3) + 2) + sqrt(5) + 1
+    expressions = [base * value for value in range(1, size + 1)]
+    payload = pickle.dumps(expressions)
+    print(f'{size} nested forms')
+    print(f'payload: {len(payload)} bytes')
+    print('dumps: {:.3f}s'.format(
+            timeit.timeit(lambda: pickle.dumps(expressions),
+                          number=10)
+    ))
+    print('loads: {:.3f}s'.format(
+            timeit.timeit(lambda: pickle.loads(payload),
+                          number=10)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
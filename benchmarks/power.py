@@ -0,0 +1,29 @@
+import sys
+import timeit
+from typing import List
+
+from symba.base import (Expression,
+                        sqrt)
+
+
+def main(exponents: List[int], generic_exponent_limit: int) -> None:
+    golden_ratio = (1 + sqrt(5)) / 2
+    for exponent in exponents:
+        specialized_time = timeit.timeit(lambda: golden_ratio ** exponent,
+                                         number=1)
+        generic_time = (
+            '{:.3f}s'.format(timeit.timeit(
+                    lambda: Expression.__pow__(golden_ratio, exponent),
+                    number=1
+            ))
+            if exponent <= generic_exponent_limit
+            else 'skipped'
+        )
+        print(f'exponent {exponent}: '
+              f'lucas {specialized_time:.3f}s, generic {generic_time}')
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]]
+         or [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+         10 ** 4)
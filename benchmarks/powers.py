@@ -0,0 +1,28 @@
+import sys
+import timeit
+
+from symba.base import (pow_many,
+                        sqrt)
+
+
+def main(exponent: int) -> None:
+    base = sqrt(2) + sqrt(3) + 1
+    exponents = list(range(exponent + 1))
+    print(f'powers of {base} up to {exponent}')
+    print('pow: {:.3f}s'.format(
+            timeit.timeit(lambda: [base ** exponent
+                                   for exponent in exponents],
+                          number=1)
+    ))
+    print('powers: {:.3f}s'.format(
+            timeit.timeit(lambda: list(base.powers(exponent)),
+                          number=1)
+    ))
+    print('pow_many: {:.3f}s'.format(
+            timeit.timeit(lambda: pow_many(base, exponents),
+                          number=1)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,65 @@
+import random
+import sys
+import timeit
+from typing import (List,
+                    Tuple)
+
+from symba.base import (Expression,
+                        sqrt)
+from symba.geometry import (orientation,
+                            predicates_statistics)
+
+Point = Tuple[Expression, Expression]
+
+
+def generate_points(count: int, seed: int = 0) -> List[Point]:
+    # points of small integer grid rotated by 30 degrees,
+    # so there are many collinear triplets
+    generator = random.Random(seed)
+    cosine, sine = sqrt(3) / 2, sqrt(1) / 2
+    result = []
+    for _ in range(count):
+        x, y = generator.randint(-10, 10), generator.randint(-10, 10)
+        result.append((x * cosine - y * sine, x * sine + y * cosine))
+    return result
+
+
+def generate_triplets(points: List[Point],
+                      count: int,
+                      seed: int = 0) -> List[Tuple[Point, Point, Point]]:
+    generator = random.Random(seed)
+    return [(generator.choice(points), generator.choice(points),
+             generator.choice(points))
+            for _ in range(count)]
+
+
+def to_naive_orientation(vertex: Point,
+                         first_ray_point: Point,
+                         second_ray_point: Point) -> int:
+    vertex_x, vertex_y = vertex
+    first_x, first_y = first_ray_point
+    second_x, second_y = second_ray_point
+    determinant = ((first_x - vertex_x) * (second_y - vertex_y)
+                   - (first_y - vertex_y) * (second_x - vertex_x))
+    return (determinant > 0) - (determinant < 0)
+
+
+def main(count: int) -> None:
+    points = generate_points(count // 10)
+    triplets = generate_triplets(points, count)
+    print(f'{len(triplets)} orientations of {len(points)} points')
+    print('naive: {:.3f}s'.format(
+            timeit.timeit(lambda: [to_naive_orientation(*triplet)
+                                   for triplet in triplets],
+                          number=1)
+    ))
+    print('filtered: {:.3f}s'.format(
+            timeit.timeit(lambda: [orientation(*triplet)
+                                   for triplet in triplets],
+                          number=1)
+    ))
+    print(f'exact fallbacks ratio: {predicates_statistics.exact_ratio:.3f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
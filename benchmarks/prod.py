@@ -0,0 +1,36 @@
+import random
+import sys
+import timeit
+from functools import reduce
+from operator import mul
+from typing import List
+
+from symba.base import (Expression,
+                        prod,
+                        sqrt)
+
+
+def generate_forms(count: int, seed: int = 0) -> List[Expression]:
+    generator = random.Random(seed)
+    return [sqrt(generator.choice((2, 3, 5, 7))) + generator.randint(1, 10)
+            for _ in range(count)]
+
+
+def main(counts: List[int]) -> None:
+    for count in counts:
+        forms = generate_forms(count)
+        print(f'product of {count} forms')
+        print('reduce: {:.3f}s'.format(
+                timeit.timeit(lambda: reduce(mul, forms),
+                              number=1)
+        ))
+        print('prod: {:.3f}s'.format(timeit.timeit(lambda: prod(forms),
+                                                   number=1)))
+        print('prod (streaming): {:.3f}s'.format(
+                timeit.timeit(lambda: prod(iter(forms)),
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [64, 256])
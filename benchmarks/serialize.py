@@ -0,0 +1,38 @@
+import pickle
+import sys
+import timeit
+
+from symba.base import sqrt
+from symba.serialize import (dumps,
+                             loads)
+
+
+def main(size: int) -> None:
+    radicals = [sqrt(2), sqrt(3), sqrt(5), sqrt(sqrt(2) + 1)]
+    expressions = [value * radicals[value % len(radicals)]
+                   + radicals[(value + 1) % len(radicals)] + value
+                   for value in range(1, size + 1)]
+    pickled, serialized = pickle.dumps(expressions), dumps(expressions)
+    print(f'{size} expressions with shared radicands')
+    print(f'pickle payload: {len(pickled)} bytes')
+    print(f'serialize payload: {len(serialized)} bytes')
+    print('pickle dumps: {:.3f}s'.format(
+            timeit.timeit(lambda: pickle.dumps(expressions),
+                          number=1)
+    ))
+    print('serialize dumps: {:.3f}s'.format(
+            timeit.timeit(lambda: dumps(expressions),
+                          number=1)
+    ))
+    print('pickle loads: {:.3f}s'.format(
+            timeit.timeit(lambda: pickle.loads(pickled),
+                          number=1)
+    ))
+    print('serialize loads: {:.3f}s'.format(
+            timeit.timeit(lambda: loads(serialized),
+                          number=1)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,34 @@
+import sys
+import timeit
+
+from symba.base import (bounds,
+                        signs,
+                        sqrt)
+
+
+def main(size: int) -> None:
+    radicals = [sqrt(2), sqrt(3), sqrt(5), sqrt(sqrt(2) + 1)]
+    expressions = [value * radicals[value % len(radicals)]
+                   - (value + 1) * radicals[(value + 1) % len(radicals)]
+                   + value
+                   for value in range(1, size + 1)]
+    print(f'{size} expressions')
+    for name, function, batch_function in [
+        ('signs', lambda: [(value > 0) - (value < 0)
+                           for value in expressions],
+         lambda: signs(expressions)),
+        ('bounds', lambda: [(value.lower_bound(), value.upper_bound())
+                            for value in expressions],
+         lambda: bounds(expressions)),
+    ]:
+        print('{} expressions: {:.3f}s, batch: {:.3f}s'.format(
+                name,
+                timeit.timeit(function,
+                              number=1),
+                timeit.timeit(batch_function,
+                              number=1)
+        ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,31 @@
+import random
+import sys
+import timeit
+from typing import List
+
+from symba.base import (sqrt,
+                        sqrt_many)
+
+
+def generate_arguments(count: int, seed: int = 0) -> List[int]:
+    generator = random.Random(seed)
+    squares = [value * value for value in range(1, 100)]
+    return [generator.choice(squares) * generator.randint(1, count // 10 + 1)
+            for _ in range(count)]
+
+
+def main(count: int) -> None:
+    arguments = generate_arguments(count)
+    print(f'{count} arguments, {len(set(arguments))} distinct')
+    print('sqrt: {:.3f}s'.format(
+            timeit.timeit(lambda: [sqrt(argument) for argument in arguments],
+                          number=1)
+    ))
+    print('sqrt_many: {:.3f}s'.format(
+            timeit.timeit(lambda: sqrt_many(arguments),
+                          number=1)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
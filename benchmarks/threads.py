@@ -0,0 +1,38 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from symba.base import (Expression,
+                        sqrt)
+
+
+def compute(expressions: List[Expression]) -> List[bool]:
+    return [(left + right) * (left - right) < left * right
+            for left, right in zip(expressions, expressions[1:])]
+
+
+def main(size: int) -> None:
+    expressions = [sqrt(value) + sqrt(value + 1) - value
+                   for value in range(2, size + 2)]
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{size} expressions per thread, '
+          f'GIL is {"enabled" if is_gil_enabled else "disabled"}')
+    expected = compute(expressions)
+    base_throughput = None
+    for threads_count in (1, 2, 4, 8):
+        with ThreadPoolExecutor(threads_count) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(compute,
+                                        [expressions] * threads_count))
+            elapsed = time.perf_counter() - start
+        assert all(result == expected for result in results)
+        throughput = threads_count * size / elapsed
+        if base_throughput is None:
+            base_throughput = throughput
+        print(f'{threads_count} threads: {throughput:.0f} expressions/s, '
+              f'scaling: {throughput / base_throughput:.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,29 @@
+import sys
+import timeit
+
+from symba.base import (sqrt,
+                        to_numpy)
+
+
+def main(size: int) -> None:
+    bases = [sqrt(2) + sqrt(3) - 1, sqrt(sqrt(2) + 1) - sqrt(5), 2 * sqrt(7)]
+    expressions = [bases[value % len(bases)] * value
+                   for value in range(1, size + 1)]
+    print(f'{size} expressions')
+    print('float: {:.3f}s'.format(
+            timeit.timeit(lambda: list(map(float, expressions)),
+                          number=1)
+    ))
+    print('to_numpy: {:.3f}s'.format(
+            timeit.timeit(lambda: to_numpy(expressions),
+                          number=1)
+    ))
+    print('to_numpy with errors: {:.3f}s'.format(
+            timeit.timeit(lambda: to_numpy(expressions,
+                                           with_errors=True),
+                          number=1)
+    ))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
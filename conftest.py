@@ -0,0 +1,7 @@
+from importlib.util import find_spec
+
+# doctests of modules with optional dependencies
+# are run only if the dependencies are installed
+collect_ignore = ([]
+                  if find_spec('numpy') is not None
+                  else ['symba/core/vectorized.py'])
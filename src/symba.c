@@ -136,4 +136,14 @@ static PyModuleDef _symba_module = {
     .m_size = -1,
 };
 
-PyMODINIT_FUNC PyInit__symba(void) { return PyModule_Create(&_symba_module); }
+PyMODINIT_FUNC PyInit__symba(void) {
+  PyObject* result = PyModule_Create(&_symba_module);
+#ifdef Py_GIL_DISABLED
+  /* module has no mutable state, so it is safe to run without the GIL */
+  if (result && PyUnstable_Module_SetGIL(result, Py_MOD_GIL_NOT_USED)) {
+    Py_DECREF(result);
+    return NULL;
+  }
+#endif
+  return result;
+}
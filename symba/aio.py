@@ -0,0 +1,174 @@
+import asyncio as _asyncio
+from concurrent.futures import Executor as _Executor
+from typing import (Any as _Any,
+                    Callable as _Callable,
+                    Iterable as _Iterable,
+                    List as _List,
+                    Optional as _Optional,
+                    TypeVar as _TypeVar,
+                    Union as _Union)
+
+from cfractions import Fraction as _Fraction
+
+from .core.budget import (Budget as _Budget,
+                          budget as _budget)
+from .core.expression import Expression as _Expression
+from .core.form import Form as _Form
+from .core.hints import RawConstant as _RawConstant
+from .core.ordering import sort as _sort
+from .core.term import Term as _Term
+
+INLINE_COST_THRESHOLD = 16
+
+_T = _TypeVar('_T', _RawConstant, _Expression)
+_Result = _TypeVar('_Result')
+
+
+async def compare(left: _Union[_RawConstant, _Expression],
+                  right: _Union[_RawConstant, _Expression],
+                  *,
+                  executor: _Optional[_Executor] = None) -> int:
+    """
+    Returns sign of the difference between the values:
+    ``-1`` if the left one is less than the right one,
+    ``1`` if it is greater and ``0`` if they are equal.
+
+    Expensive comparisons are offloaded to the executor
+    (the default one of the running loop if not specified),
+    cheap ones are performed inline.
+
+    >>> import asyncio
+    >>> from symba.base import sqrt
+    >>> asyncio.run(compare(sqrt(2) + sqrt(3), sqrt(10)))
+    -1
+    """
+    return await _run(_compare, left, right,
+                      executor=executor)
+
+
+async def divide(dividend: _Union[_RawConstant, _Expression],
+                 divisor: _Union[_RawConstant, _Expression],
+                 *,
+                 executor: _Optional[_Executor] = None
+                 ) -> _Union[_RawConstant, _Expression]:
+    """
+    Returns quotient of the values,
+    offloading the rest is the same as for ``compare``.
+
+    >>> import asyncio
+    >>> from symba.base import sqrt
+    >>> asyncio.run(divide(1, sqrt(2) + 1)) == sqrt(2) - 1
+    True
+    """
+    return await _run(_divide, dividend, divisor,
+                      executor=executor)
+
+
+async def inverse(value: _Union[_RawConstant, _Expression],
+                  *,
+                  executor: _Optional[_Executor] = None
+                  ) -> _Union[_RawConstant, _Expression]:
+    """
+    Returns multiplicative inverse of the value,
+    offloading the rest is the same as for ``compare``.
+
+    >>> import asyncio
+    >>> from symba.base import sqrt
+    >>> asyncio.run(inverse(sqrt(2) + 1)) == sqrt(2) - 1
+    True
+    """
+    return await _run(_divide, 1, value,
+                      executor=executor)
+
+
+async def round_(value: _Union[_RawConstant, _Expression],
+                 precision: _Optional[int] = None,
+                 *,
+                 executor: _Optional[_Executor] = None
+                 ) -> _Union[int, _Fraction]:
+    """
+    Returns the value rounded to the given count of decimal digits,
+    offloading the rest is the same as for ``compare``.
+
+    >>> import asyncio
+    >>> from symba.base import sqrt
+    >>> asyncio.run(round_(sqrt(2), 3))
+    Fraction(707, 500)
+    """
+    return await _run(_round, value, precision,
+                      executor=executor)
+
+
+async def sort(values: _Iterable[_T],
+               *,
+               executor: _Optional[_Executor] = None,
+               reverse: bool = False) -> _List[_T]:
+    """
+    Returns values sorted stably in ascending (or descending) order,
+    offloading the rest is the same as for ``compare``.
+
+    >>> import asyncio
+    >>> from symba.base import sqrt
+    >>> asyncio.run(sort([sqrt(3), 1, sqrt(2)])) == [1, sqrt(2), sqrt(3)]
+    True
+    """
+    return await _run(_sort_values, list(values), reverse,
+                      executor=executor)
+
+
+def _compare(left: _Any, right: _Any) -> int:
+    return -1 if left < right else (1 if left > right else 0)
+
+
+def _divide(dividend: _Any, divisor: _Any) -> _Any:
+    return dividend / divisor
+
+
+def _estimate_cost(value: _Any) -> int:
+    # operations on forms (e.g. rationalization of denominators)
+    # take time exponential in their terms counts
+    return ((1 << len(value.terms))
+            + sum(_estimate_cost(term) for term in value.terms)
+            if isinstance(value, _Form)
+            else (_estimate_cost(value.argument) + 1
+                  if isinstance(value, _Term)
+                  else (sum(_estimate_cost(element) for element in value)
+                        if isinstance(value, list)
+                        else 0)))
+
+
+def _round(value: _Any, precision: _Optional[int]) -> _Any:
+    return value.__round__(precision)
+
+
+async def _run(function: _Callable[..., _Result],
+               *arguments: _Any,
+               executor: _Optional[_Executor]) -> _Result:
+    if sum(map(_estimate_cost, arguments)) <= INLINE_COST_THRESHOLD:
+        return function(*arguments)
+    # computation spends its own budget nested in the current one,
+    # so it is stopped on cancellation even if already running
+    budget = _Budget(None, None, _budget.get())
+    future = _asyncio.get_running_loop().run_in_executor(
+            executor, _run_with_budget, budget, function, *arguments
+    )
+    try:
+        return await future
+    except _asyncio.CancelledError:
+        budget.cancel()
+        raise
+
+
+def _run_with_budget(budget: _Budget,
+                     function: _Callable[..., _Result],
+                     *arguments: _Any) -> _Result:
+    token = _budget.set(budget)
+    try:
+        return function(*arguments)
+    finally:
+        _budget.reset(token)
+
+
+def _sort_values(values: _List[_T], reverse: bool) -> _List[_T]:
+    return _sort(values,
+                 reverse=reverse)
@@ -1,13 +1,181 @@
-from typing import Union as _Union
+import math as _math
+from contextlib import contextmanager as _contextmanager
+from typing import (Callable as _Callable,
+                    Dict as _Dict,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Union as _Union)
 
-from .core import expression as _expression
+from .core import (arrays as _arrays,
+                   batch as _batch,
+                   budget as _budget,
+                   expression as _expression,
+                   form as _form,
+                   ordering as _ordering,
+                   parsing as _parsing,
+                   products as _products,
+                   vectorized as _vectorized)
 from .core.constant import (ONE as _ONE,
+                            FiniteNonZero as _FiniteNonZero,
                             Infinite as _Infinite,
                             try_to_constant as _try_to_constant)
+from .core.context import sqrt_evaluator as _sqrt_evaluator
 from .core.hints import RawConstant as _RawConstant
 from .core.term import Term as _Term
+from .core.utils import perfect_sqrt as _perfect_sqrt
 
+BudgetExceeded = _budget.BudgetExceeded
 Expression = _expression.Expression
+ExpressionArray = _arrays.ExpressionArray
+FormBuilder = _form.FormBuilder
+SortKey = _ordering.SortKey
+bounds = _batch.bounds
+dot = _products.dot
+fma = _products.fma
+maximum = _ordering.maximum
+minimum = _ordering.minimum
+nlargest = _ordering.nlargest
+nsmallest = _ordering.nsmallest
+parse = _parsing.parse
+parse_lines = _parsing.parse_lines
+prod = _products.prod
+signs = _batch.signs
+sort = _ordering.sort
+sort_key = _ordering.sort_key
+to_numpy = _vectorized.to_numpy
+
+
+@_contextmanager
+def approximate(
+        evaluator: _Callable[[float], float] = _math.sqrt
+) -> _Iterator[None]:
+    """
+    Returns context manager within which square roots are approximated
+    by the given evaluator, when expressions are converted to floats
+    or ``approximate_sqrt`` is called.
+
+    Only these two entry points consult the context:
+    ``sqrt`` & arithmetic on expressions stay exact within it,
+    so cheap passes should compute with ``approximate_sqrt`` & floats.
+
+    >>> with approximate(float):
+    ...     approximation = float(sqrt(4) + sqrt(2))
+    >>> approximation == 4.0
+    True
+    >>> isinstance(sqrt(2), Expression)
+    True
+    """
+    token = _sqrt_evaluator.set(evaluator)
+    try:
+        yield
+    finally:
+        _sqrt_evaluator.reset(token)
+
+
+def approximate_sqrt(argument: _Union[_RawConstant, Expression]) -> float:
+    """
+    Returns square root of the argument approximated
+    by the evaluator of the innermost ``approximate`` context
+    (``math.sqrt`` by default).
+
+    >>> approximate_sqrt(4) == 2
+    True
+    >>> with approximate(float):
+    ...     approximate_sqrt(4) == 4
+    True
+    """
+    if argument < 0:
+        raise ValueError('Argument should be non-negative.')
+    return _sqrt_evaluator.get()(float(argument))
+
+
+@_contextmanager
+def budget(*,
+           operations: _Optional[int] = None,
+           seconds: _Optional[float] = None) -> _Iterator[None]:
+    """
+    Returns context manager within which heavy computations
+    (e.g. inversion of forms with many terms, merging of terms
+    & refinement of bounds) raise ``BudgetExceeded``
+    after the given count of their steps or the given time,
+    budgets of nested contexts are spent along with enclosing ones.
+
+    >>> with budget(operations=3):
+    ...     inverse = 1 / (sqrt(2) + sqrt(3) + 1)
+    Traceback (most recent call last):
+      ...
+    symba.core.budget.BudgetExceeded: Operations budget is exceeded.
+    >>> with budget(operations=100, seconds=60):
+    ...     inverse = 1 / (sqrt(2) + sqrt(3) + 1)
+    >>> inverse * (sqrt(2) + sqrt(3) + 1) == 1
+    True
+    """
+    if operations is not None and operations < 0:
+        raise ValueError('Operations count should be non-negative.')
+    elif seconds is not None and seconds < 0:
+        raise ValueError('Seconds count should be non-negative.')
+    token = _budget.budget.set(
+            _budget.Budget(operations, seconds, _budget.budget.get())
+    )
+    try:
+        yield
+    finally:
+        _budget.budget.reset(token)
+
+
+def fsum(values: _Iterable[_Union[_RawConstant, Expression]]) -> Expression:
+    """
+    Returns exact sum of the values
+    accumulated in place without intermediate expressions.
+
+    >>> fsum([sqrt(2), 1, sqrt(8)]) == 1 + 3 * sqrt(2)
+    True
+    >>> fsum([]) == 0
+    True
+    """
+    return FormBuilder(values).build()
+
+
+def pow_many(base: _Union[_RawConstant, Expression],
+             exponents: _Iterable[int]) -> _List[Expression]:
+    """
+    Returns powers of the base with given exponents,
+    repeated squarings of the base are shared between exponents
+    and each distinct exponent is processed once.
+
+    >>> pow_many(sqrt(2) + 1, [2, 3, -1]) == [3 + 2 * sqrt(2),
+    ...                                       7 + 5 * sqrt(2),
+    ...                                       sqrt(2) - 1]
+    True
+    """
+    expression = _try_to_constant(base)
+    if not isinstance(expression, Expression):
+        raise TypeError('Base is not convertible to expression: '
+                        f'{base}.')
+    cache: _Dict[int, Expression] = {}
+    squarings: _List[Expression] = [expression]
+    inverse_squarings: _List[Expression] = []
+    result: _List[Expression] = []
+    for exponent in exponents:
+        try:
+            power = cache[exponent]
+        except KeyError:
+            if exponent < 0 and not inverse_squarings:
+                inverse_squarings.append(expression.inverse())
+            steps = squarings if exponent >= 0 else inverse_squarings
+            power, exponent_rest, index = _ONE, abs(exponent), 0
+            while exponent_rest:
+                if index == len(steps):
+                    steps.append(steps[-1].square())
+                if exponent_rest & 1:
+                    power = power * steps[index]
+                exponent_rest >>= 1
+                index += 1
+            cache[exponent] = power
+        result.append(power)
+    return result
 
 
 def sqrt(argument: _Union[_RawConstant, Expression]) -> Expression:
@@ -36,3 +204,57 @@ def sqrt(argument: _Union[_RawConstant, Expression]) -> Expression:
     return (expression
             if isinstance(expression, _Infinite)
             else _Term.from_components(_ONE, expression))
+
+
+def sqrt_many(
+        arguments: _Iterable[_Union[_RawConstant, Expression]]
+) -> _List[Expression]:
+    """
+    Returns square roots of the arguments,
+    each distinct argument is processed once
+    and roots of rational arguments with equal radicands
+    share their arguments.
+
+    >>> from cfractions import Fraction
+    >>> (sqrt_many([2, 8, Fraction(1, 2), 2, 9])
+    ...  == [sqrt(2), sqrt(8), sqrt(Fraction(1, 2)), sqrt(2), 3])
+    True
+    """
+    cache: _Dict[_Union[_RawConstant, Expression], Expression] = {}
+    radicands: _Dict[int, _FiniteNonZero] = {}
+    result: _List[Expression] = []
+    for argument in arguments:
+        try:
+            root = cache[argument]
+        except KeyError:
+            if argument < 0:
+                raise ValueError('Argument should be non-negative.')
+            expression = (argument
+                          if isinstance(argument, Expression)
+                          else _try_to_constant(argument))
+            if not isinstance(expression, Expression):
+                raise TypeError('Argument is not convertible '
+                                f'to expression: {argument}.')
+            root = (_finite_non_zero_sqrt(expression, radicands)
+                    if isinstance(expression, _FiniteNonZero)
+                    else (expression
+                          if isinstance(expression, _Infinite)
+                          else _Term.from_components(_ONE, expression)))
+            cache[argument] = root
+        result.append(root)
+    return result
+
+
+def _finite_non_zero_sqrt(argument: _FiniteNonZero,
+                          radicands: _Dict[int, _FiniteNonZero]) -> Expression:
+    # gives the same shape as ``Term.from_components(ONE, argument)``
+    numerator, denominator = argument.raw.numerator, argument.raw.denominator
+    radicand = numerator * denominator
+    radicand_sqrt = _perfect_sqrt(radicand, 0)
+    if radicand_sqrt:
+        return _FiniteNonZero(radicand_sqrt) / denominator
+    try:
+        radicand_expression = radicands[radicand]
+    except KeyError:
+        radicand_expression = radicands[radicand] = _FiniteNonZero(radicand)
+    return _Term(_FiniteNonZero(denominator).inverse(), radicand_expression)
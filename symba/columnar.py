@@ -0,0 +1,233 @@
+import mmap as _mmap
+import struct as _struct
+import sys as _sys
+from array import array as _array
+from types import TracebackType as _TracebackType
+from typing import (BinaryIO as _BinaryIO,
+                    Dict as _Dict,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Tuple as _Tuple,
+                    Type as _Type)
+
+from cfractions import Fraction as _Fraction
+
+from .core.constant import FiniteNonZero as _FiniteNonZero
+from .core.expression import Expression as _Expression
+from .core.kernels import (to_components as _to_components,
+                           to_expression as _to_expression)
+
+MAGIC = b'SYMBACOL'
+VERSION = 1
+
+_HEADER = _struct.Struct('<8sHB5xQQQQ')
+_OVERFLOW_HEADER = _struct.Struct('<BQI')
+_ITEM_SIZE = 8
+_MIN_INT64, _MAX_INT64 = -(1 << 63), (1 << 63) - 1
+_OVERFLOW_SENTINEL = _MIN_INT64
+_NUMERATORS_COLUMN, _DENOMINATORS_COLUMN, _KERNELS_COLUMN = range(3)
+# kernel with zero identifier is reserved for rational tails
+_TAIL_KERNEL_ID = 0
+
+
+class ColumnarStore:
+    """
+    Represents read-only memory-mapped columnar store
+    of finite degree-1 expressions written by ``dump``.
+
+    Expressions are materialized only on access.
+
+    >>> import os, tempfile
+    >>> from symba.base import sqrt
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, 'values.bin')
+    ...     with open(path, 'wb') as file:
+    ...         dump([sqrt(2) + 1, 2 * sqrt(3), 10 ** 30 * sqrt(2)], file)
+    ...     with ColumnarStore(path) as store:
+    ...         (len(store), store[0] == sqrt(2) + 1,
+    ...          store[-1] == 10 ** 30 * sqrt(2))
+    (3, True, True)
+    """
+
+    def close(self) -> None:
+        """Releases the mapping of the store file."""
+        for column in (self._offsets, self._kernels_ids, self._numerators,
+                       self._denominators, self._kernels):
+            column.release()
+        self._mapping.close()
+
+    _denominators: memoryview
+    _kernels: memoryview
+    _kernels_cache: _Dict[int, _FiniteNonZero]
+    _kernels_ids: memoryview
+    _mapping: _mmap.mmap
+    _numerators: memoryview
+    _offsets: memoryview
+    _overflows: _Dict[_Tuple[int, int], int]
+
+    __slots__ = ('_denominators', '_kernels', '_kernels_cache',
+                 '_kernels_ids', '_mapping', '_numerators', '_offsets',
+                 '_overflows')
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as file:
+            mapping = _mmap.mmap(file.fileno(), 0,
+                                 access=_mmap.ACCESS_READ)
+        try:
+            (magic, version, byte_order, expressions_count, entries_count,
+             kernels_count, overflows_count) = _HEADER.unpack_from(mapping)
+        except _struct.error:
+            mapping.close()
+            raise ValueError('File is not a columnar store.') from None
+        if magic != MAGIC:
+            mapping.close()
+            raise ValueError('File is not a columnar store.')
+        elif version != VERSION:
+            mapping.close()
+            raise ValueError(f'Unsupported format version: {version}.')
+        elif byte_order != _to_byte_order_flag(_sys.byteorder):
+            mapping.close()
+            raise ValueError('File byte order differs from the native one.')
+        view = memoryview(mapping)
+        start = _HEADER.size
+        columns = []
+        for size in (expressions_count + 1, entries_count, entries_count,
+                     entries_count, kernels_count):
+            end = start + size * _ITEM_SIZE
+            columns.append(view[start:end].cast('q'))
+            start = end
+        view.release()
+        (self._offsets, self._kernels_ids, self._numerators,
+         self._denominators, self._kernels) = columns
+        self._overflows = _read_overflows(mapping, start, overflows_count)
+        self._mapping, self._kernels_cache = mapping, {}
+
+    def __enter__(self) -> 'ColumnarStore':
+        return self
+
+    def __exit__(self,
+                 exception_type: _Optional[_Type[BaseException]],
+                 exception: _Optional[BaseException],
+                 traceback: _Optional[_TracebackType]) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> _Expression:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('Index is out of range.')
+        terms_components = []
+        tail = _Fraction(0)
+        for entry_index in range(self._offsets[index],
+                                 self._offsets[index + 1]):
+            scale = _Fraction(
+                    self._to_value(self._numerators, _NUMERATORS_COLUMN,
+                                   entry_index),
+                    self._to_value(self._denominators, _DENOMINATORS_COLUMN,
+                                   entry_index)
+            )
+            kernel_id = self._kernels_ids[entry_index]
+            if kernel_id == _TAIL_KERNEL_ID:
+                tail = scale
+            else:
+                terms_components.append((self._to_kernel(kernel_id), scale))
+        return _to_expression(terms_components, tail)
+
+    def __iter__(self) -> _Iterator[_Expression]:
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _to_kernel(self, kernel_id: int) -> _FiniteNonZero:
+        try:
+            return self._kernels_cache[kernel_id]
+        except KeyError:
+            result = self._kernels_cache[kernel_id] = _FiniteNonZero(
+                    self._to_value(self._kernels, _KERNELS_COLUMN,
+                                   kernel_id - 1)
+            )
+            return result
+
+    def _to_value(self, column: memoryview, column_id: int,
+                  index: int) -> int:
+        result = column[index]
+        return (self._overflows[column_id, index]
+                if result == _OVERFLOW_SENTINEL
+                else result)
+
+
+def dump(expressions: _Iterable[_Expression], file: _BinaryIO) -> None:
+    """
+    Writes finite degree-1 expressions into the file in columnar format:
+    offsets of expressions entries, kernels identifiers of entries,
+    numerators & denominators of entries scales
+    and kernels (radicands) table
+    as native 64-bit integers,
+    followed by a side table of values which do not fit into them.
+    """
+    offsets, kernels_ids = _array('q', [0]), _array('q')
+    numerators, denominators, kernels = (_array('q'), _array('q'),
+                                         _array('q'))
+    overflows: _List[_Tuple[int, int, int]] = []
+    kernels_indices: _Dict[int, int] = {}
+    for expression in expressions:
+        terms_components, tail = _to_components(expression)
+        entries = [(kernels_indices.setdefault(radicand,
+                                               len(kernels_indices) + 1),
+                    radicand, scale)
+                   for radicand, scale in terms_components]
+        if tail:
+            entries.append((_TAIL_KERNEL_ID, 1, tail))
+        for kernel_id, radicand, scale in entries:
+            if kernel_id > len(kernels):
+                _append_value(kernels, _KERNELS_COLUMN, radicand, overflows)
+            kernels_ids.append(kernel_id)
+            _append_value(numerators, _NUMERATORS_COLUMN, scale.numerator,
+                          overflows)
+            _append_value(denominators, _DENOMINATORS_COLUMN,
+                          scale.denominator, overflows)
+        offsets.append(len(kernels_ids))
+    file.write(_HEADER.pack(MAGIC, VERSION,
+                            _to_byte_order_flag(_sys.byteorder),
+                            len(offsets) - 1, len(kernels_ids), len(kernels),
+                            len(overflows)))
+    for column in (offsets, kernels_ids, numerators, denominators, kernels):
+        file.write(column.tobytes())
+    for column_id, index, value in overflows:
+        value_bytes = value.to_bytes(value.bit_length() // 8 + 1, 'little',
+                                     signed=True)
+        file.write(_OVERFLOW_HEADER.pack(column_id, index, len(value_bytes)))
+        file.write(value_bytes)
+
+
+def _append_value(column: '_array[int]',
+                  column_id: int,
+                  value: int,
+                  overflows: _List[_Tuple[int, int, int]]) -> None:
+    if _MIN_INT64 < value <= _MAX_INT64:
+        column.append(value)
+    else:
+        overflows.append((column_id, len(column), value))
+        column.append(_OVERFLOW_SENTINEL)
+
+
+def _read_overflows(mapping: _mmap.mmap,
+                    start: int,
+                    count: int) -> _Dict[_Tuple[int, int], int]:
+    result = {}
+    for _ in range(count):
+        column_id, index, size = _OVERFLOW_HEADER.unpack_from(mapping, start)
+        start += _OVERFLOW_HEADER.size
+        result[column_id, index] = int.from_bytes(mapping[start:start + size],
+                                                  'little',
+                                                  signed=True)
+        start += size
+    return result
+
+
+def _to_byte_order_flag(byte_order: str) -> int:
+    return int(byte_order == 'big')
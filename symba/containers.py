@@ -0,0 +1,250 @@
+import bisect as _bisect
+import heapq as _heapq
+from typing import (Any as _Any,
+                    Generic as _Generic,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Tuple as _Tuple,
+                    TypeVar as _TypeVar,
+                    Union as _Union,
+                    overload as _overload)
+
+from reprit.base import generate_repr as _generate_repr
+
+from .core.constant import try_to_constant as _try_to_constant
+from .core.expression import Expression as _Expression
+from .core.hints import RawConstant as _RawConstant
+from .core.ordering import SortKey as _SortKey
+
+_T = _TypeVar('_T')
+
+
+class ResolutionStatistics:
+    """
+    Represents counters of comparisons resolved
+    by interval enclosures and by exact arithmetic.
+    """
+
+    @property
+    def exact_ratio(self) -> float:
+        """Returns ratio of comparisons resolved by exact arithmetic."""
+        total = self.exact + self.interval
+        return self.exact / total if total else 0.
+
+    exact: int
+    interval: int
+
+    __slots__ = 'exact', 'interval'
+
+    def __init__(self, exact: int = 0, interval: int = 0) -> None:
+        self.exact, self.interval = exact, interval
+
+    __repr__ = _generate_repr(__init__)
+
+
+class _Key(_SortKey):
+    statistics: ResolutionStatistics
+
+    __slots__ = 'statistics',
+
+    def __init__(self,
+                 value: _Union[_RawConstant, _Expression],
+                 statistics: ResolutionStatistics) -> None:
+        expression = _try_to_constant(value)
+        if not isinstance(expression, _Expression):
+            raise TypeError('Value is not convertible to expression: '
+                            f'{value}.')
+        super().__init__(expression)
+        self.statistics = statistics
+
+    def __lt__(self, other: _SortKey) -> bool:
+        if self.upper_bound < other.lower_bound:
+            self.statistics.interval += 1
+            return True
+        elif other.upper_bound <= self.lower_bound:
+            self.statistics.interval += 1
+            return False
+        self.statistics.exact += 1
+        return self.expression < other.expression
+
+
+class Heap(_Generic[_T]):
+    """
+    Represents min-heap of items prioritized by expressions.
+
+    >>> from symba.base import sqrt
+    >>> heap = Heap([(sqrt(3), 'c'), (1, 'a')])
+    >>> heap.push(sqrt(2), 'b')
+    >>> [heap.pop()[1] for _ in range(len(heap))]
+    ['a', 'b', 'c']
+    """
+
+    @property
+    def statistics(self) -> ResolutionStatistics:
+        """Returns statistics of ordering resolution."""
+        return self._statistics
+
+    def peek(self) -> _Tuple[_Expression, _Optional[_T]]:
+        """Returns the least prioritized item without removing it."""
+        try:
+            key, item = self._entries[0]
+        except IndexError:
+            raise IndexError('Heap is empty.') from None
+        return key.expression, item
+
+    def pop(self) -> _Tuple[_Expression, _Optional[_T]]:
+        """Removes and returns the least prioritized item."""
+        try:
+            key, item = _heapq.heappop(self._entries)
+        except IndexError:
+            raise IndexError('Heap is empty.') from None
+        return key.expression, item
+
+    def push(self,
+             priority: _Union[_RawConstant, _Expression],
+             item: _Optional[_T] = None) -> None:
+        """Adds the item with the given priority."""
+        _heapq.heappush(self._entries,
+                        (_Key(priority, self._statistics), item))
+
+    def pushpop(self,
+                priority: _Union[_RawConstant, _Expression],
+                item: _Optional[_T] = None
+                ) -> _Tuple[_Expression, _Optional[_T]]:
+        """
+        Adds the item with the given priority,
+        then removes and returns the least prioritized item.
+        """
+        key, item = _heapq.heappushpop(
+                self._entries, (_Key(priority, self._statistics), item)
+        )
+        return key.expression, item
+
+    _entries: _List[_Tuple[_Key, _Optional[_T]]]
+    _statistics: ResolutionStatistics
+
+    __slots__ = '_entries', '_statistics'
+
+    def __init__(self,
+                 items: _Iterable[_Tuple[_Union[_RawConstant, _Expression],
+                                         _Optional[_T]]] = ()) -> None:
+        self._statistics = statistics = ResolutionStatistics()
+        self._entries = [(_Key(priority, statistics), item)
+                         for priority, item in items]
+        _heapq.heapify(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__qualname__,
+                                 [(key.expression, item)
+                                  for key, item in self._entries])
+
+
+class SortedList:
+    """
+    Represents list of expressions kept in ascending order.
+
+    >>> from symba.base import sqrt
+    >>> values = SortedList([sqrt(3), 1])
+    >>> values.add(sqrt(2))
+    >>> list(values) == [1, sqrt(2), sqrt(3)]
+    True
+    >>> values.bisect_left(sqrt(2))
+    1
+    """
+
+    @property
+    def statistics(self) -> ResolutionStatistics:
+        """Returns statistics of ordering resolution."""
+        return self._statistics
+
+    def add(self, value: _Union[_RawConstant, _Expression]) -> None:
+        """Inserts the value keeping the order."""
+        _bisect.insort_right(self._keys, self._to_key(value))
+
+    def bisect_left(self, value: _Union[_RawConstant, _Expression]) -> int:
+        """
+        Returns index to insert the value at
+        before any equal expressions.
+        """
+        return _bisect.bisect_left(self._keys, self._to_key(value))
+
+    def bisect_right(self, value: _Union[_RawConstant, _Expression]) -> int:
+        """
+        Returns index to insert the value at
+        after any equal expressions.
+        """
+        return _bisect.bisect_right(self._keys, self._to_key(value))
+
+    def index(self, value: _Union[_RawConstant, _Expression]) -> int:
+        """Returns index of the first expression equal to the value."""
+        key = self._to_key(value)
+        index = _bisect.bisect_left(self._keys, key)
+        if (index == len(self._keys)
+                or key < self._keys[index]):
+            raise ValueError(f'{value!r} is not in list.')
+        return index
+
+    def pop(self, index: int = -1) -> _Expression:
+        """Removes and returns the expression at the given index."""
+        return self._keys.pop(index).expression
+
+    def remove(self, value: _Union[_RawConstant, _Expression]) -> None:
+        """Removes the first expression equal to the value."""
+        del self._keys[self.index(value)]
+
+    _keys: _List[_Key]
+    _statistics: ResolutionStatistics
+
+    __slots__ = '_keys', '_statistics'
+
+    def __init__(self,
+                 values: _Iterable[_Union[_RawConstant, _Expression]] = ()
+                 ) -> None:
+        self._statistics = statistics = ResolutionStatistics()
+        self._keys = sorted([_Key(value, statistics) for value in values])
+
+    def __contains__(self, value: _Any) -> bool:
+        try:
+            self.index(value)
+        except (TypeError, ValueError):
+            return False
+        else:
+            return True
+
+    @_overload
+    def __getitem__(self, item: int) -> _Expression:
+        ...
+
+    @_overload
+    def __getitem__(self, item: slice) -> _List[_Expression]:
+        ...
+
+    def __getitem__(
+            self, item: _Union[int, slice]
+    ) -> _Union[_Expression, _List[_Expression]]:
+        return (self._keys[item].expression
+                if isinstance(item, int)
+                else [key.expression for key in self._keys[item]])
+
+    def __iter__(self) -> _Iterator[_Expression]:
+        return (key.expression for key in self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__qualname__, list(self))
+
+    def __reversed__(self) -> _Iterator[_Expression]:
+        return (key.expression for key in reversed(self._keys))
+
+    def _to_key(self, value: _Union[_RawConstant, _Expression]) -> _Key:
+        return _Key(value, self._statistics)
@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union,
+                    cast,
+                    overload)
+
+from cfractions import Fraction
+
+from .budget import spend
+from .constant import (FiniteNonZero,
+                       Zero,
+                       try_to_constant)
+from .expression import Expression
+from .hints import RawConstant
+from .kernels import (to_components,
+                      to_expression)
+from .utils import (SQUARE_FREE_LIMIT,
+                    split_square_factor,
+                    sqrt_floor)
+
+Row = List[Tuple[int, Fraction]]
+# kernel with zero identifier represents rational unit
+_UNIT_KERNEL_ID = 0
+_INITIAL_BOUNDS_BITS = 64
+
+
+class KernelTable:
+    """
+    Represents table of radicands (kernels)
+    with pairwise distinct square classes,
+    so square roots of its entries are linearly independent over rationals.
+    """
+
+    def bounds(self, bits: int) -> List[Tuple[int, int]]:
+        """
+        Returns bounds of kernels square roots
+        scaled by ``2 ** bits`` and rounded outwards.
+        """
+        result = self._bounds.get(bits, [])
+        if len(result) < len(self.kernels):
+            with self._lock:
+                result = self._bounds.get(bits, [])
+                # published lists are never mutated,
+                # so concurrent readers see consistent bounds
+                result = self._bounds[bits] = result + [
+                    _to_kernel_bounds(kernel, bits)
+                    for kernel in self.kernels[len(result):]
+                ]
+        return result
+
+    def multiply(self, left_id: int, right_id: int) -> Tuple[int, Fraction]:
+        """
+        Returns identifier of the kernel with scale
+        which product of square roots of the kernels equals to.
+        """
+        if left_id == _UNIT_KERNEL_ID:
+            return right_id, _ONE_SCALE
+        elif right_id == _UNIT_KERNEL_ID:
+            return left_id, _ONE_SCALE
+        key = (left_id, right_id) if left_id < right_id else (right_id,
+                                                               left_id)
+        try:
+            return self._products[key]
+        except KeyError:
+            left, right = self.kernels[left_id], self.kernels[right_id]
+            # ``sqrt(left * right) == gcd * sqrt(left * right / gcd ** 2)``
+            gcd = math.gcd(left, right)
+            product = (left // gcd) * (right // gcd)
+            with self._lock:
+                # product of coprime square-free kernels is square-free
+                kernel_id, scale = (
+                    (self._register_kernel(product, True)
+                     if (left in self._square_free_ids
+                         and right in self._square_free_ids)
+                     else self._register(product))
+                )
+            # concurrent computations of the same product agree,
+            # so the entry can be published without locking
+            result = self._products[key] = kernel_id, scale * gcd
+            return result
+
+    def register(self, radicand: int) -> Tuple[int, Fraction]:
+        """
+        Returns identifier of the kernel with scale
+        which square root of the positive radicand equals to.
+        """
+        try:
+            return self._radicands[radicand]
+        except KeyError:
+            pass
+        with self._lock:
+            # the radicand could be registered by another thread
+            # while the lock was being acquired
+            try:
+                return self._radicands[radicand]
+            except KeyError:
+                result = self._radicands[radicand] = self._register(
+                        radicand
+                )
+                return result
+
+    constants: List[FiniteNonZero]
+    kernels: List[int]
+    _bounds: Dict[int, List[Tuple[int, int]]]
+    _lock: threading.Lock
+    _indefinite_ids: List[int]
+    _products: Dict[Tuple[int, int], Tuple[int, Fraction]]
+    _radicands: Dict[int, Tuple[int, Fraction]]
+    _square_free_ids: Dict[int, int]
+
+    __slots__ = ('constants', 'kernels', '_bounds', '_indefinite_ids',
+                 '_lock', '_products', '_radicands', '_square_free_ids')
+
+    def __init__(self) -> None:
+        self.constants, self.kernels = [FiniteNonZero(1)], [1]
+        self._bounds, self._products, self._radicands = {}, {}, {}
+        self._indefinite_ids, self._square_free_ids = [], {1: _UNIT_KERNEL_ID}
+        self._lock = threading.Lock()
+
+    def _register(self, radicand: int) -> Tuple[int, Fraction]:
+        factor, kernel = split_square_factor(radicand)
+        if kernel == 1:
+            return _UNIT_KERNEL_ID, Fraction(factor)
+        kernel_id, scale = self._register_kernel(kernel,
+                                                 kernel < SQUARE_FREE_LIMIT)
+        return kernel_id, scale * factor
+
+    def _register_kernel(self,
+                         kernel: int,
+                         is_square_free: bool) -> Tuple[int, Fraction]:
+        try:
+            return self._square_free_ids[kernel], _ONE_SCALE
+        except KeyError:
+            pass
+        # square-free kernels are identified by their values,
+        # so only kernels not known to be square-free
+        # can share the square class with them
+        for kernel_id in (self._indefinite_ids
+                          if is_square_free
+                          else range(1, len(self.kernels))):
+            candidate = self.kernels[kernel_id]
+            product = kernel * candidate
+            product_sqrt = sqrt_floor(product)
+            if product_sqrt * product_sqrt == product:
+                # ``sqrt(kernel) == sqrt(product) / candidate
+                #                   * sqrt(candidate)``
+                return kernel_id, Fraction(product_sqrt, candidate)
+        # constant is published before the kernel,
+        # so readers never see kernel without its constant
+        self.constants.append(FiniteNonZero(kernel))
+        self.kernels.append(kernel)
+        kernel_id = len(self.kernels) - 1
+        if is_square_free:
+            self._square_free_ids[kernel] = kernel_id
+        else:
+            self._indefinite_ids.append(kernel_id)
+        return kernel_id, _ONE_SCALE
+
+
+class ExpressionArray:
+    """
+    Represents array of finite degree-1 expressions
+    stored in compressed sparse rows over the shared table of kernels,
+    so elementwise operations do not create per-element expressions.
+
+    >>> from symba.base import sqrt
+    >>> array = ExpressionArray([sqrt(2) + 1, sqrt(3), 2])
+    >>> other = ExpressionArray([sqrt(2) - 1, sqrt(3), sqrt(8)],
+    ...                         array.kernels)
+    >>> list(array * other) == [1, 3, 4 * sqrt(2)]
+    True
+    >>> array < other
+    [False, False, True]
+    >>> (-array).signs()
+    [-1, -1, -1]
+    """
+
+    @property
+    def kernels(self) -> KernelTable:
+        """Returns table of kernels of the array."""
+        return self._kernels
+
+    def bounds(self,
+               bits: int = _INITIAL_BOUNDS_BITS
+               ) -> List[Tuple[Fraction, Fraction]]:
+        """
+        Returns lower & upper bounds of the elements
+        with kernels square roots evaluated with the given precision.
+        """
+        kernels_bounds = self._kernels.bounds(bits)
+        scale = 1 << bits
+        result = []
+        for row in self._rows():
+            lower = upper = _ZERO_SCALE
+            for kernel_id, value in row:
+                kernel_lower, kernel_upper = kernels_bounds[kernel_id]
+                if value > 0:
+                    lower += value * kernel_lower
+                    upper += value * kernel_upper
+                else:
+                    lower += value * kernel_upper
+                    upper += value * kernel_lower
+            result.append((lower / scale, upper / scale))
+        return result
+
+    def signs(self) -> List[int]:
+        """
+        Returns signs of the elements
+        refining their bounds only for undecided ones.
+        """
+        result: List[Optional[int]] = [
+            0 if self._offsets[index] == self._offsets[index + 1] else None
+            for index in range(len(self))
+        ]
+        undecided = [index for index, sign in enumerate(result)
+                     if sign is None]
+        bits = _INITIAL_BOUNDS_BITS
+        while undecided:
+            spend(len(undecided))
+            bounds = self._select(undecided).bounds(bits)
+            next_undecided = []
+            for index, (lower, upper) in zip(undecided, bounds):
+                if lower > 0:
+                    result[index] = 1
+                elif upper < 0:
+                    result[index] = -1
+                else:
+                    next_undecided.append(index)
+            undecided, bits = next_undecided, 2 * bits
+        return cast(List[int], result)
+
+    _kernels: KernelTable
+    _kernels_ids: array[int]
+    _offsets: array[int]
+    _scales: List[Fraction]
+
+    __slots__ = '_kernels', '_kernels_ids', '_offsets', '_scales'
+
+    def __init__(self,
+                 values: Iterable[Union[RawConstant, Expression]] = (),
+                 kernels: Optional[KernelTable] = None) -> None:
+        self._kernels = KernelTable() if kernels is None else kernels
+        self._kernels_ids, self._offsets = array('q'), array('q', [0])
+        self._scales = []
+        for value in values:
+            self._append_row(self._to_row(value))
+
+    def __add__(self, other: Any) -> Any:
+        return (self._combine(other, _add_rows)
+                if isinstance(other, ExpressionArray)
+                else self._map_rational(other, _add_rational))
+
+    def __eq__(self, other: Any) -> Any:
+        difference = self - other
+        return ([not row for row in difference._rows()]
+                if isinstance(difference, ExpressionArray)
+                else NotImplemented)
+
+    def __ge__(self, other: Any) -> Any:
+        return self._compare(other, (1, 0))
+
+    @overload
+    def __getitem__(self, item: int) -> Expression:
+        ...
+
+    @overload
+    def __getitem__(self, item: slice) -> ExpressionArray:
+        ...
+
+    def __getitem__(
+            self, item: Union[int, slice]
+    ) -> Union[Expression, ExpressionArray]:
+        if isinstance(item, slice):
+            return self._select(range(len(self))[item])
+        size = len(self)
+        if item < 0:
+            item += size
+        if not 0 <= item < size:
+            raise IndexError('Index is out of range.')
+        return self._to_expression(item)
+
+    def __gt__(self, other: Any) -> Any:
+        return self._compare(other, (1,))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __iter__(self) -> Iterator[Expression]:
+        return (self._to_expression(index) for index in range(len(self)))
+
+    def __le__(self, other: Any) -> Any:
+        return self._compare(other, (-1, 0))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __lt__(self, other: Any) -> Any:
+        return self._compare(other, (-1,))
+
+    def __mul__(self, other: Any) -> Any:
+        return (self._combine(other, self._multiply_rows)
+                if isinstance(other, ExpressionArray)
+                else self._map_rational(other, _multiply_by_rational))
+
+    def __ne__(self, other: Any) -> Any:
+        difference = self - other
+        return ([bool(row) for row in difference._rows()]
+                if isinstance(difference, ExpressionArray)
+                else NotImplemented)
+
+    def __neg__(self) -> ExpressionArray:
+        result = ExpressionArray((), self._kernels)
+        result._kernels_ids = array('q', self._kernels_ids)
+        result._offsets = array('q', self._offsets)
+        result._scales = [-scale for scale in self._scales]
+        return result
+
+    def __radd__(self, other: Any) -> Any:
+        return self + other
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__qualname__, list(self))
+
+    def __rmul__(self, other: Any) -> Any:
+        return self * other
+
+    def __rsub__(self, other: Any) -> Any:
+        return -self + other
+
+    def __sub__(self, other: Any) -> Any:
+        return (self + (-other)
+                if isinstance(other, ExpressionArray)
+                else self._map_rational(other, _subtract_rational))
+
+    def _append_row(self, row: Row) -> None:
+        for kernel_id, scale in row:
+            self._kernels_ids.append(kernel_id)
+            self._scales.append(scale)
+        self._offsets.append(len(self._scales))
+
+    def _combine(self,
+                 other: ExpressionArray,
+                 combiner: Callable[[Row, Row], Row]) -> ExpressionArray:
+        if len(other) != len(self):
+            raise ValueError('Arrays should have the same length, '
+                             f'but found {len(self)} and {len(other)}.')
+        other_rows = (other._rows()
+                      if other._kernels is self._kernels
+                      else other._rebased_rows(self._kernels))
+        return _from_rows(
+                [combiner(row, other_row)
+                 for row, other_row in zip(self._rows(), other_rows)],
+                self._kernels
+        )
+
+    def _compare(self, other: Any, signs: Tuple[int, ...]) -> Any:
+        difference = self - other
+        return ([sign in signs for sign in difference.signs()]
+                if isinstance(difference, ExpressionArray)
+                else NotImplemented)
+
+    def _map_rational(self,
+                      other: Any,
+                      mapper: Callable[[Row, Fraction], Row]) -> Any:
+        rational = _to_rational(other)
+        if rational is None:
+            return NotImplemented
+        return _from_rows(
+                [mapper(row, rational) for row in self._rows()],
+                self._kernels
+        )
+
+    def _multiply_rows(self, left: Row, right: Row) -> Row:
+        result: Dict[int, Fraction] = {}
+        multiply = self._kernels.multiply
+        for left_id, left_scale in left:
+            for right_id, right_scale in right:
+                kernel_id, factor = multiply(left_id, right_id)
+                result[kernel_id] = (result.get(kernel_id, _ZERO_SCALE)
+                                     + left_scale * right_scale * factor)
+        return _to_sorted_row(result)
+
+    def _rebased_rows(self, kernels: KernelTable) -> List[Row]:
+        kernels_mapping = [kernels.register(kernel)
+                           for kernel in self._kernels.kernels]
+        result = []
+        for row in self._rows():
+            rebased: Dict[int, Fraction] = {}
+            for kernel_id, scale in row:
+                target_id, factor = kernels_mapping[kernel_id]
+                rebased[target_id] = (rebased.get(target_id, _ZERO_SCALE)
+                                      + scale * factor)
+            result.append(_to_sorted_row(rebased))
+        return result
+
+    def _rows(self) -> Iterator[Row]:
+        kernels_ids, offsets, scales = (self._kernels_ids, self._offsets,
+                                        self._scales)
+        for index in range(len(offsets) - 1):
+            start, stop = offsets[index], offsets[index + 1]
+            yield list(zip(kernels_ids[start:stop], scales[start:stop]))
+
+    def _select(self, indices: Sequence[int]) -> ExpressionArray:
+        result = ExpressionArray((), self._kernels)
+        offsets = self._offsets
+        for index in indices:
+            start, stop = offsets[index], offsets[index + 1]
+            result._kernels_ids.extend(self._kernels_ids[start:stop])
+            result._scales.extend(self._scales[start:stop])
+            result._offsets.append(len(result._scales))
+        return result
+
+    def _to_expression(self, index: int) -> Expression:
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        tail = _ZERO_SCALE
+        terms_components = []
+        constants = self._kernels.constants
+        for kernel_id, scale in zip(self._kernels_ids[start:stop],
+                                    self._scales[start:stop]):
+            if kernel_id == _UNIT_KERNEL_ID:
+                tail = scale
+            else:
+                terms_components.append((constants[kernel_id], scale))
+        return to_expression(terms_components, tail)
+
+    def _to_row(self, value: Union[RawConstant, Expression]) -> Row:
+        expression = try_to_constant(value)
+        if not isinstance(expression, Expression):
+            raise TypeError('Value is not convertible to expression: '
+                            f'{value}.')
+        terms_components, tail = to_components(expression)
+        result = {_UNIT_KERNEL_ID: tail}
+        for radicand, scale in terms_components:
+            kernel_id, factor = self._kernels.register(radicand)
+            result[kernel_id] = (result.get(kernel_id, _ZERO_SCALE)
+                                 + scale * factor)
+        return _to_sorted_row(result)
+
+
+_ONE_SCALE, _ZERO_SCALE = Fraction(1), Fraction(0)
+
+
+def _add_rational(row: Row, value: Fraction) -> Row:
+    result = dict(row)
+    result[_UNIT_KERNEL_ID] = result.get(_UNIT_KERNEL_ID, _ZERO_SCALE) + value
+    return _to_sorted_row(result)
+
+
+def _add_rows(left: Row, right: Row) -> Row:
+    result = dict(left)
+    for kernel_id, scale in right:
+        result[kernel_id] = result.get(kernel_id, _ZERO_SCALE) + scale
+    return _to_sorted_row(result)
+
+
+def _from_rows(rows: Iterable[Row], kernels: KernelTable) -> ExpressionArray:
+    result = ExpressionArray((), kernels)
+    for row in rows:
+        result._append_row(row)
+    return result
+
+
+def _multiply_by_rational(row: Row, value: Fraction) -> Row:
+    return ([(kernel_id, scale * value) for kernel_id, scale in row]
+            if value
+            else [])
+
+
+def _subtract_rational(row: Row, value: Fraction) -> Row:
+    return _add_rational(row, -value)
+
+
+def _to_kernel_bounds(kernel: int, bits: int) -> Tuple[int, int]:
+    scaled = kernel << (2 * bits)
+    lower = sqrt_floor(scaled)
+    return lower, lower + (lower * lower != scaled)
+
+
+def _to_rational(value: Any) -> Optional[Fraction]:
+    constant = try_to_constant(value)
+    return (constant.raw
+            if isinstance(constant, (FiniteNonZero, Zero))
+            else None)
+
+
+def _to_sorted_row(scales: Dict[int, Fraction]) -> Row:
+    return sorted([(kernel_id, scale)
+                   for kernel_id, scale in scales.items()
+                   if scale])
@@ -0,0 +1,206 @@
+from typing import (Any,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union,
+                    cast)
+
+from cfractions import Fraction
+
+from .budget import spend
+from .constant import (FiniteNonZero,
+                       Infinite,
+                       Zero,
+                       try_to_constant)
+from .expression import Expression
+from .form import Form
+from .hints import RawConstant
+from .term import Term
+from .utils import (sqrt_ceil,
+                    sqrt_floor)
+
+Bound = Union[Fraction, float]
+Row = Tuple[List[Tuple[int, Fraction]], Fraction]
+
+_INITIAL_BITS = 64
+
+
+def bounds(expressions: Iterable[Union[RawConstant, Expression]],
+           bits: int = _INITIAL_BITS
+           ) -> List[Tuple[Bound, Bound]]:
+    """
+    Returns lower & upper bounds of the expressions
+    with square roots evaluated as fixed-point numbers
+    with the given count of fractional bits.
+
+    Square roots of distinct arguments are evaluated once for all.
+
+    >>> from symba.base import sqrt
+    >>> [(lower <= value <= upper, float(upper - lower) < 1e-15)
+    ...  for value, (lower, upper) in zip([sqrt(2) + 1, -sqrt(sqrt(3) + 1)],
+    ...                                   bounds([sqrt(2) + 1,
+    ...                                           -sqrt(sqrt(3) + 1)]))]
+    [(True, True), (True, True)]
+    """
+    if bits < 0:
+        raise ValueError('Bits count should be non-negative.')
+    table = _RootsTable()
+    return [_to_bounds(row, table, bits)
+            for row in map(table.to_row, expressions)]
+
+
+def signs(expressions: Iterable[Union[RawConstant, Expression]]
+          ) -> List[int]:
+    """
+    Returns signs of the expressions.
+
+    Square roots of distinct arguments are evaluated once per precision
+    which is raised only for expressions with undecided signs.
+
+    >>> from symba.base import sqrt
+    >>> signs([sqrt(2) - 1, 1 - sqrt(2), 0, sqrt(10 ** 20 + 1) - 10 ** 10])
+    [1, -1, 0, 1]
+    """
+    table = _RootsTable()
+    rows = list(map(table.to_row, expressions))
+    result: List[Optional[int]] = []
+    undecided = []
+    for index, row in enumerate(rows):
+        if isinstance(row, float):
+            result.append(1 if row > 0 else -1)
+        else:
+            terms_components, tail = row
+            if terms_components:
+                result.append(None)
+                undecided.append(index)
+            else:
+                result.append((tail > 0) - (tail < 0))
+    bits = _INITIAL_BITS
+    while undecided:
+        spend(len(undecided))
+        next_undecided = []
+        for index in undecided:
+            lower, upper = _to_fixed_point_bounds(
+                    cast(Row, rows[index]), table, bits
+            )
+            if lower > 0:
+                result[index] = 1
+            elif upper < 0:
+                result[index] = -1
+            else:
+                next_undecided.append(index)
+        undecided, bits = next_undecided, 2 * bits
+    return cast(List[int], result)
+
+
+class _RootsTable:
+    """
+    Distinct square roots arguments
+    with their fixed-point bounds cached per precision.
+    """
+    __slots__ = '_arguments', '_bounds', '_ids'
+
+    def __init__(self) -> None:
+        self._arguments: List[Row] = []
+        self._bounds: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        self._ids: Dict[Any, int] = {}
+
+    def root_bounds(self, node_id: int, bits: int) -> Tuple[int, int]:
+        """
+        Returns bounds of the node square root
+        scaled by ``2 ** bits`` and rounded outwards.
+        """
+        try:
+            precision_bounds = self._bounds[bits]
+        except KeyError:
+            precision_bounds = self._bounds[bits] = {}
+        try:
+            return precision_bounds[node_id]
+        except KeyError:
+            pass
+        argument = self._arguments[node_id]
+        terms_components, tail = argument
+        if terms_components:
+            # ``sqrt(argument) * 2 ** bits
+            #   == sqrt((argument * 2 ** bits) * 2 ** bits)``
+            # with argument bounds already scaled by ``2 ** bits``
+            lower, upper = _to_fixed_point_bounds(argument, self, bits)
+            scale = 1 << bits
+            result = (sqrt_floor(max(lower.numerator * scale
+                                     // lower.denominator, 0)),
+                      sqrt_ceil(max(-(-upper.numerator * scale
+                                      // upper.denominator), 0)))
+        else:
+            scaled = (tail.numerator * tail.denominator) << (2 * bits)
+            result = (sqrt_floor(scaled) // tail.denominator,
+                      -(-sqrt_ceil(scaled) // tail.denominator))
+        precision_bounds[node_id] = result
+        return result
+
+    def to_row(self, value: Union[RawConstant, Expression]
+               ) -> Union[float, Row]:
+        """
+        Returns terms components with rational tail of the expression
+        or raw infinity.
+        """
+        expression = try_to_constant(value)
+        if not isinstance(expression, Expression):
+            raise TypeError('Value is not convertible to expression: '
+                            f'{value}.')
+        elif isinstance(expression, Infinite):
+            return expression.raw
+        return self._to_row(expression)
+
+    def _register(self, argument: Expression) -> int:
+        key = (argument.raw
+               if isinstance(argument, FiniteNonZero)
+               else argument)
+        try:
+            return self._ids[key]
+        except KeyError:
+            row = self._to_row(argument)
+            # arguments are registered after their own square roots,
+            # so identifiers are topologically ordered
+            result = self._ids[key] = len(self._arguments)
+            self._arguments.append(row)
+            return result
+
+    def _to_row(self, expression: Expression) -> Row:
+        if isinstance(expression, Form):
+            return ([(self._register(term.argument), term.scale.raw)
+                     for term in expression.terms],
+                    expression.tail.raw)
+        elif isinstance(expression, Term):
+            return ([(self._register(expression.argument),
+                      expression.scale.raw)],
+                    Fraction(0))
+        else:
+            return [], cast(Union[FiniteNonZero, Zero], expression).raw
+
+
+def _to_bounds(row: Union[float, Row],
+               table: _RootsTable,
+               bits: int) -> Tuple[Bound, Bound]:
+    if isinstance(row, float):
+        return row, row
+    lower, upper = _to_fixed_point_bounds(row, table, bits)
+    scale = 1 << bits
+    return lower / scale, upper / scale
+
+
+def _to_fixed_point_bounds(row: Row,
+                           table: _RootsTable,
+                           bits: int) -> Tuple[Fraction, Fraction]:
+    terms_components, tail = row
+    lower = upper = tail * (1 << bits)
+    for node_id, scale in terms_components:
+        root_lower, root_upper = table.root_bounds(node_id, bits)
+        if scale > 0:
+            lower += scale * root_lower
+            upper += scale * root_upper
+        else:
+            lower += scale * root_upper
+            upper += scale * root_lower
+    return lower, upper
@@ -0,0 +1,64 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised when budget of operations count or time is exceeded.
+    """
+
+
+class Budget:
+    """
+    Represents budget of operations count and/or time
+    which heavy computations spend cooperatively
+    along with the enclosing budget.
+    """
+
+    def cancel(self) -> None:
+        """
+        Cancels computations spending the budget,
+        possibly running in other threads.
+        """
+        self._is_cancelled = True
+
+    def spend(self, operations: int = 1) -> None:
+        if self._is_cancelled:
+            raise BudgetExceeded('Computation is cancelled.')
+        if self._operations_left is not None:
+            self._operations_left -= operations
+            if self._operations_left < 0:
+                raise BudgetExceeded('Operations budget is exceeded.')
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise BudgetExceeded('Time budget is exceeded.')
+        if self._parent is not None:
+            self._parent.spend(operations)
+
+    _deadline: Optional[float]
+    _is_cancelled: bool
+    _operations_left: Optional[int]
+    _parent: Optional['Budget']
+
+    __slots__ = '_deadline', '_is_cancelled', '_operations_left', '_parent'
+
+    def __init__(self,
+                 operations: Optional[int],
+                 seconds: Optional[float],
+                 parent: Optional['Budget']) -> None:
+        self._deadline = (None
+                          if seconds is None
+                          else time.monotonic() + seconds)
+        self._is_cancelled = False
+        self._operations_left, self._parent = operations, parent
+
+
+budget: ContextVar[Optional[Budget]] = ContextVar('budget',
+                                                  default=None)
+
+
+def spend(operations: int = 1) -> None:
+    """Spends operations from the current budget if any."""
+    current_budget = budget.get()
+    if current_budget is not None:
+        current_budget.spend(operations)
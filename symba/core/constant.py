@@ -5,6 +5,7 @@ from abc import abstractmethod
 from numbers import (Rational,
                      Real)
 from typing import (Any,
+                    Dict,
                     NoReturn,
                     Tuple,
                     TypeVar,
@@ -15,6 +16,10 @@ from cfractions import Fraction
 from reprit.base import generate_repr
 
 from .expression import Expression
+from .fingerprint import (MODULI,
+                          ZERO_FINGERPRINT,
+                          Fingerprint,
+                          to_fingerprint)
 from .hints import (RawConstant,
                     RawFinite,
                     RawUnbound)
@@ -49,6 +54,9 @@ class Constant(Expression):
                       if isinstance(other, (Rational, Real))
                       else NotImplemented))
 
+    def __float__(self) -> float:
+        return float(self.raw)
+
     def __hash__(self) -> int:
         return hash(self.raw)
 
@@ -73,6 +81,9 @@ class Zero(Constant):
     def extract_common_numerator(self) -> Tuple[int, FiniteNonZero]:
         return 0, ONE
 
+    def fingerprint(self) -> Fingerprint:
+        return ZERO_FINGERPRINT
+
     def inverse(self) -> NoReturn:
         raise ZeroDivisionError()
 
@@ -120,6 +131,12 @@ class Zero(Constant):
     def __bool__(self) -> bool:
         return False
 
+    def __copy__(self) -> Zero:
+        return Zero()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Zero:
+        return Zero()
+
     @overload
     def __mul__(self, other: Union[RawConstant, Zero]) -> Zero:
         ...
@@ -163,6 +180,9 @@ class Zero(Constant):
 
     __repr__ = generate_repr(__new__)
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return 'ZERO' if self is ZERO else (Zero, ())
+
     @overload
     def __rmul__(self, other: Union[RawConstant, Zero]) -> Zero:
         ...
@@ -191,6 +211,9 @@ class FiniteNonZero(Constant):
     def extract_common_numerator(self) -> Tuple[int, FiniteNonZero]:
         return self.raw.numerator, ONE / self.raw.denominator
 
+    def fingerprint(self) -> Fingerprint:
+        return to_fingerprint(self.raw)
+
     def inverse(self) -> FiniteNonZero:
         return FiniteNonZero(Fraction(self.raw.denominator,
                                       self.raw.numerator))
@@ -243,6 +266,12 @@ class FiniteNonZero(Constant):
     def __bool__(self) -> bool:
         return bool(self.raw)
 
+    def __copy__(self) -> FiniteNonZero:
+        return FiniteNonZero(self.raw)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> FiniteNonZero:
+        return FiniteNonZero(self.raw)
+
     def __hash__(self) -> int:
         return hash(self.raw)
 
@@ -295,6 +324,9 @@ class FiniteNonZero(Constant):
 
     __repr__ = generate_repr(__init__)
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return 'ONE' if self is ONE else (FiniteNonZero, (self.raw,))
+
     @overload
     def __rmul__(self, other: RawConstant) -> FiniteNonZero:
         ...
@@ -332,6 +364,10 @@ class Infinite(Constant):
     def extract_common_numerator(self) -> Tuple[int, Expression]:
         return 1, self
 
+    def fingerprint(self) -> Fingerprint:
+        sign = positiveness_to_sign(self.is_positive())
+        return tuple(sign % modulus for modulus in MODULI)
+
     def inverse(self) -> Expression:
         return ZERO
 
@@ -368,6 +404,12 @@ class Infinite(Constant):
                 if isinstance(other, Expression)
                 else NotImplemented)
 
+    def __copy__(self) -> Infinite:
+        return Infinite(self._is_positive)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Infinite:
+        return Infinite(self._is_positive)
+
     @overload
     def __ge__(self, other: Union[RawConstant, Expression]) -> bool:
         ...
@@ -454,6 +496,11 @@ class Infinite(Constant):
 
     __repr__ = generate_repr(__init__)
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        return ('Infinity'
+                if self is Infinity
+                else (Infinite, (self._is_positive,)))
+
     @overload
     def __rmul__(self, other: Zero) -> NoReturn:
         ...
@@ -1,5 +1,26 @@
 import math
+from concurrent.futures import Executor
 from contextvars import ContextVar
+from typing import (Callable,
+                    NamedTuple,
+                    Optional)
 
-sqrt_evaluator = ContextVar('sqrt_evaluator',
-                            default=math.sqrt)
+
+class FormsMultiplication(NamedTuple):
+    """
+    Represents settings of forms multiplication by worker processes.
+    """
+    executor: Executor
+    # minimal count of terms products to process in parallel
+    threshold: int
+    workers_count: int
+
+
+forms_multiplication: ContextVar[Optional[FormsMultiplication]] = (
+    ContextVar('forms_multiplication',
+               default=None)
+)
+sqrt_evaluator: ContextVar[Callable[[float], float]] = ContextVar(
+        'sqrt_evaluator',
+        default=math.sqrt
+)
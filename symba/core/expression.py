@@ -5,6 +5,7 @@ from abc import (ABC,
                  abstractmethod)
 from numbers import Rational
 from typing import (Any,
+                    Iterator,
                     Optional,
                     Tuple,
                     TypeVar,
@@ -14,6 +15,7 @@ from typing import (Any,
 
 from cfractions import Fraction
 
+from .fingerprint import Fingerprint
 from .hints import (RawConstant,
                     RawFinite,
                     RawUnbound)
@@ -45,6 +47,13 @@ class Expression(ABC):
         and the rest of the expression.
         """
 
+    @abstractmethod
+    def fingerprint(self) -> Fingerprint:
+        """
+        Returns residues of the expression modulo randomly chosen primes,
+        equal expressions have equal fingerprints.
+        """
+
     @abstractmethod
     def inverse(self) -> Expression:
         """Returns the expression inverted."""
@@ -61,6 +70,16 @@ class Expression(ABC):
     def perfect_sqrt(self) -> Expression:
         """Returns perfect square root part of the expression."""
 
+    def powers(self, exponent: int) -> Iterator[Expression]:
+        """
+        Returns iterator over successive powers of the expression
+        from zero up to the given exponent inclusively,
+        each next power is obtained with a single multiplication.
+        """
+        if exponent < 0:
+            raise ValueError('Exponent should be non-negative.')
+        return _to_powers(self, exponent)
+
     @abstractmethod
     def significant_digits_count(self) -> int:
         """Returns significant digits count of the expression."""
@@ -85,6 +104,10 @@ class Expression(ABC):
         """Return the ceiling of the expression."""
         return math.ceil(self.upper_bound())
 
+    @abstractmethod
+    def __float__(self) -> float:
+        """Returns the expression approximated by a floating point number."""
+
     def __floor__(self) -> int:
         """Return the floor of the expression."""
         return math.floor(self.lower_bound())
@@ -175,7 +198,7 @@ class Expression(ABC):
 
     def __mod__(self, other: Union[RawConstant, Expression]) -> Expression:
         """Returns remainder of the division of the expression by the other."""
-        return self - other * (self // other)
+        return cast(Expression, self - other * (self // other))
 
     @abstractmethod
     def __mul__(self, other: Union[RawConstant, Expression]) -> Expression:
@@ -213,7 +236,7 @@ class Expression(ABC):
 
     def __rfloordiv__(self, other: Union[RawConstant, Expression]) -> int:
         """Returns quotient of the division of the other by the expression."""
-        return (other / self).__floor__()
+        return cast(Expression, other / self).__floor__()
 
     def __rmod__(self, other: Union[RawConstant, Expression]) -> Expression:
         """Returns remainder of the division of the other by the expression."""
@@ -295,3 +318,12 @@ class Expression(ABC):
     def __trunc__(self) -> int:
         """Returns the expression truncated to a nearest-to-zero integer."""
         return self.__floor__() if self.is_positive() else self.__ceil__()
+
+
+def _to_powers(base: Expression, exponent: int) -> Iterator[Expression]:
+    from .constant import ONE
+    result: Expression = ONE
+    yield result
+    for _ in range(exponent):
+        result = result * base
+        yield result
@@ -0,0 +1,95 @@
+import random
+from typing import (Set,
+                    Tuple)
+
+from cfractions import Fraction
+
+Fingerprint = Tuple[int, ...]
+
+_MODULI_COUNT = 3
+_MODULUS_BIT_LENGTH = 61
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _is_prime(value: int) -> bool:
+    if value < 2:
+        return False
+    for witness in _WITNESSES:
+        if value % witness == 0:
+            return value == witness
+    odd_part, exponent = value - 1, 0
+    while not odd_part & 1:
+        odd_part >>= 1
+        exponent += 1
+    for witness in _WITNESSES:
+        candidate = pow(witness, odd_part, value)
+        if candidate == 1 or candidate == value - 1:
+            continue
+        for _ in range(exponent - 1):
+            candidate = candidate * candidate % value
+            if candidate == value - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _generate_modulus(generator: random.Random) -> int:
+    # moduli are congruent to 3 modulo 4,
+    # so ``value ** ((modulus + 1) // 4)`` is a square root of ``value``
+    # whenever ``value`` is a quadratic residue,
+    # and this choice of the root is multiplicative
+    while True:
+        candidate = (generator.getrandbits(_MODULUS_BIT_LENGTH)
+                     | (1 << (_MODULUS_BIT_LENGTH - 1))
+                     | 3)
+        if _is_prime(candidate):
+            return candidate
+
+
+def _generate_moduli(generator: random.Random) -> Tuple[int, ...]:
+    result: Set[int] = set()
+    while len(result) < _MODULI_COUNT:
+        result.add(_generate_modulus(generator))
+    return tuple(sorted(result))
+
+
+MODULI = _generate_moduli(random.Random())
+_SQRT_EXPONENTS = tuple((modulus + 1) // 4 for modulus in MODULI)
+ZERO_FINGERPRINT = (0,) * len(MODULI)
+
+
+def add_fingerprints(left: Fingerprint, right: Fingerprint) -> Fingerprint:
+    return tuple((left_residue + right_residue) % modulus
+                 for left_residue, right_residue, modulus
+                 in zip(left, right, MODULI))
+
+
+def multiply_fingerprints(left: Fingerprint,
+                          right: Fingerprint) -> Fingerprint:
+    return tuple(left_residue * right_residue % modulus
+                 for left_residue, right_residue, modulus
+                 in zip(left, right, MODULI))
+
+
+def sqrt_fingerprint(value: Fingerprint, is_positive: bool) -> Fingerprint:
+    return (tuple(pow(residue, exponent, modulus)
+                  for residue, exponent, modulus
+                  in zip(value, _SQRT_EXPONENTS, MODULI))
+            if is_positive
+            else tuple(-pow(residue, exponent, modulus) % modulus
+                       for residue, exponent, modulus
+                       in zip(value, _SQRT_EXPONENTS, MODULI)))
+
+
+def square_fingerprint(value: Fingerprint) -> Fingerprint:
+    return multiply_fingerprints(value, value)
+
+
+def to_fingerprint(value: Fraction) -> Fingerprint:
+    numerator, denominator = value.numerator, value.denominator
+    return (tuple(numerator % modulus for modulus in MODULI)
+            if denominator == 1
+            else tuple(numerator * pow(denominator, modulus - 2, modulus)
+                       % modulus
+                       for modulus in MODULI))
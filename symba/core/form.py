@@ -3,11 +3,14 @@ from __future__ import annotations
 import math
 from collections import defaultdict
 from functools import reduce
+from itertools import chain
 from numbers import (Rational,
                      Real)
+from operator import attrgetter
 from typing import (Any,
                     Callable,
                     DefaultDict,
+                    Dict,
                     Iterable,
                     List,
                     Optional,
@@ -17,9 +20,12 @@ from typing import (Any,
                     cast,
                     overload)
 
+from cfractions import Fraction
 from reprit.base import generate_repr
 
+from .budget import spend
 from .constant import (ONE,
+                       RAW_ONE,
                        RAW_ZERO,
                        ZERO,
                        Constant,
@@ -29,15 +35,23 @@ from .constant import (ONE,
                        Zero,
                        to_constant,
                        try_to_constant)
+from .context import (FormsMultiplication,
+                      forms_multiplication)
 from .expression import Expression
+from .fingerprint import (Fingerprint,
+                          add_fingerprints)
 from .hints import (RawConstant,
                     RawFinite,
                     RawUnbound)
 from .term import Term
 from .utils import (BASE,
+                    SQUARE_FREE_LIMIT,
                     digits_count,
                     lcm,
+                    perfect_sqrt,
                     positiveness_to_sign,
+                    split_square_factor,
+                    sqrt_floor,
                     to_square_free,
                     transpose)
 
@@ -60,6 +74,7 @@ class Form(Expression):
             arguments_scales[min_term_argument] += min_term.scale
             next_queue = []
             for term in queue:
+                spend()
                 arguments_ratio = term.argument / min_term_argument
                 arguments_ratio_sqrt = arguments_ratio.perfect_sqrt()
                 if arguments_ratio_sqrt.square() == arguments_ratio:
@@ -76,7 +91,11 @@ class Form(Expression):
                 if terms
                 else tail)
 
-    __slots__ = 'tail', 'terms'
+    tail: Finite
+    terms: List[Term]
+    _fingerprint: Fingerprint
+
+    __slots__ = 'tail', 'terms', '_fingerprint'
 
     def __init__(self, terms: List[Term], tail: Finite = ZERO) -> None:
         self.tail, self.terms = tail, terms
@@ -103,6 +122,17 @@ class Form(Expression):
                                   tail_numerator)
         return common_numerator, self / common_numerator
 
+    def fingerprint(self) -> Fingerprint:
+        try:
+            return self._fingerprint
+        except AttributeError:
+            result = self._fingerprint = reduce(
+                    add_fingerprints,
+                    [term.fingerprint() for term in self.terms],
+                    self.tail.fingerprint()
+            )
+            return result
+
     def inverse(self) -> Union[Finite, Form, Term]:
         common_denominator, integer_form = self.extract_common_denominator()
         numerator, denominator = (
@@ -110,6 +140,7 @@ class Form(Expression):
             Factorization.from_form(integer_form)
         )
         while denominator.factors:
+            spend()
             max_factor = max(denominator.factors)
             max_factorization = denominator.factors.pop(max_factor)
             numerator = numerator.multiply(
@@ -309,14 +340,18 @@ class Form(Expression):
         return (self is other
                 or (self.tail == other.tail
                     and len(self.terms) == len(other.terms)
+                    and self.fingerprint() == other.fingerprint()
                     and set(self.terms) == set(other.terms))
                 if isinstance(other, Form)
                 else (False
                       if isinstance(other, (Expression, Rational, Real))
                       else NotImplemented))
 
+    def __float__(self) -> float:
+        return math.fsum([*map(float, self.terms), float(self.tail)])
+
     def __hash__(self) -> int:
-        return hash((frozenset(self.terms), self.tail))
+        return hash(self.fingerprint())
 
     @overload
     def __mul__(self, other: RawFinite) -> Union[Form, Zero]:
@@ -364,6 +399,17 @@ class Form(Expression):
         return Form([-term for term in self.terms],
                     tail=-self.tail)
 
+    def __pow__(self, exponent: int) -> Expression:
+        if not isinstance(exponent, int):
+            return NotImplemented
+        elif len(self.terms) == 1 and isinstance(self.tail, FiniteNonZero):
+            (term,) = self.terms
+            argument = term.argument
+            if (isinstance(argument, FiniteNonZero)
+                    and argument.raw.denominator == 1):
+                return self._quadratic_power(exponent)
+        return super().__pow__(exponent)
+
     @overload
     def __radd__(self, other: Union[RawConstant, Expression]) -> Expression:
         ...
@@ -382,6 +428,9 @@ class Form(Expression):
 
     __repr__ = generate_repr(__init__)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return unpack_expression, pack_expression(self)
+
     @overload
     def __rmul__(self, other: RawFinite) -> Union[Form, Zero]:
         ...
@@ -459,11 +508,17 @@ class Form(Expression):
                  + ([]
                     if isinstance(tail, Zero)
                     else [other_term * tail for other_term in other.terms]))
+        settings = forms_multiplication.get()
         tail = (tail * other_tail
-                + _sift_components([term * other_term
-                                    for term in self.terms
-                                    for other_term in other.terms],
-                                   terms))
+                + (_multiply_terms_in_parallel(self.terms, other.terms,
+                                               terms, settings)
+                   if (settings is not None
+                       and (len(self.terms) * len(other.terms)
+                            >= settings.threshold))
+                   else _sift_components([term * other_term
+                                          for term in self.terms
+                                          for other_term in other.terms],
+                                         terms)))
         return Form.from_components(terms, tail)
 
     def _multiply_by_term(self, other: Term) -> Expression:
@@ -472,6 +527,69 @@ class Form(Expression):
                     _sift_components([term * other for term in self.terms],
                                      terms))
 
+    def _quadratic_power(self, exponent: int) -> Expression:
+        # for ``a + b * sqrt(d)`` powers are ``p + q * sqrt(d)``
+        # where pairs ``(p, q)`` are scaled Lucas sequences,
+        # they are computed by binary exponentiation of integer pairs
+        if not exponent:
+            return ONE
+        (term,) = self.terms
+        argument = term.argument
+        assert isinstance(argument, FiniteNonZero), argument
+        radicand = argument.raw.numerator
+        rational_part, irrational_part = self.tail.raw, term.scale.raw
+        if exponent < 0:
+            norm = (rational_part * rational_part
+                    - irrational_part * irrational_part * radicand)
+            rational_part, irrational_part, exponent = (
+                rational_part / norm, -irrational_part / norm, -exponent
+            )
+        denominator = lcm(rational_part.denominator,
+                          irrational_part.denominator)
+        base_rational, base_irrational = (
+            rational_part.numerator
+            * (denominator // rational_part.denominator),
+            irrational_part.numerator
+            * (denominator // irrational_part.denominator)
+        )
+        # powers of two are cancelled by shifts beforehand,
+        # since gcd of huge numerators and denominators is quadratic
+        denominator_binary_valuation = (
+            (denominator & -denominator).bit_length() - 1
+        )
+        denominator_binary_exponent = denominator_binary_valuation * exponent
+        denominator_odd_power = ((denominator >> denominator_binary_valuation)
+                                 ** exponent)
+        result_rational, result_irrational = 1, 0
+        while True:
+            if exponent & 1:
+                result_rational, result_irrational = (
+                    result_rational * base_rational
+                    + result_irrational * base_irrational * radicand,
+                    result_rational * base_irrational
+                    + result_irrational * base_rational
+                )
+            exponent >>= 1
+            if not exponent:
+                break
+            base_rational, base_irrational = (
+                base_rational * base_rational
+                + base_irrational * base_irrational * radicand,
+                2 * base_rational * base_irrational
+            )
+        # both parts are non-zero, since ``a`` & ``b`` are non-zero
+        # and ``d`` is not a perfect square
+        shift = min(denominator_binary_exponent,
+                    (result_rational & -result_rational).bit_length() - 1,
+                    (result_irrational & -result_irrational).bit_length() - 1)
+        result_denominator = (denominator_odd_power
+                              << (denominator_binary_exponent - shift))
+        return Form([Term(FiniteNonZero(Fraction(result_irrational >> shift,
+                                                 result_denominator)),
+                          argument)],
+                    FiniteNonZero(Fraction(result_rational >> shift,
+                                           result_denominator)))
+
     def _scale(self, other: FiniteNonZero) -> Form:
         return (self
                 if other == ONE
@@ -479,6 +597,232 @@ class Form(Expression):
                           self.tail * other))
 
 
+class FormBuilder:
+    """
+    Represents mutable accumulator of summands
+    which updates coefficients of terms in place
+    and materializes a single expression at the end
+    with the same representation as the sum of summands from left to right.
+    """
+
+    def add(self, value: Union[RawConstant, Expression]) -> None:
+        """Adds the value to the accumulated sum."""
+        expression = try_to_constant(value)
+        if isinstance(expression, FiniteNonZero):
+            self._tail += expression.raw
+        elif isinstance(expression, Term):
+            # sum with terms is built by ``Form.from_components``
+            # which sorts the terms, otherwise new terms keep their order
+            self._add_terms([expression], False, self._terms_count > 0)
+        elif isinstance(expression, Form):
+            self._add_terms(expression.terms, True, self._terms_count > 0)
+            self._tail += expression.tail.raw
+        elif isinstance(expression, Infinite):
+            self._infinity = (expression
+                              if self._infinity is None
+                              else self._infinity + expression)
+        elif not isinstance(expression, Zero):
+            raise TypeError('Value is not convertible to expression: '
+                            f'{value}.')
+
+    def add_product(self,
+                    left: Union[RawConstant, Expression],
+                    right: Union[RawConstant, Expression]) -> None:
+        """
+        Adds product of the values to the accumulated sum
+        without constructing intermediate sums.
+        """
+        left_expression, right_expression = (try_to_constant(left),
+                                             try_to_constant(right))
+        self.add(_multiply_distinct_forms(left_expression, right_expression)
+                 if (isinstance(left_expression, Form)
+                     and isinstance(right_expression, Form)
+                     and left_expression != right_expression)
+                 else (_to_terms_product(left_expression, right_expression)
+                       if (isinstance(left_expression, Term)
+                           and isinstance(right_expression, Term))
+                       else left_expression * right_expression))
+
+    def build(self) -> Expression:
+        """Returns expression of the accumulated sum."""
+        if self._infinity is not None:
+            return self._infinity
+        components = [
+            component
+            for component in chain(self._kernels_components.values(),
+                                   self._arguments_components.values())
+            if component.scale
+        ]
+        last_step = self._steps_count
+        if self._is_last_step_sorting:
+            # like in ``Form.from_components`` terms are ordered
+            # by absolute values of their smallest summands in the last step
+            components.sort(key=lambda component: (
+                component.key
+                if component.step == last_step
+                else component.squared_abs()
+            ))
+        else:
+            # the last step added terms to the sum without them,
+            # so their order is kept
+            components.sort(key=attrgetter('key'))
+        terms = [component.to_term() for component in components]
+        tail = to_constant(self._tail)
+        assert isinstance(tail, (FiniteNonZero, Zero)), tail
+        if self._has_commensurable_components():
+            return Form.from_components(terms, tail)
+        return ((Form(terms, tail) if tail or len(terms) > 1 else terms[0])
+                if terms
+                else tail)
+
+    _arguments_components: Dict[Union[Form, Term], _Component]
+    _infinity: Optional[Infinite]
+    _is_last_step_sorting: bool
+    _kernels_components: Dict[int, _Component]
+    _steps_count: int
+    _tail: Fraction
+    _terms_count: int
+
+    __slots__ = ('_arguments_components', '_infinity', '_is_last_step_sorting',
+                 '_kernels_components', '_steps_count', '_tail',
+                 '_terms_count')
+
+    def __init__(self,
+                 values: Iterable[Union[RawConstant, Expression]] = ()
+                 ) -> None:
+        self._arguments_components, self._kernels_components = {}, {}
+        self._infinity, self._is_last_step_sorting = None, False
+        self._steps_count = self._terms_count = 0
+        self._tail = Fraction()
+        for value in values:
+            self.add(value)
+
+    def __iadd__(self, other: Union[RawConstant, Expression]) -> FormBuilder:
+        self.add(other)
+        return self
+
+    def _add_term(self,
+                  term: Term,
+                  position: int,
+                  is_sorting: bool,
+                  is_new_preferred: bool) -> None:
+        argument, scale = term.argument, term.scale.raw
+        components: Dict[Any, _Component]
+        key: Any
+        unit: Union[int, Form, Term]
+        if isinstance(argument, FiniteNonZero):
+            raw_argument = argument.raw
+            denominator = raw_argument.denominator
+            factor, kernel = split_square_factor(raw_argument.numerator
+                                                 * denominator)
+            if kernel == 1:
+                self._tail += scale * factor / denominator
+                return
+            components, key, unit, multiplier = (
+                self._kernels_components, kernel, kernel,
+                Fraction(factor, denominator)
+            )
+            squared_abs: Any = scale * scale * raw_argument
+        else:
+            components, key, unit, multiplier = (
+                self._arguments_components, argument, argument, RAW_ONE
+            )
+            squared_abs = scale * scale * argument
+        component = components.get(key)
+        if component is None:
+            component = components[key] = _Component(unit)
+        step = self._steps_count
+        is_nonzero = bool(component.scale)
+        if component.step != step and not is_nonzero:
+            component.argument, component.multiplier = argument, multiplier
+            component.key = squared_abs if is_sorting else position
+        else:
+            # like in ``Form.from_components`` the summand
+            # with the smallest absolute value gives the argument
+            # and the later one wins ties
+            smallest_squared_abs = (component.key
+                                    if component.step == step
+                                    else component.squared_abs())
+            if (squared_abs < smallest_squared_abs
+                    or (is_new_preferred
+                        and squared_abs == smallest_squared_abs)):
+                component.argument, component.multiplier = (argument,
+                                                            multiplier)
+                component.key = squared_abs
+            else:
+                component.key = smallest_squared_abs
+        component.scale += scale * multiplier
+        component.step = step
+        self._terms_count += bool(component.scale) - is_nonzero
+
+    def _add_terms(self,
+                   terms: List[Term],
+                   is_form: bool,
+                   is_sorting: bool) -> None:
+        # existing term comes after terms of a form added to it
+        is_new_preferred = not (is_form
+                                and self._terms_count == 1
+                                and not self._tail)
+        self._steps_count += 1
+        self._is_last_step_sorting = is_sorting
+        for position, term in enumerate(terms):
+            self._add_term(term, position, is_sorting, is_new_preferred)
+
+    def _has_commensurable_components(self) -> bool:
+        # arguments are grouped by square-free kernels
+        # only if they are small enough, otherwise ratios of arguments
+        # can be perfect squares across groups
+        kernels = [kernel
+                   for kernel, component in self._kernels_components.items()
+                   if component.scale]
+        for large_kernel in kernels:
+            if large_kernel < SQUARE_FREE_LIMIT:
+                continue
+            for kernel in kernels:
+                if kernel != large_kernel:
+                    product = kernel * large_kernel
+                    if sqrt_floor(product) ** 2 == product:
+                        return True
+        arguments_terms = [
+            component.to_term()
+            for component in self._arguments_components.values()
+            if component.scale
+        ]
+        if len(arguments_terms) < 2:
+            return False
+        merged = Form.from_components(arguments_terms)
+        return len(merged.terms if isinstance(merged, Form)
+                   else [merged]) < len(arguments_terms)
+
+
+class _Component:
+    """
+    Represents accumulated summands with commensurable square roots,
+    their sum equals to ``scale * sqrt(unit)``
+    and is expressed as a term with the given argument,
+    whose square root equals to ``multiplier * sqrt(unit)``.
+    """
+
+    def squared_abs(self) -> Any:
+        return self.scale * self.scale * self.unit
+
+    def to_term(self) -> Term:
+        return Term(FiniteNonZero(self.scale / self.multiplier),
+                    self.argument)
+
+    argument: Union[FiniteNonZero, Form, Term]
+    key: Any
+    multiplier: Fraction
+    scale: Fraction
+    step: int
+    unit: Union[int, Form, Term]
+
+    __slots__ = 'argument', 'key', 'multiplier', 'scale', 'step', 'unit'
+
+    def __init__(self, unit: Union[int, Form, Term]) -> None:
+        self.scale, self.step, self.unit = RAW_ZERO, -1, unit
+
+
 def form_arguments_gcd(integer_form: Form) -> int:
     result, _, coprime_indices = _split_integers_by_gcd(
             [_evaluate_integer_term_argument(term)
@@ -488,6 +832,94 @@ def form_arguments_gcd(integer_form: Form) -> int:
     return 1 if coprime_indices else result
 
 
+def pack_expression(
+        expression: Union[Form, Term]
+) -> Tuple[Tuple[int, ...], Tuple[Union[Form, Term], ...]]:
+    """
+    Returns flat tuple of integers representing the expression
+    along with its non-rational terms arguments.
+
+    Integers are numerator & denominator of the tail for forms
+    followed by numerators & denominators of terms scales and arguments,
+    where arguments with zero denominators are indices
+    of non-rational arguments.
+    """
+    data: List[int] = []
+    arguments: List[Union[Form, Term]] = []
+    if isinstance(expression, Form):
+        tail = expression.tail.raw
+        data += tail.numerator, tail.denominator
+        terms = expression.terms
+    else:
+        terms = [expression]
+    for term in terms:
+        scale, argument = term.scale.raw, term.argument
+        data += scale.numerator, scale.denominator
+        if isinstance(argument, FiniteNonZero):
+            data += argument.raw.numerator, argument.raw.denominator
+        else:
+            data += len(arguments), 0
+            arguments.append(argument)
+    return tuple(data), tuple(arguments)
+
+
+def unpack_expression(data: Tuple[int, ...],
+                      arguments: Tuple[Union[Form, Term], ...]
+                      ) -> Union[Form, Term]:
+    """
+    Returns expression from the result of ``pack_expression``.
+
+    Objects are created directly, since their components
+    are already normalized.
+    """
+    is_form = len(data) % 4
+    terms = []
+    for start in range(2 if is_form else 0, len(data), 4):
+        (scale_numerator, scale_denominator,
+         argument_numerator, argument_denominator) = data[start:start + 4]
+        term = object.__new__(Term)
+        term.scale = _to_finite_non_zero(scale_numerator, scale_denominator)
+        term.argument = (_to_finite_non_zero(argument_numerator,
+                                             argument_denominator)
+                         if argument_denominator
+                         else arguments[argument_numerator])
+        terms.append(term)
+    if not is_form:
+        return terms[0]
+    result = object.__new__(Form)
+    result.terms = terms
+    tail_numerator, tail_denominator = data[0], data[1]
+    result.tail = (ZERO
+                   if not tail_numerator
+                   else (ONE
+                         if tail_numerator == tail_denominator
+                         else _to_finite_non_zero(tail_numerator,
+                                                  tail_denominator)))
+    return result
+
+
+def _multiply_distinct_forms(left: Form, right: Form) -> Expression:
+    # gives the same expression as ``left * right``,
+    # but terms products are merged by their kernels
+    # instead of pairwise division of their arguments
+    tail, right_tail = left.tail, right.tail
+    terms = (([]
+              if isinstance(right_tail, Zero)
+              else [term * right_tail for term in left.terms])
+             + ([]
+                if isinstance(tail, Zero)
+                else [right_term * tail for right_term in right.terms]))
+    tail = tail * right_tail + _sift_components(
+            [_to_terms_product(term, right_term)
+             for term in left.terms
+             for right_term in right.terms],
+            terms
+    )
+    builder = FormBuilder((tail,))
+    builder._add_terms(terms, True, True)
+    return builder.build()
+
+
 def _split_form(integer_form: Form) -> Tuple[Form, Form]:
     terms: Sequence[Term] = integer_form.terms
     if len(terms) == 3:
@@ -632,6 +1064,7 @@ class Factorization:
         result.tail /= 2
         for factor, factorization in factors.items():
             for other_factor, other_factorization in other_factors.items():
+                spend()
                 result_factorization = (
                     factorization.multiply(other_factorization)
                 )
@@ -814,6 +1247,37 @@ def _populate_factors(children: DefaultDict[Factor, Factorization],
     last_factorization.tail += term.scale
 
 
+def _multiply_terms(terms: Sequence[Term],
+                    other_terms: Sequence[Term]
+                    ) -> Tuple[List[Term], Finite]:
+    products_terms: List[Term] = []
+    tail = _sift_components([term * other_term
+                             for term in terms
+                             for other_term in other_terms],
+                            products_terms)
+    return products_terms, tail
+
+
+def _multiply_terms_in_parallel(terms: Sequence[Term],
+                                other_terms: Sequence[Term],
+                                result_terms: List[Term],
+                                settings: FormsMultiplication) -> Finite:
+    # outer terms are split across workers in contiguous chunks,
+    # so concatenation of their products in the order of submission
+    # gives the same terms as the serial multiplication
+    chunk_size = -(-len(terms) // settings.workers_count)
+    futures = [settings.executor.submit(_multiply_terms,
+                                        terms[start:start + chunk_size],
+                                        other_terms)
+               for start in range(0, len(terms), chunk_size)]
+    tail: Finite = ZERO
+    for future in futures:
+        chunk_terms, chunk_tail = future.result()
+        result_terms.extend(chunk_terms)
+        tail += chunk_tail
+    return tail
+
+
 def _sift_components(components: Iterable[Expression],
                      terms: List[Term]) -> Finite:
     tail: Finite = ZERO
@@ -829,9 +1293,47 @@ def _sift_components(components: Iterable[Expression],
     return tail
 
 
+def _to_terms_product(term: Term, other: Term) -> Expression:
+    # gives the same expression as ``term * other``,
+    # but integer arguments are reduced by integer arithmetic
+    argument, other_argument = term.argument, other.argument
+    if not (isinstance(argument, FiniteNonZero)
+            and isinstance(other_argument, FiniteNonZero)
+            and argument.raw.denominator == 1
+            and other_argument.raw.denominator == 1):
+        return term * other
+    scale = term.scale.raw * other.scale.raw
+    radicand, other_radicand = (argument.raw.numerator,
+                                other_argument.raw.numerator)
+    if radicand == other_radicand:
+        return FiniteNonZero(scale * radicand)
+    elif radicand > other_radicand:
+        radicand, other_radicand = other_radicand, radicand
+    quotient, remainder = divmod(other_radicand, radicand)
+    if remainder:
+        radicands_gcd = math.gcd(radicand, other_radicand)
+        scale *= radicands_gcd
+        radicand = ((radicand // radicands_gcd)
+                    * (other_radicand // radicands_gcd))
+    else:
+        scale *= radicand
+        radicand = quotient
+    radicand_sqrt = perfect_sqrt(radicand, 0)
+    return (FiniteNonZero(scale * radicand_sqrt)
+            if radicand_sqrt
+            else Term(FiniteNonZero(scale), FiniteNonZero(radicand)))
+
+
 def _term_key(term: Term) -> Tuple[int, Expression]:
     return term.degree, term.argument
 
 
+def _to_finite_non_zero(numerator: int, denominator: int) -> FiniteNonZero:
+    result = object.__new__(FiniteNonZero)
+    result._raw = Fraction(numerator, denominator)
+    return result
+
+
 def _to_signed_value(value: Union[FiniteNonZero, Term]) -> str:
     return '+ ' + str(value) if value.is_positive() else '- ' + str(-value)
+
@@ -0,0 +1,60 @@
+from typing import (Iterable,
+                    List,
+                    Tuple)
+
+from cfractions import Fraction
+
+from .constant import (ONE,
+                       ZERO,
+                       FiniteNonZero,
+                       Zero)
+from .expression import Expression
+from .form import Form
+from .term import Term
+
+Components = Tuple[List[Tuple[int, Fraction]], Fraction]
+
+
+def to_components(expression: Expression) -> Components:
+    """
+    Returns radicands with scales of the degree-1 expression terms
+    along with its rational tail.
+    """
+    if isinstance(expression, Form):
+        return ([_to_term_components(term) for term in expression.terms],
+                expression.tail.raw)
+    elif isinstance(expression, Term):
+        return [_to_term_components(expression)], ZERO.raw
+    elif isinstance(expression, (FiniteNonZero, Zero)):
+        return [], expression.raw
+    raise ValueError('Expression should be finite of degree 1, '
+                     f'but found {expression!r}.')
+
+
+def to_finite_non_zero(value: Fraction) -> FiniteNonZero:
+    return ONE if value == 1 else FiniteNonZero(value)
+
+
+def to_expression(terms_components: Iterable[Tuple[FiniteNonZero, Fraction]],
+                  tail: Fraction) -> Expression:
+    """
+    Returns degree-1 expression from its radicands with scales
+    and rational tail without normalization.
+    """
+    terms = [Term(to_finite_non_zero(scale), radicand)
+             for radicand, scale in terms_components]
+    tail_constant = to_finite_non_zero(tail) if tail else ZERO
+    return ((Form(terms, tail_constant)
+             if tail or len(terms) > 1
+             else terms[0])
+            if terms
+            else tail_constant)
+
+
+def _to_term_components(term: Term) -> Tuple[int, Fraction]:
+    argument = term.argument
+    if (not isinstance(argument, FiniteNonZero)
+            or argument.raw.denominator != 1):
+        raise ValueError('Term argument should be an integer, '
+                         f'but found {argument!r}.')
+    return argument.raw.numerator, term.scale.raw
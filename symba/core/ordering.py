@@ -0,0 +1,239 @@
+import heapq
+from typing import (Any,
+                    Iterable,
+                    List,
+                    Sequence,
+                    Tuple,
+                    TypeVar,
+                    Union,
+                    cast)
+
+from cfractions import Fraction
+from reprit.base import generate_repr
+
+from .constant import (Constant,
+                       FiniteNonZero,
+                       try_to_constant)
+from .expression import Expression
+from .hints import RawConstant
+
+Bound = Union[Fraction, float]
+_T = TypeVar('_T', bound=Union[RawConstant, Expression])
+
+INTERVAL_SCALE = 1 << 64
+_INTERVAL_SCALE_EXPRESSION = FiniteNonZero(INTERVAL_SCALE)
+
+
+def to_interval(expression: Expression) -> Tuple[Bound, Bound]:
+    if isinstance(expression, Constant):
+        return cast(Bound, expression.raw), cast(Bound, expression.raw)
+    scaled = expression * _INTERVAL_SCALE_EXPRESSION
+    return (cast(Bound, scaled.lower_bound() / INTERVAL_SCALE),
+            cast(Bound, scaled.upper_bound() / INTERVAL_SCALE))
+
+
+class SortKey:
+    """
+    Represents ordering key of the expression
+    which compares cached interval enclosures first
+    and falls back to exact comparison only when they overlap.
+    """
+
+    @classmethod
+    def from_interval(cls,
+                      expression: Expression,
+                      lower_bound: Bound,
+                      upper_bound: Bound) -> 'SortKey':
+        """
+        Constructs key from the expression
+        with its interval enclosure computed by ``to_interval`` beforehand.
+        """
+        result = super().__new__(cls)
+        result.expression = expression
+        result.lower_bound, result.upper_bound = lower_bound, upper_bound
+        return result
+
+    expression: Expression
+    lower_bound: Bound
+    upper_bound: Bound
+
+    __slots__ = 'expression', 'lower_bound', 'upper_bound'
+
+    def __init__(self, expression: Expression) -> None:
+        self.expression = expression
+        self.lower_bound, self.upper_bound = to_interval(expression)
+
+    def __ge__(self, other: 'SortKey') -> bool:
+        return (self.lower_bound >= other.upper_bound
+                or (self.upper_bound >= other.lower_bound
+                    and self.expression >= other.expression))
+
+    def __gt__(self, other: 'SortKey') -> bool:
+        return (self.lower_bound > other.upper_bound
+                or (self.upper_bound > other.lower_bound
+                    and self.expression > other.expression))
+
+    def __le__(self, other: 'SortKey') -> bool:
+        return (self.upper_bound <= other.lower_bound
+                or (self.lower_bound <= other.upper_bound
+                    and self.expression <= other.expression))
+
+    def __lt__(self, other: 'SortKey') -> bool:
+        return (self.upper_bound < other.lower_bound
+                or (self.lower_bound < other.upper_bound
+                    and self.expression < other.expression))
+
+    __repr__ = generate_repr(__init__)
+
+
+def sort_key(value: Union[RawConstant, Expression]) -> SortKey:
+    """
+    Returns key for ordering of the given value
+    which can be passed to ``sorted``, ``bisect`` & ``heapq`` functions.
+
+    >>> from symba.base import sqrt
+    >>> values = [sqrt(3), 1, sqrt(2)]
+    >>> sorted(values, key=sort_key) == [1, sqrt(2), sqrt(3)]
+    True
+    """
+    expression = try_to_constant(value)
+    if not isinstance(expression, Expression):
+        raise TypeError('Value is not convertible to expression: '
+                        f'{value}.')
+    return SortKey(expression)
+
+
+def maximum(values: Iterable[_T]) -> _T:
+    """
+    Returns the first largest of the values.
+
+    >>> from symba.base import sqrt
+    >>> maximum([sqrt(2), sqrt(3), 1]) == sqrt(3)
+    True
+    """
+    candidates = list(values)
+    if not candidates:
+        raise ValueError('maximum() arg is an empty sequence')
+    keys = [sort_key(candidate) for candidate in candidates]
+    threshold = max(key.lower_bound for key in keys)
+    index = max([index
+                 for index, key in enumerate(keys)
+                 if key.upper_bound >= threshold],
+                key=keys.__getitem__)
+    return candidates[index]
+
+
+def minimum(values: Iterable[_T]) -> _T:
+    """
+    Returns the first smallest of the values.
+
+    >>> from symba.base import sqrt
+    >>> minimum([sqrt(2), sqrt(3), 2]) == sqrt(2)
+    True
+    """
+    candidates = list(values)
+    if not candidates:
+        raise ValueError('minimum() arg is an empty sequence')
+    keys = [sort_key(candidate) for candidate in candidates]
+    threshold = min(key.upper_bound for key in keys)
+    index = min([index
+                 for index, key in enumerate(keys)
+                 if key.lower_bound <= threshold],
+                key=keys.__getitem__)
+    return candidates[index]
+
+
+def nlargest(count: int, values: Iterable[_T]) -> List[_T]:
+    """
+    Returns given count of the largest values
+    in the same order as ``sorted(values, reverse=True)[:count]``.
+
+    >>> from symba.base import sqrt
+    >>> nlargest(2, [sqrt(2), sqrt(3), 1]) == [sqrt(3), sqrt(2)]
+    True
+    """
+    if count <= 0:
+        return []
+    candidates = list(values)
+    keys = [sort_key(candidate) for candidate in candidates]
+    if count < len(keys):
+        threshold = heapq.nlargest(count,
+                                   [key.lower_bound for key in keys])[-1]
+        indices = [index
+                   for index, key in enumerate(keys)
+                   if key.upper_bound >= threshold]
+    else:
+        indices = list(range(len(keys)))
+    return [candidates[index]
+            for index in _sort_indices(indices, keys, True)[:count]]
+
+
+def nsmallest(count: int, values: Iterable[_T]) -> List[_T]:
+    """
+    Returns given count of the smallest values
+    in the same order as ``sorted(values)[:count]``.
+
+    >>> from symba.base import sqrt
+    >>> nsmallest(2, [sqrt(2), sqrt(3), 1]) == [1, sqrt(2)]
+    True
+    """
+    if count <= 0:
+        return []
+    candidates = list(values)
+    keys = [sort_key(candidate) for candidate in candidates]
+    if count < len(keys):
+        threshold = heapq.nsmallest(count,
+                                    [key.upper_bound for key in keys])[-1]
+        indices = [index
+                   for index, key in enumerate(keys)
+                   if key.lower_bound <= threshold]
+    else:
+        indices = list(range(len(keys)))
+    return [candidates[index]
+            for index in _sort_indices(indices, keys, False)[:count]]
+
+
+def sort(values: Iterable[_T], *, reverse: bool = False) -> List[_T]:
+    """
+    Returns values sorted stably in ascending (or descending) order,
+    exact comparisons are performed only for values
+    with overlapping interval enclosures.
+
+    >>> from symba.base import sqrt
+    >>> sort([sqrt(3), 1, sqrt(2)]) == [1, sqrt(2), sqrt(3)]
+    True
+    >>> sort([sqrt(3), 1, sqrt(2)], reverse=True) == [sqrt(3), sqrt(2), 1]
+    True
+    """
+    candidates = list(values)
+    keys = [sort_key(candidate) for candidate in candidates]
+    return [candidates[index]
+            for index in _sort_indices(range(len(keys)), keys, reverse)]
+
+
+def _sort_indices(indices: Iterable[int],
+                  keys: Sequence[SortKey],
+                  reverse: bool) -> List[int]:
+    clusters: List[List[int]] = []
+    cluster_upper_bound: Any = None
+    for index in sorted(indices, key=lambda index: keys[index].lower_bound):
+        key = keys[index]
+        if clusters and key.lower_bound <= cluster_upper_bound:
+            clusters[-1].append(index)
+            if key.upper_bound > cluster_upper_bound:
+                cluster_upper_bound = key.upper_bound
+        else:
+            clusters.append([index])
+            cluster_upper_bound = key.upper_bound
+    if reverse:
+        clusters.reverse()
+    result: List[int] = []
+    for cluster in clusters:
+        if len(cluster) == 1:
+            result.extend(cluster)
+        else:
+            cluster.sort()
+            result.extend(sorted(cluster,
+                                 key=keys.__getitem__,
+                                 reverse=reverse))
+    return result
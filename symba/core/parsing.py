@@ -0,0 +1,144 @@
+import re
+from functools import lru_cache
+from typing import (Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from cfractions import Fraction
+
+from .constant import (ONE,
+                       ZERO,
+                       FiniteNonZero,
+                       Infinity,
+                       Zero)
+from .expression import Expression
+from .form import Form
+from .term import Term
+
+_RATIONAL_PATTERN = re.compile(r'(\d+)(?:/(\d+))?')
+_SQRT_PREFIX = 'sqrt('
+_SCALED_SQRT_PREFIX = ' * ' + _SQRT_PREFIX
+
+
+def parse(text: str) -> Expression:
+    """
+    Returns expression from its string representation.
+
+    Input is trusted to be canonical (e.g. produced by ``str``),
+    so expression is built without normalization.
+
+    >>> from symba.base import sqrt
+    >>> parse('2 * sqrt(3) + sqrt(5) - 1/2') == (2 * sqrt(3) + sqrt(5)
+    ...                                         - 1 / 2)
+    True
+    >>> parse(str(sqrt(sqrt(2) + 1))) == sqrt(sqrt(2) + 1)
+    True
+    """
+    text = text.strip()
+    if text == 'inf':
+        return Infinity
+    elif text == '-inf':
+        return -Infinity
+    result, position = _parse_expression(text, 0)
+    if position != len(text):
+        raise _to_error(text, position)
+    return result
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[Expression]:
+    """
+    Returns iterator over expressions parsed from non-blank lines.
+
+    >>> import io
+    >>> from symba.base import sqrt
+    >>> list(parse_lines(io.StringIO('sqrt(2) + 1\\n\\n-sqrt(3)\\n'))) == [
+    ...     sqrt(2) + 1, -sqrt(3)
+    ... ]
+    True
+    """
+    for line in lines:
+        if line and not line.isspace():
+            yield parse(line)
+
+
+def _parse_expression(text: str, position: int) -> Tuple[Expression, int]:
+    terms: List[Term] = []
+    tail: Union[FiniteNonZero, Zero] = ZERO
+    is_negative = text.startswith('-', position)
+    position += is_negative
+    while True:
+        if text.startswith(_SQRT_PREFIX, position):
+            scale = -ONE if is_negative else ONE
+            argument, position = _parse_argument(
+                    text, position + len(_SQRT_PREFIX)
+            )
+            terms.append(Term(scale, argument))
+        else:
+            value, position = _parse_rational(text, position, is_negative)
+            if text.startswith(_SCALED_SQRT_PREFIX, position):
+                if not isinstance(value, FiniteNonZero):
+                    raise _to_error(text, position)
+                argument, position = _parse_argument(
+                        text, position + len(_SCALED_SQRT_PREFIX)
+                )
+                terms.append(Term(value, argument))
+            else:
+                tail = value
+                break
+        if text.startswith(' + ', position):
+            is_negative = False
+        elif text.startswith(' - ', position):
+            is_negative = True
+        else:
+            break
+        position += 3
+    return ((Form(terms, tail)
+             if tail or len(terms) > 1
+             else terms[0])
+            if terms
+            else tail), position
+
+
+def _parse_argument(text: str, position: int) -> Tuple[Expression, int]:
+    result, position = _parse_expression(text, position)
+    if not text.startswith(')', position):
+        raise _to_error(text, position)
+    if not isinstance(result, (FiniteNonZero, Form, Term)):
+        raise _to_error(text, position)
+    return result, position + 1
+
+
+def _parse_rational(text: str,
+                    position: int,
+                    is_negative: bool
+                    ) -> Tuple[Union[FiniteNonZero, Zero], int]:
+    match = _RATIONAL_PATTERN.match(text, position)
+    if match is None:
+        raise _to_error(text, position)
+    raw_numerator, raw_denominator = match.groups()
+    if raw_denominator is not None and not raw_denominator.strip('0'):
+        raise _to_error(text, position)
+    return (_to_rational(raw_numerator, raw_denominator, is_negative),
+            match.end())
+
+
+@lru_cache(maxsize=1 << 16)
+def _to_rational(raw_numerator: str,
+                 raw_denominator: Optional[str],
+                 is_negative: bool) -> Union[FiniteNonZero, Zero]:
+    # constants are immutable, so the same scales & radicands
+    # repeating across lines can share instances
+    numerator = -int(raw_numerator) if is_negative else int(raw_numerator)
+    denominator = 1 if raw_denominator is None else int(raw_denominator)
+    return ((ONE
+             if numerator == denominator == 1
+             else FiniteNonZero(Fraction(numerator, denominator)))
+            if numerator
+            else ZERO)
+
+
+def _to_error(text: str, position: int) -> ValueError:
+    return ValueError(f'Invalid expression {text!r} at position {position}.')
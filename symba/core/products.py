@@ -0,0 +1,156 @@
+import heapq
+from itertools import count
+from typing import (Iterable,
+                    List,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from .constant import (ONE,
+                       FiniteNonZero,
+                       try_to_constant)
+from .expression import Expression
+from .form import (Form,
+                   FormBuilder)
+from .hints import RawConstant
+from .term import Term
+
+
+def dot(left: Iterable[Union[RawConstant, Expression]],
+        right: Iterable[Union[RawConstant, Expression]]) -> Expression:
+    """
+    Returns sum of products of the corresponding values
+    accumulated without intermediate sums.
+
+    >>> from symba.base import sqrt
+    >>> dot([sqrt(2), 1], [sqrt(8), sqrt(3)]) == 4 + sqrt(3)
+    True
+    """
+    builder = FormBuilder()
+    right_iterator = iter(right)
+    for left_value in left:
+        try:
+            right_value = next(right_iterator)
+        except StopIteration:
+            raise ValueError('Arguments should have the same length.'
+                             ) from None
+        builder.add_product(left_value, right_value)
+    for _ in right_iterator:
+        raise ValueError('Arguments should have the same length.')
+    return builder.build()
+
+
+def fma(left: Union[RawConstant, Expression],
+        right: Union[RawConstant, Expression],
+        addend: Union[RawConstant, Expression]) -> Expression:
+    """
+    Returns product of the first two values plus the third one
+    accumulated without intermediate sums.
+
+    >>> from symba.base import sqrt
+    >>> fma(sqrt(2) + 1, sqrt(2) - 1, sqrt(3)) == sqrt(3) + 1
+    True
+    """
+    builder = FormBuilder()
+    builder.add_product(left, right)
+    builder.add(addend)
+    return builder.build()
+
+
+def prod(values: Iterable[Union[RawConstant, Expression]]) -> Expression:
+    """
+    Returns product of the values
+    multiplied along a balanced tree,
+    so the largest intermediate products are formed last.
+
+    Sequences are multiplied smallest factors first
+    by estimated size (terms count times coefficients bit lengths),
+    other iterables are consumed lazily
+    keeping only a logarithmic number of partial products.
+
+    >>> from symba.base import sqrt
+    >>> prod([sqrt(2) + 1, sqrt(2) - 1, sqrt(3), 2]) == 2 * sqrt(3)
+    True
+    >>> prod(sqrt(value) for value in range(2, 6)) == 2 * sqrt(30)
+    True
+    >>> prod([]) == 1
+    True
+    """
+    return (_prod_sequence(values)
+            if isinstance(values, Sequence)
+            else _prod_stream(values))
+
+
+def estimate_size(expression: Expression) -> int:
+    if isinstance(expression, Form):
+        components_sizes = [estimate_size(term) for term in expression.terms]
+        if expression.tail:
+            components_sizes.append(estimate_size(expression.tail))
+        return len(components_sizes) * max(components_sizes)
+    elif isinstance(expression, Term):
+        return (estimate_size(expression.scale)
+                + estimate_size(expression.argument))
+    elif isinstance(expression, FiniteNonZero):
+        return (expression.raw.numerator.bit_length()
+                + expression.raw.denominator.bit_length())
+    else:
+        return 1
+
+
+def multiply(left: Expression, right: Expression) -> Expression:
+    builder = FormBuilder()
+    builder.add_product(left, right)
+    return builder.build()
+
+
+def _prod_sequence(
+        values: Sequence[Union[RawConstant, Expression]]
+) -> Expression:
+    if not values:
+        return ONE
+    counter = count()
+    queue: List[Tuple[int, int, Expression]] = []
+    for value in values:
+        expression = _to_expression(value)
+        queue.append((estimate_size(expression), next(counter), expression))
+    heapq.heapify(queue)
+    while len(queue) > 1:
+        _, first_index, first = heapq.heappop(queue)
+        _, second_index, second = heapq.heappop(queue)
+        # factors keep their order like in ``first * second``
+        product = (multiply(first, second)
+                   if first_index < second_index
+                   else multiply(second, first))
+        heapq.heappush(queue,
+                       (estimate_size(product), next(counter), product))
+    _, _, result = queue[0]
+    return result
+
+
+def _prod_stream(values: Iterable[Union[RawConstant, Expression]]
+                 ) -> Expression:
+    # binary counter of partial products:
+    # each partial product on the stack covers twice as many values
+    # as the next one
+    stack: List[Tuple[int, Expression]] = []
+    for value in values:
+        level, product = 0, _to_expression(value)
+        while stack and stack[-1][0] == level:
+            _, other_product = stack.pop()
+            level, product = level + 1, multiply(other_product, product)
+        stack.append((level, product))
+    if not stack:
+        return ONE
+    _, result = stack.pop()
+    while stack:
+        _, product = stack.pop()
+        result = multiply(product, result)
+    return result
+
+
+def _to_expression(value: Union[RawConstant, Expression]) -> Expression:
+    result = try_to_constant(value)
+    if not isinstance(result, Expression):
+        raise TypeError('Value is not convertible to expression: '
+                        f'{value}.')
+    return result
@@ -17,7 +17,12 @@ from .constant import (ONE,
                        Zero,
                        to_constant,
                        try_to_constant)
+from .context import sqrt_evaluator
 from .expression import Expression
+from .fingerprint import (Fingerprint,
+                          multiply_fingerprints,
+                          sqrt_fingerprint,
+                          square_fingerprint)
 from .hints import (RawConstant,
                     RawFinite,
                     RawUnbound)
@@ -50,7 +55,11 @@ class Term(Expression):
         assert isinstance(result, Expression), result
         return result
 
-    __slots__ = 'argument', 'scale'
+    argument: Union[FiniteNonZero, Form, Term]
+    scale: FiniteNonZero
+    _fingerprint: Fingerprint
+
+    __slots__ = 'argument', 'scale', '_fingerprint'
 
     def __init__(self,
                  scale: FiniteNonZero,
@@ -71,6 +80,19 @@ class Term(Expression):
         common_numerator, scale = self.scale.extract_common_numerator()
         return common_numerator, Term(scale, self.argument)
 
+    def fingerprint(self) -> Fingerprint:
+        try:
+            return self._fingerprint
+        except AttributeError:
+            result = self._fingerprint = sqrt_fingerprint(
+                    multiply_fingerprints(
+                            square_fingerprint(self.scale.fingerprint()),
+                            self.argument.fingerprint()
+                    ),
+                    self.is_positive()
+            )
+            return result
+
     def inverse(self) -> Term:
         scale = self.scale.inverse()
         argument: Expression
@@ -147,10 +169,15 @@ class Term(Expression):
     def __eq__(self, other: Any) -> Any:
         return (isinstance(other, Term)
                 and self.is_positive() is other.is_positive()
+                and self.fingerprint() == other.fingerprint()
                 and self.square() == other.square()
                 if isinstance(other, Expression)
                 else NotImplemented)
 
+    def __float__(self) -> float:
+        evaluator = sqrt_evaluator.get()
+        return float(self.scale) * evaluator(float(self.argument))
+
     @overload
     def __ge__(self, other: Union[RawConstant, Expression]) -> bool:
         ...
@@ -192,7 +219,7 @@ class Term(Expression):
                 else NotImplemented)
 
     def __hash__(self) -> int:
-        return hash((self.is_positive(), self.square()))
+        return hash(self.fingerprint())
 
     @overload
     def __le__(self, other: Union[RawConstant, Expression]) -> bool:
@@ -288,6 +315,11 @@ class Term(Expression):
 
     __repr__ = generate_repr(__init__)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        from .form import (pack_expression,
+                           unpack_expression)
+        return unpack_expression, pack_expression(self)
+
     @overload
     def __rmul__(self, other: FiniteNonZero) -> Term:
         ...
@@ -1,6 +1,8 @@
 import math
 import sys
+from functools import reduce
 from numbers import Rational
+from operator import mul
 from typing import (Callable,
                     Sequence,
                     Tuple,
@@ -52,6 +54,34 @@ def rational_sqrt_upper_bound(value: RawConstant) -> Fraction:
                     value.denominator)
 
 
+def split_square_factor(value: int) -> Tuple[int, int]:
+    """
+    Returns pair of ``factor`` & ``rest`` with
+    ``value == factor * factor * rest``,
+    where ``rest`` is not a perfect square
+    and has no squares of small primes as divisors,
+    so it is square-free if less than ``SQUARE_FREE_LIMIT``.
+    """
+    factor = 1
+    small_primes_divisor = math.gcd(value, _SMALL_PRIMES_PRODUCT)
+    if small_primes_divisor != 1:
+        for prime in _SMALL_PRIMES:
+            if prime > small_primes_divisor:
+                break
+            elif small_primes_divisor % prime:
+                continue
+            prime_squared = prime * prime
+            quotient, remainder = divmod(value, prime_squared)
+            while not remainder:
+                factor *= prime
+                value = quotient
+                quotient, remainder = divmod(value, prime_squared)
+    value_sqrt_floor = sqrt_floor(value)
+    return ((factor * value_sqrt_floor, 1)
+            if value_sqrt_floor * value_sqrt_floor == value
+            else (factor, value))
+
+
 def sqrt_ceil(value: int) -> int:
     value_sqrt_floor = sqrt_floor(value)
     return value_sqrt_floor + (value != value_sqrt_floor * value_sqrt_floor)
@@ -72,6 +102,18 @@ if sys.version_info < (3, 8):
 else:
     sqrt_floor = math.isqrt
 
+_SMALL_PRIMES_LIMIT = 1 << 10
+_SMALL_PRIMES = tuple(candidate
+                      for candidate in range(2, _SMALL_PRIMES_LIMIT)
+                      if all(candidate % divisor
+                             for divisor in range(2, sqrt_floor(candidate)
+                                                  + 1)))
+_SMALL_PRIMES_PRODUCT = reduce(mul, _SMALL_PRIMES)
+# non-square value without squares of small primes as divisors
+# which is divisible by a square of some greater prime
+# should be at least twice as large as that square
+SQUARE_FREE_LIMIT = 2 * _SMALL_PRIMES_LIMIT * _SMALL_PRIMES_LIMIT
+
 
 def perfect_sqrt(value: int, alternative: int = 1) -> int:
     candidate = sqrt_floor(value)
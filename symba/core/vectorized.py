@@ -0,0 +1,212 @@
+import math
+import sys
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Iterable,
+                    List,
+                    Tuple,
+                    Union,
+                    cast)
+
+from cfractions import Fraction
+
+from .constant import (FiniteNonZero,
+                       Infinite,
+                       Zero,
+                       try_to_constant)
+from .expression import Expression
+from .form import Form
+from .hints import RawConstant
+from .term import Term
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+_UNIT_ROUNDOFF = sys.float_info.epsilon / 2
+
+
+def to_numpy(expressions: Iterable[Union[RawConstant, Expression]],
+             with_errors: bool = False
+             ) -> Union['ndarray', Tuple['ndarray', 'ndarray']]:
+    """
+    Returns ``float64`` array of values of the expressions
+    (with array of their absolute errors bounds if requested).
+
+    Square roots of distinct radicands are computed once
+    in a vectorized pass per nesting level,
+    expressions are evaluated as sparse dot products of them.
+
+    Requires ``numpy`` which can be installed with ``symba[numpy]`` extra.
+
+    >>> from symba.base import sqrt
+    >>> values, errors = to_numpy([sqrt(2) + 1, sqrt(sqrt(2) + 1), 2],
+    ...                           with_errors=True)
+    >>> values.tolist() == [float(sqrt(2) + 1), float(sqrt(sqrt(2) + 1)),
+    ...                     2.]
+    True
+    >>> bool((errors < 1e-14).all())
+    True
+    """
+    import numpy
+    graph = _Graph()
+    rows = _Rows()
+    infinities: Dict[int, float] = {}
+    for index, value in enumerate(expressions):
+        if type(value) not in _FINITE_EXPRESSIONS_TYPES:
+            value = try_to_constant(value)
+            if not isinstance(value, Expression):
+                raise TypeError('Value is not convertible to expression: '
+                                f'{value}.')
+            elif isinstance(value, Infinite):
+                infinities[index] = value.raw
+                value = Zero()
+        rows.append(cast(Expression, value), graph)
+    roots = numpy.empty(len(graph.levels), dtype=numpy.float64)
+    roots_errors = numpy.empty(len(graph.levels), dtype=numpy.float64)
+    nodes_levels = numpy.array(graph.levels, dtype=numpy.int64)
+    for level, level_rows in enumerate(graph.rows):
+        level_ids = numpy.flatnonzero(nodes_levels == level)
+        arguments, arguments_errors = level_rows.evaluate(numpy, roots,
+                                                          roots_errors)
+        arguments = numpy.maximum(arguments, 0.)
+        level_roots = numpy.sqrt(arguments)
+        roots[level_ids] = level_roots
+        # ``|sqrt(x) - sqrt(y)| <= sqrt(|x - y|)`` holds in general
+        # and ``|sqrt(x) - sqrt(y)| <= |x - y| / sqrt(y)``
+        # holds for ``y < x`` which covers ``y = x - |x - y|``
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            tight_errors = numpy.where(
+                    arguments > arguments_errors,
+                    arguments_errors / numpy.sqrt(arguments
+                                                  - arguments_errors),
+                    numpy.inf
+            )
+        roots_errors[level_ids] = (numpy.minimum(numpy.sqrt(arguments_errors),
+                                                 tight_errors)
+                                   + _UNIT_ROUNDOFF * level_roots)
+    values, errors = rows.evaluate(numpy, roots, roots_errors)
+    for index, infinity in infinities.items():
+        values[index], errors[index] = infinity, 0.
+    return (values, errors) if with_errors else values
+
+
+class _Rows:
+    """
+    Sparse matrix of expressions coefficients over square roots nodes
+    along with rational tails.
+    """
+    __slots__ = 'coefficients', 'columns', 'rows_indices', 'tails'
+
+    def __init__(self) -> None:
+        self.coefficients: List[Fraction] = []
+        self.columns: List[int] = []
+        self.rows_indices: List[int] = []
+        self.tails: List[Fraction] = []
+
+    def append(self, expression: Expression, graph: '_Graph') -> None:
+        row_index = len(self.tails)
+        if type(expression) is Form:
+            for term in expression.terms:
+                self.rows_indices.append(row_index)
+                self.columns.append(graph.register(term.argument))
+                self.coefficients.append(term.scale.raw)
+            self.tails.append(expression.tail.raw)
+        elif type(expression) is Term:
+            self.rows_indices.append(row_index)
+            self.columns.append(graph.register(expression.argument))
+            self.coefficients.append(expression.scale.raw)
+            self.tails.append(_ZERO_RAW)
+        else:
+            self.tails.append(cast(Union[FiniteNonZero, Zero],
+                                   expression).raw)
+
+    def evaluate(self,
+                 numpy: Any,
+                 roots: 'ndarray',
+                 roots_errors: 'ndarray') -> Tuple['ndarray', 'ndarray']:
+        size = len(self.tails)
+        rows_indices = numpy.array(self.rows_indices, dtype=numpy.int64)
+        columns = numpy.array(self.columns, dtype=numpy.int64)
+        coefficients = numpy.array(list(map(_to_float, self.coefficients)),
+                                   dtype=numpy.float64)
+        tails = numpy.array(list(map(_to_float, self.tails)),
+                            dtype=numpy.float64)
+        products = coefficients * roots[columns]
+        values = numpy.bincount(rows_indices, products,
+                                minlength=size) + tails
+        # each coefficient & tail conversion, product and addition
+        # adds relative rounding error of at most unit roundoff
+        # to the sum of absolute values of summands
+        counts = numpy.bincount(rows_indices, minlength=size) + 3
+        gamma = counts * _UNIT_ROUNDOFF / (1. - counts * _UNIT_ROUNDOFF)
+        absolute_sums = (numpy.bincount(rows_indices, numpy.abs(products),
+                                        minlength=size)
+                         + numpy.abs(tails))
+        propagated_errors = numpy.bincount(
+                rows_indices, numpy.abs(coefficients) * roots_errors[columns],
+                minlength=size
+        )
+        errors = propagated_errors * (1. + gamma) + gamma * absolute_sums
+        # rounding of the bound evaluation itself
+        return values, errors * (1. + 4 * _UNIT_ROUNDOFF)
+
+
+class _Graph:
+    """
+    Distinct square roots arguments grouped by nesting levels.
+    """
+    __slots__ = 'ids', 'identities', 'levels', 'rows'
+
+    def __init__(self) -> None:
+        self.ids: Dict[Any, int] = {}
+        # arguments are commonly shared between expressions,
+        # so identity lookup avoids hashing of nested forms,
+        # arguments are stored along to keep identifiers valid
+        self.identities: Dict[int, Tuple[Expression, int]] = {}
+        self.levels: List[int] = []
+        self.rows: List[_Rows] = []
+
+    def register(self, argument: Expression) -> int:
+        try:
+            return self.identities[id(argument)][1]
+        except KeyError:
+            pass
+        key = (argument.raw
+               if type(argument) is FiniteNonZero
+               else argument)
+        try:
+            result = self.ids[key]
+        except KeyError:
+            level = (0
+                     if type(argument) is FiniteNonZero
+                     else 1 + max(self.levels[self.register(term.argument)]
+                                  for term in _to_terms(argument)))
+            while len(self.rows) <= level:
+                self.rows.append(_Rows())
+            # nodes of the same level are registered
+            # in the order of their rows
+            self.rows[level].append(argument, self)
+            result = self.ids[key] = len(self.levels)
+            self.levels.append(level)
+        self.identities[id(argument)] = argument, result
+        return result
+
+
+def _to_float(value: Fraction) -> float:
+    try:
+        return float(value)
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+
+def _to_terms(expression: Expression) -> List[Term]:
+    return (expression.terms
+            if type(expression) is Form
+            else [cast(Term, expression)])
+
+
+# exact types are checked since ``isinstance`` checks
+# against abstract base classes are relatively slow
+_FINITE_EXPRESSIONS_TYPES = FiniteNonZero, Form, Term, Zero
+_ZERO_RAW = Fraction(0)
@@ -0,0 +1,390 @@
+from functools import (lru_cache as _lru_cache,
+                       reduce as _reduce)
+from typing import (Dict as _Dict,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Sequence as _Sequence,
+                    Tuple as _Tuple,
+                    Union as _Union)
+
+from cfractions import Fraction as _Fraction
+
+from .containers import ResolutionStatistics as _ResolutionStatistics
+from .core.constant import (ONE as _ONE,
+                            ZERO as _ZERO,
+                            Constant as _Constant,
+                            FiniteNonZero as _FiniteNonZero,
+                            Infinite as _Infinite,
+                            Infinity as _Infinity,
+                            Zero as _Zero,
+                            try_to_constant as _try_to_constant)
+from .core.expression import Expression as _Expression
+from .core.form import FormBuilder as _FormBuilder
+from .core.hints import RawConstant as _RawConstant
+from .core.ordering import (Bound as _Bound,
+                            to_interval as _to_interval)
+from .core.term import Term as _Term
+from .core.utils import lcm as _lcm
+from .linalg import det as _det
+
+Coordinate = _Union[_RawConstant, _Expression]
+Point = _Sequence[Coordinate]
+_Interval = _Tuple[_Bound, _Bound]
+
+predicates_statistics = _ResolutionStatistics()
+
+
+class DistanceMatrix:
+    """
+    Represents symmetric matrix of exact Euclidean distances
+    between points with rational coordinates,
+    each pairwise distance is computed and stored once.
+
+    >>> distances = DistanceMatrix([(0, 0), (3, 4), (1, 1)])
+    >>> distances[0, 1] == distances[1, 0] == 5
+    True
+    >>> distances[2, 2] == 0
+    True
+    >>> from symba.base import sqrt
+    >>> distances.row(2) == [sqrt(2), sqrt(13), 0]
+    True
+    """
+
+    _condensed: _List[_Expression]
+    _size: int
+
+    __slots__ = '_condensed', '_size'
+
+    def __init__(self, points: _Sequence[_Sequence[_RawConstant]]) -> None:
+        raw_points = [[_to_raw_rational(coordinate) for coordinate in point]
+                      for point in points]
+        if raw_points and any(len(point) != len(raw_points[0])
+                              for point in raw_points):
+            raise ValueError('Points should have the same dimension.')
+        common_denominator = _reduce(_lcm,
+                                     [coordinate.denominator
+                                      for point in raw_points
+                                      for coordinate in point],
+                                     1)
+        integer_points = [
+            [coordinate.numerator * (common_denominator
+                                     // coordinate.denominator)
+             for coordinate in point]
+            for point in raw_points
+        ]
+        roots: _Dict[int, _Expression] = {}
+        condensed: _List[_Expression] = []
+        for index, point in enumerate(integer_points):
+            for other_point in integer_points[index + 1:]:
+                squared_norm = sum((coordinate - other_coordinate)
+                                   * (coordinate - other_coordinate)
+                                   for coordinate, other_coordinate
+                                   in zip(point, other_point))
+                try:
+                    root = roots[squared_norm]
+                except KeyError:
+                    root = roots[squared_norm] = _rational_sqrt(
+                            squared_norm, common_denominator
+                    )
+                condensed.append(root)
+        self._condensed, self._size = condensed, len(integer_points)
+
+    def row(self, index: int) -> _List[_Expression]:
+        """Returns distances from the point with given index."""
+        index = self._normalize_index(index)
+        return [self._get(index, other_index)
+                for other_index in range(self._size)]
+
+    def __getitem__(self, indices: _Tuple[int, int]) -> _Expression:
+        row_index, column_index = indices
+        return self._get(self._normalize_index(row_index),
+                         self._normalize_index(column_index))
+
+    def __iter__(self) -> _Iterator[_List[_Expression]]:
+        return (self.row(index) for index in range(self._size))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__qualname__, list(self))
+
+    def _get(self, row_index: int, column_index: int) -> _Expression:
+        if row_index == column_index:
+            return _ZERO
+        elif row_index > column_index:
+            row_index, column_index = column_index, row_index
+        return self._condensed[row_index * self._size
+                               - row_index * (row_index + 1) // 2
+                               + column_index - row_index - 1]
+
+    def _normalize_index(self, index: int) -> int:
+        result = index + self._size if index < 0 else index
+        if not 0 <= result < self._size:
+            raise IndexError('Index out of range.')
+        return result
+
+
+def hypot(*coordinates: Coordinate) -> _Expression:
+    """
+    Returns exact Euclidean norm of the vector with given coordinates,
+    rational coordinates are handled in integer arithmetic
+    and distances with equal squared norms share their roots.
+
+    >>> hypot(3, 4) == 5
+    True
+    >>> from cfractions import Fraction
+    >>> from symba.base import sqrt
+    >>> hypot(Fraction(1, 2), Fraction(1, 2)) == sqrt(2) / 2
+    True
+    >>> hypot(1, 2, 2) == 3
+    True
+    """
+    expressions = [_to_expression(coordinate) for coordinate in coordinates]
+    if not all(isinstance(expression, _Constant)
+               for expression in expressions):
+        builder = _FormBuilder()
+        for expression in expressions:
+            builder.add_product(expression, expression)
+        squared_norm = builder.build()
+        return (squared_norm
+                if isinstance(squared_norm, (_Infinite, _Zero))
+                else _Term.from_components(_ONE, squared_norm))
+    elif any(isinstance(expression, _Infinite) for expression in expressions):
+        return _Infinity
+    raw_coordinates = [_to_raw_rational(expression)
+                       for expression in expressions]
+    common_denominator = _reduce(_lcm,
+                                 [coordinate.denominator
+                                  for coordinate in raw_coordinates],
+                                 1)
+    return _rational_sqrt(sum((coordinate.numerator
+                               * (common_denominator
+                                  // coordinate.denominator)) ** 2
+                              for coordinate in raw_coordinates),
+                          common_denominator)
+
+
+def in_circle(first_vertex: Point,
+              second_vertex: Point,
+              third_vertex: Point,
+              point: Point) -> int:
+    """
+    Returns sign of the in-circle determinant:
+    positive if the point lies inside the circle
+    through counterclockwise oriented vertices,
+    negative if it lies outside and zero if on the circle.
+
+    Cached interval enclosures of coordinates are used first,
+    exact arithmetic is performed only if they do not determine the sign,
+    counts of both outcomes are accumulated in ``predicates_statistics``.
+
+    >>> from symba.base import sqrt
+    >>> in_circle((1, 0), (0, 1), (-1, 0), (0, 0))
+    1
+    >>> in_circle((1, 0), (0, 1), (-1, 0), (sqrt(2) / 2, sqrt(2) / 2))
+    0
+    >>> in_circle((1, 0), (0, 1), (-1, 0), (1, 1))
+    -1
+    """
+    vertices = [_to_plane_point(first_vertex),
+                _to_plane_point(second_vertex),
+                _to_plane_point(third_vertex)]
+    point_x, point_y = _to_plane_point(point)
+    point_x_interval, point_y_interval = (_to_cached_interval(point_x),
+                                          _to_cached_interval(point_y))
+    rows_intervals = []
+    for x, y in vertices:
+        dx_interval = _subtract_intervals(_to_cached_interval(x),
+                                          point_x_interval)
+        dy_interval = _subtract_intervals(_to_cached_interval(y),
+                                          point_y_interval)
+        rows_intervals.append(
+                (dx_interval, dy_interval,
+                 _add_intervals(_multiply_intervals(dx_interval,
+                                                    dx_interval),
+                                _multiply_intervals(dy_interval,
+                                                    dy_interval)))
+        )
+    sign = _to_interval_sign(_to_determinant_interval(rows_intervals))
+    if sign is not None:
+        predicates_statistics.interval += 1
+        return sign
+    predicates_statistics.exact += 1
+    rows: _List[_List[_Expression]] = []
+    for x, y in vertices:
+        dx, dy = x - point_x, y - point_y
+        builder = _FormBuilder()
+        builder.add_product(dx, dx)
+        builder.add_product(dy, dy)
+        rows.append([dx, dy, builder.build()])
+    return _to_sign(_det(rows))
+
+
+def orientation(vertex: Point,
+                first_ray_point: Point,
+                second_ray_point: Point) -> int:
+    """
+    Returns orientation of the angle with the given vertex and rays points:
+    positive if counterclockwise, negative if clockwise
+    and zero if points are collinear.
+
+    Cached interval enclosures of coordinates are used first,
+    exact arithmetic is performed only if they do not determine the sign,
+    counts of both outcomes are accumulated in ``predicates_statistics``.
+
+    >>> from symba.base import sqrt
+    >>> orientation((0, 0), (1, 0), (0, 1))
+    1
+    >>> orientation((0, 0), (sqrt(2), sqrt(3)), (sqrt(8), sqrt(12)))
+    0
+    >>> orientation((0, 0), (0, 1), (1, 0))
+    -1
+    """
+    vertex_x, vertex_y = _to_plane_point(vertex)
+    first_x, first_y = _to_plane_point(first_ray_point)
+    second_x, second_y = _to_plane_point(second_ray_point)
+    vertex_x_interval, vertex_y_interval = (_to_cached_interval(vertex_x),
+                                            _to_cached_interval(vertex_y))
+    sign = _to_interval_sign(_subtract_intervals(
+            _multiply_intervals(
+                    _subtract_intervals(_to_cached_interval(first_x),
+                                        vertex_x_interval),
+                    _subtract_intervals(_to_cached_interval(second_y),
+                                        vertex_y_interval)
+            ),
+            _multiply_intervals(
+                    _subtract_intervals(_to_cached_interval(first_y),
+                                        vertex_y_interval),
+                    _subtract_intervals(_to_cached_interval(second_x),
+                                        vertex_x_interval)
+            )
+    ))
+    if sign is not None:
+        predicates_statistics.interval += 1
+        return sign
+    predicates_statistics.exact += 1
+    # expanded cross product, so no intermediate differences are formed
+    builder = _FormBuilder()
+    builder.add_product(vertex_x, first_y - second_y)
+    builder.add_product(first_x, second_y - vertex_y)
+    builder.add_product(second_x, vertex_y - first_y)
+    return _to_sign(builder.build())
+
+
+def _add_intervals(left: _Interval, right: _Interval) -> _Interval:
+    return left[0] + right[0], left[1] + right[1]
+
+
+def _multiply_intervals(left: _Interval, right: _Interval) -> _Interval:
+    left_lower, left_upper = left
+    right_lower, right_upper = right
+    products = (left_lower * right_lower, left_lower * right_upper,
+                left_upper * right_lower, left_upper * right_upper)
+    return min(products), max(products)
+
+
+@_lru_cache(maxsize=1 << 16)
+def _rational_sqrt(numerator_squared: int, denominator: int) -> _Expression:
+    return (_Term.from_components(_ONE,
+                                  _FiniteNonZero(numerator_squared)
+                                  / (denominator * denominator))
+            if numerator_squared
+            else _ZERO)
+
+
+def _subtract_intervals(minuend: _Interval,
+                        subtrahend: _Interval) -> _Interval:
+    return minuend[0] - subtrahend[1], minuend[1] - subtrahend[0]
+
+
+@_lru_cache(maxsize=1 << 16)
+def _to_cached_interval(expression: _Expression) -> _Interval:
+    return _to_interval(expression)
+
+
+def _to_determinant_interval(
+        rows: _Sequence[_Tuple[_Interval, _Interval, _Interval]]
+) -> _Interval:
+    (first_row, second_row, third_row) = rows
+    return _add_intervals(
+            _add_intervals(
+                    _multiply_intervals(
+                            first_row[0],
+                            _subtract_intervals(
+                                    _multiply_intervals(second_row[1],
+                                                        third_row[2]),
+                                    _multiply_intervals(second_row[2],
+                                                        third_row[1])
+                            )
+                    ),
+                    _multiply_intervals(
+                            first_row[1],
+                            _subtract_intervals(
+                                    _multiply_intervals(second_row[2],
+                                                        third_row[0]),
+                                    _multiply_intervals(second_row[0],
+                                                        third_row[2])
+                            )
+                    )
+            ),
+            _multiply_intervals(
+                    first_row[2],
+                    _subtract_intervals(
+                            _multiply_intervals(second_row[0],
+                                                third_row[1]),
+                            _multiply_intervals(second_row[1],
+                                                third_row[0])
+                    )
+            )
+    )
+
+
+def _to_expression(value: Coordinate) -> _Expression:
+    result = _try_to_constant(value)
+    if not isinstance(result, _Expression):
+        raise TypeError('Value is not convertible to expression: '
+                        f'{value}.')
+    return result
+
+
+def _to_finite_expression(value: Coordinate) -> _Expression:
+    result = _to_expression(value)
+    if isinstance(result, _Infinite):
+        raise ValueError('Coordinates should be finite, '
+                         f'but found {value!r}.')
+    return result
+
+
+def _to_interval_sign(interval: _Interval) -> _Optional[int]:
+    lower_bound, upper_bound = interval
+    return (1
+            if lower_bound > 0
+            else (-1
+                  if upper_bound < 0
+                  else (0
+                        if lower_bound == upper_bound == 0
+                        else None)))
+
+
+def _to_plane_point(point: Point) -> _Tuple[_Expression, _Expression]:
+    if len(point) != 2:
+        raise ValueError('Points should be two-dimensional, '
+                         f'but found {len(point)} coordinates.')
+    x, y = point
+    return _to_finite_expression(x), _to_finite_expression(y)
+
+
+def _to_raw_rational(value: Coordinate) -> _Fraction:
+    expression = _to_expression(value)
+    if not isinstance(expression, (_FiniteNonZero, _Zero)):
+        raise TypeError('Coordinates should be rational, '
+                        f'but found {value!r}.')
+    return expression.raw
+
+
+def _to_sign(expression: _Expression) -> int:
+    return (1
+            if expression.is_positive()
+            else (-1 if expression else 0))
@@ -0,0 +1,177 @@
+from typing import (List as _List,
+                    Sequence as _Sequence,
+                    Union as _Union)
+
+from .core.constant import (ONE as _ONE,
+                            ZERO as _ZERO,
+                            try_to_constant as _try_to_constant)
+from .core.expression import Expression as _Expression
+from .core.form import FormBuilder as _FormBuilder
+from .core.hints import RawConstant as _RawConstant
+from .core.products import (dot as _dot,
+                            multiply as _multiply)
+
+Matrix = _Sequence[_Sequence[_Union[_RawConstant, _Expression]]]
+Vector = _Sequence[_Union[_RawConstant, _Expression]]
+
+
+def det(matrix: Matrix) -> _Expression:
+    """
+    Returns determinant of the square matrix
+    computed without divisions.
+
+    >>> from symba.base import sqrt
+    >>> det([[sqrt(2), 1], [1, sqrt(2)]]) == 1
+    True
+    >>> det([[sqrt(2), 2], [1, sqrt(2)]]) == 0
+    True
+    """
+    rows = _to_square_rows(matrix)
+    last_coefficient = _to_characteristic_polynomial(rows)[-1]
+    return last_coefficient if len(rows) % 2 == 0 else -last_coefficient
+
+
+def inverse(matrix: Matrix) -> _List[_List[_Expression]]:
+    """
+    Returns inverse of the square matrix
+    computed with a single division by its determinant.
+
+    >>> from symba.base import sqrt
+    >>> inverse([[sqrt(2), 1], [1, sqrt(2)]]) == [[sqrt(2), -1],
+    ...                                           [-1, sqrt(2)]]
+    True
+    """
+    rows = _to_square_rows(matrix)
+    size = len(rows)
+    coefficients = _to_characteristic_polynomial(rows)
+    scale = _to_cayley_hamilton_scale(coefficients[-1])
+    columns: _List[_List[_Expression]] = [
+        [_ONE if row == column else _ZERO for row in range(size)]
+        for column in range(size)
+    ]
+    for coefficient in coefficients[1:size]:
+        columns = [[_dot(row, column) for row in rows]
+                   for column in columns]
+        for index, column in enumerate(columns):
+            column[index] = _FormBuilder((column[index],
+                                          coefficient)).build()
+    return [[_multiply(column[row], scale) for column in columns]
+            for row in range(size)]
+
+
+def rank(matrix: Matrix) -> int:
+    """
+    Returns rank of the matrix
+    computed by fraction-free elimination without divisions.
+
+    >>> from symba.base import sqrt
+    >>> rank([[sqrt(2), 2, 1], [1, sqrt(2), sqrt(3)]])
+    2
+    >>> rank([[sqrt(2), 2], [1, sqrt(2)]])
+    1
+    """
+    rows = _to_rows(matrix)
+    result = 0
+    for column in range(len(rows[0]) if rows else 0):
+        pivot_row_index = next((row_index
+                                for row_index in range(result, len(rows))
+                                if rows[row_index][column]),
+                               None)
+        if pivot_row_index is None:
+            continue
+        pivot_row = rows.pop(pivot_row_index)
+        pivot = pivot_row[column]
+        for row in rows[result:]:
+            factor = -row[column]
+            if not factor:
+                continue
+            for index in range(column + 1, len(row)):
+                builder = _FormBuilder()
+                builder.add_product(pivot, row[index])
+                builder.add_product(factor, pivot_row[index])
+                row[index] = builder.build()
+        rows.insert(result, pivot_row)
+        result += 1
+    return result
+
+
+def solve(matrix: Matrix, vector: Vector) -> _List[_Expression]:
+    """
+    Returns solution of the linear system with the square matrix
+    and the right-hand side vector
+    computed with a single division by the matrix determinant.
+
+    >>> from symba.base import sqrt
+    >>> solve([[sqrt(2), 1], [1, sqrt(2)]], [1, 0]) == [sqrt(2), -1]
+    True
+    """
+    rows = _to_square_rows(matrix)
+    size = len(rows)
+    if len(vector) != size:
+        raise ValueError('Vector size should be equal to matrix size, '
+                         f'but found {len(vector)} and {size}.')
+    coefficients = _to_characteristic_polynomial(rows)
+    scale = _to_cayley_hamilton_scale(coefficients[-1])
+    right_hand_side = [_to_expression(value) for value in vector]
+    result = right_hand_side
+    for coefficient in coefficients[1:size]:
+        result = [_dot(row + [coefficient], result + [value])
+                  for row, value in zip(rows, right_hand_side)]
+    return [_multiply(value, scale) for value in result]
+
+
+def _to_cayley_hamilton_scale(last_coefficient: _Expression) -> _Expression:
+    # by Cayley-Hamilton theorem for matrix ``A`` of size ``n``
+    # with characteristic polynomial coefficients ``c``
+    # ``A ** -1 == (A ** (n - 1) + c[1] * A ** (n - 2) + ... + c[n - 1])
+    #              * (-1 / c[n])``,
+    # where the sum is evaluated by Horner's scheme
+    if not last_coefficient:
+        raise ValueError('Matrix is singular.')
+    return -last_coefficient.inverse()
+
+
+def _to_characteristic_polynomial(
+        rows: _List[_List[_Expression]]
+) -> _List[_Expression]:
+    # Berkowitz' algorithm which calculates coefficients
+    # of ``det(x * I - A)`` starting from the highest degree one
+    # for growing trailing principal submatrices
+    result: _List[_Expression] = [_ONE]
+    size = len(rows)
+    for offset in range(size - 1, -1, -1):
+        head_row = rows[offset][offset + 1:]
+        submatrix = [row[offset + 1:] for row in rows[offset + 1:]]
+        column = [row[offset] for row in rows[offset + 1:]]
+        toeplitz_coefficients: _List[_Expression] = [_ONE,
+                                                      -rows[offset][offset]]
+        for _ in range(size - offset - 1):
+            toeplitz_coefficients.append(-_dot(head_row, column))
+            column = [_dot(row, column) for row in submatrix]
+        result = [_dot(toeplitz_coefficients[index::-1][:len(result)],
+                       result[:index + 1])
+                  for index in range(len(result) + 1)]
+    return result
+
+
+def _to_expression(value: _Union[_RawConstant, _Expression]) -> _Expression:
+    result = _try_to_constant(value)
+    if not isinstance(result, _Expression):
+        raise TypeError('Value is not convertible to expression: '
+                        f'{value}.')
+    return result
+
+
+def _to_rows(matrix: Matrix) -> _List[_List[_Expression]]:
+    result = [[_to_expression(value) for value in row] for row in matrix]
+    if result and any(len(row) != len(result[0]) for row in result):
+        raise ValueError('Matrix rows should have the same length.')
+    return result
+
+
+def _to_square_rows(matrix: Matrix) -> _List[_List[_Expression]]:
+    result = _to_rows(matrix)
+    if result and len(result[0]) != len(result):
+        raise ValueError('Matrix should be square, '
+                         f'but found {len(result)}x{len(result[0])}.')
+    return result
@@ -0,0 +1,281 @@
+import functools as _functools
+import os as _os
+from concurrent.futures import (Executor as _Executor,
+                                ProcessPoolExecutor as _ProcessPoolExecutor)
+from contextlib import contextmanager as _contextmanager
+from typing import (Any as _Any,
+                    Callable as _Callable,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Sequence as _Sequence,
+                    Tuple as _Tuple,
+                    TypeVar as _TypeVar,
+                    Union as _Union)
+
+from .core.constant import try_to_constant as _try_to_constant
+from .core.context import (FormsMultiplication as _FormsMultiplication,
+                           forms_multiplication as _forms_multiplication)
+from .core.expression import Expression as _Expression
+from .core.hints import RawConstant as _RawConstant
+from .core.ordering import (Bound as _Bound,
+                            SortKey as _SortKey)
+from .serialize import (dumps as _dumps,
+                        loads as _loads)
+
+FORMS_MULTIPLICATION_THRESHOLD = 64
+
+_CHUNKS_PER_WORKER = 4
+
+_Initializer = _Optional[_Callable[..., _Any]]
+_T = _TypeVar('_T', _RawConstant, _Expression)
+
+
+@_contextmanager
+def forms_multiplication(
+        *,
+        max_workers: _Optional[int] = None,
+        threshold: int = FORMS_MULTIPLICATION_THRESHOLD
+) -> _Iterator[None]:
+    """
+    Returns context manager within which products of forms
+    with at least ``threshold`` products of their terms
+    are computed by a pool of worker processes,
+    smaller products are computed serially.
+
+    >>> from symba.base import sqrt
+    >>> left = sqrt(2) + sqrt(3) + sqrt(5) + 1
+    >>> right = sqrt(6) + sqrt(7) - 1
+    >>> with forms_multiplication(max_workers=2,
+    ...                           threshold=1):
+    ...     product = left * right
+    >>> product == left * right
+    True
+    """
+    if threshold <= 0:
+        raise ValueError('Threshold should be positive.')
+    workers_count = (max_workers
+                     if max_workers is not None
+                     else (_os.cpu_count() or 1))
+    with _ProcessPoolExecutor(
+            max_workers,
+            initializer=_disable_forms_multiplication
+    ) as executor:
+        token = _forms_multiplication.set(
+                _FormsMultiplication(executor, threshold, workers_count)
+        )
+        try:
+            yield
+        finally:
+            _forms_multiplication.reset(token)
+
+
+def map(function: _Callable[[_Expression], _Any],
+        values: _Iterable[_Union[_RawConstant, _Expression]],
+        *,
+        chunk_size: _Optional[int] = None,
+        executor: _Optional[_Executor] = None,
+        initargs: _Tuple[_Any, ...] = (),
+        initializer: _Initializer = None,
+        max_workers: _Optional[int] = None) -> _List[_Any]:
+    """
+    Returns results of the function applied to the values
+    converted to expressions in the order of the values
+    with chunks of them processed by a pool of worker processes.
+
+    Expressions are passed to & from workers
+    in compact serialization format
+    with subexpressions shared across each chunk written once,
+    other results are pickled as usual.
+
+    Chunks are submitted to the executor if specified,
+    so a pool can be reused across calls,
+    otherwise a pool of ``max_workers`` worker processes
+    is created for the call
+    & the initializer is called with ``initargs`` in each of them
+    on its start, e.g. to pre-warm caches.
+
+    The function should be picklable (e.g. defined at module level).
+
+    >>> from operator import neg
+    >>> from symba.base import sqrt
+    >>> map(neg, [sqrt(2), sqrt(3) + 1],
+    ...     max_workers=2) == [-sqrt(2), -sqrt(3) - 1]
+    True
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> with ProcessPoolExecutor(2) as executor:
+    ...     (map(neg, [sqrt(2)], executor=executor)
+    ...      + map(neg, [sqrt(3) + 1], executor=executor)
+    ...      == [-sqrt(2), -sqrt(3) - 1])
+    True
+    """
+    result: _List[_Any] = []
+    for chunk_result in _run(_map_chunk, function, _to_expressions(values),
+                             chunk_size, executor, initializer, initargs,
+                             max_workers):
+        result.extend(_decode_results(chunk_result))
+    return result
+
+
+def reduce(function: _Callable[[_Any, _Any], _Any],
+           values: _Iterable[_Union[_RawConstant, _Expression]],
+           *,
+           chunk_size: _Optional[int] = None,
+           executor: _Optional[_Executor] = None,
+           initargs: _Tuple[_Any, ...] = (),
+           initializer: _Initializer = None,
+           max_workers: _Optional[int] = None) -> _Any:
+    """
+    Returns result of cumulative application of the function
+    to the values converted to expressions from left to right
+    with chunks of them reduced by a pool of worker processes
+    and partial results reduced afterwards in the calling process.
+
+    The function should be associative & picklable,
+    the rest of parameters are the same as for ``map``.
+
+    >>> from operator import add
+    >>> from symba.base import sqrt
+    >>> reduce(add, [sqrt(2), sqrt(3), 1, sqrt(2)],
+    ...        max_workers=2) == 2 * sqrt(2) + sqrt(3) + 1
+    True
+    """
+    expressions = _to_expressions(values)
+    if not expressions:
+        raise ValueError('Values should be non-empty.')
+    partial_results: _List[_Any] = []
+    for chunk_result in _run(_reduce_chunk, function, expressions,
+                             chunk_size, executor, initializer, initargs,
+                             max_workers):
+        partial_results.extend(_decode_results(chunk_result))
+    return _functools.reduce(function, partial_results)
+
+
+def sort(values: _Iterable[_T],
+         *,
+         chunk_size: _Optional[int] = None,
+         executor: _Optional[_Executor] = None,
+         initargs: _Tuple[_Any, ...] = (),
+         initializer: _Initializer = None,
+         max_workers: _Optional[int] = None,
+         reverse: bool = False) -> _List[_T]:
+    """
+    Returns values sorted stably in ascending (or descending) order
+    with chunks of them sorted by a pool of worker processes
+    and merged afterwards in the calling process.
+
+    Workers send back only the orders of their chunks
+    along with interval enclosures of the values,
+    the rest of parameters are the same as for ``map``.
+
+    >>> from symba.base import sqrt
+    >>> sort([sqrt(3), 1, sqrt(2)],
+    ...      max_workers=2) == [1, sqrt(2), sqrt(3)]
+    True
+    """
+    candidates = list(values)
+    expressions = _to_expressions(candidates)
+    keys, positions = [], []
+    offset = 0
+    for chunk_entries in _run(_sort_chunk, reverse, expressions, chunk_size,
+                              executor, initializer, initargs, max_workers):
+        for index, lower_bound, upper_bound in chunk_entries:
+            position = offset + index
+            keys.append(_SortKey.from_interval(expressions[position],
+                                               lower_bound, upper_bound))
+            positions.append(position)
+        offset += len(chunk_entries)
+    # concatenation of sorted chunks is merged by stable sorting
+    # which detects the runs, so ties keep the order of the values
+    return [candidates[positions[index]]
+            for index in sorted(range(len(keys)),
+                                key=keys.__getitem__,
+                                reverse=reverse)]
+
+
+def _decode_results(chunk_result: _Tuple[bool, _Any]) -> _List[_Any]:
+    are_expressions, results = chunk_result
+    return _loads(results) if are_expressions else results
+
+
+def _disable_forms_multiplication() -> None:
+    # workers should not submit tasks to the pool of their parent
+    _forms_multiplication.set(None)
+
+
+def _encode_results(results: _List[_Any]) -> _Tuple[bool, _Any]:
+    are_expressions = all(isinstance(result, _Expression)
+                          for result in results)
+    return are_expressions, (_dumps(results) if are_expressions else results)
+
+
+def _map_chunk(function: _Callable[[_Expression], _Any],
+               data: bytes) -> _Tuple[bool, _Any]:
+    return _encode_results([function(expression)
+                            for expression in _loads(data)])
+
+
+def _reduce_chunk(function: _Callable[[_Any, _Any], _Any],
+                  data: bytes) -> _Tuple[bool, _Any]:
+    return _encode_results([_functools.reduce(function, _loads(data))])
+
+
+def _run(chunk_function: _Callable[[_Any, bytes], _Any],
+         argument: _Any,
+         expressions: _Sequence[_Expression],
+         chunk_size: _Optional[int],
+         executor: _Optional[_Executor],
+         initializer: _Initializer,
+         initargs: _Tuple[_Any, ...],
+         max_workers: _Optional[int]) -> _List[_Any]:
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError('Chunk size should be positive.')
+    if not expressions:
+        return []
+    workers_count = (max_workers
+                     if max_workers is not None
+                     else (_os.cpu_count() or 1))
+    if chunk_size is None:
+        chunk_size = -(-len(expressions)
+                       // (workers_count * _CHUNKS_PER_WORKER))
+    if executor is not None:
+        return _run_chunks(executor, chunk_function, argument, expressions,
+                           chunk_size)
+    with _ProcessPoolExecutor(max_workers,
+                              initializer=initializer,
+                              initargs=initargs) as executor:
+        return _run_chunks(executor, chunk_function, argument, expressions,
+                           chunk_size)
+
+
+def _run_chunks(executor: _Executor,
+                chunk_function: _Callable[[_Any, bytes], _Any],
+                argument: _Any,
+                expressions: _Sequence[_Expression],
+                chunk_size: int) -> _List[_Any]:
+    futures = [executor.submit(chunk_function, argument,
+                               _dumps(expressions[start:start + chunk_size]))
+               for start in range(0, len(expressions), chunk_size)]
+    return [future.result() for future in futures]
+
+
+def _to_expressions(values: _Iterable[_Union[_RawConstant, _Expression]]
+                    ) -> _List[_Expression]:
+    result = []
+    for value in values:
+        expression = _try_to_constant(value)
+        if not isinstance(expression, _Expression):
+            raise TypeError('Value is not convertible to expression: '
+                            f'{value}.')
+        result.append(expression)
+    return result
+
+
+def _sort_chunk(reverse: bool,
+                data: bytes) -> _List[_Tuple[int, _Bound, _Bound]]:
+    keys = [_SortKey(expression) for expression in _loads(data)]
+    return [(index, keys[index].lower_bound, keys[index].upper_bound)
+            for index in sorted(range(len(keys)),
+                                key=keys.__getitem__,
+                                reverse=reverse)]
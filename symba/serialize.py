@@ -0,0 +1,299 @@
+import io as _io
+from typing import (BinaryIO as _BinaryIO,
+                    Dict as _Dict,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Tuple as _Tuple)
+
+from cfractions import Fraction as _Fraction
+
+from .core.constant import (ONE as _ONE,
+                            ZERO as _ZERO,
+                            FiniteNonZero as _FiniteNonZero,
+                            Infinite as _Infinite,
+                            Infinity as _Infinity,
+                            Zero as _Zero)
+from .core.expression import Expression as _Expression
+from .core.form import Form as _Form
+from .core.term import Term as _Term
+
+MAGIC = b'SYMBA'
+VERSION = 1
+
+(_ZERO_TAG, _FINITE_NON_ZERO_TAG, _INFINITE_TAG, _TERM_TAG, _FORM_TAG,
+ _ROOT_TAG) = range(6)
+
+_Key = _Tuple[int, ...]
+
+
+class Reader:
+    """
+    Represents reader of expressions batches written by ``Writer``.
+
+    Expressions are restored from the shared table of subexpressions
+    as they were written, without re-running normalization.
+
+    >>> import io
+    >>> from symba.base import sqrt
+    >>> stream = io.BytesIO()
+    >>> writer = Writer(stream)
+    >>> writer.write([sqrt(2) + 1, 2 * sqrt(2)])
+    >>> writer.write([sqrt(2)])
+    >>> _ = stream.seek(0)
+    >>> reader = Reader(stream)
+    >>> reader.read() == [sqrt(2) + 1, 2 * sqrt(2)]
+    True
+    >>> list(reader) == [sqrt(2)]
+    True
+    """
+
+    _file: _BinaryIO
+    _table: _List[_Expression]
+
+    __slots__ = '_file', '_table'
+
+    def __init__(self, file: _BinaryIO) -> None:
+        header = file.read(len(MAGIC) + 1)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError('Stream is not in the serialization format.')
+        version = header[len(MAGIC)]
+        if version != VERSION:
+            raise ValueError(f'Unsupported format version: {version}.')
+        self._file, self._table = file, []
+
+    def read(self) -> _Optional[_List[_Expression]]:
+        """
+        Returns next batch of expressions
+        or ``None`` if the stream is exhausted.
+        """
+        size = _read_stream_size(self._file)
+        if size is None:
+            return None
+        block = self._file.read(size)
+        if len(block) != size:
+            raise ValueError('Stream is truncated.')
+        try:
+            return self._decode(block)
+        except IndexError:
+            raise ValueError('Block is malformed.') from None
+
+    def __iter__(self) -> _Iterator[_Expression]:
+        while True:
+            batch = self.read()
+            if batch is None:
+                return
+            yield from batch
+
+    def _decode(self, block: bytes) -> _List[_Expression]:
+        result = []
+        table = self._table
+        position = 0
+        while position < len(block):
+            tag = block[position]
+            position += 1
+            expression: _Expression
+            if tag == _ROOT_TAG:
+                index, position = _read_size(block, position)
+                result.append(table[index])
+                continue
+            elif tag == _TERM_TAG:
+                numerator, position = _read_integer(block, position)
+                denominator, position = _read_size(block, position)
+                index, position = _read_size(block, position)
+                argument = table[index]
+                if not isinstance(argument, (_FiniteNonZero, _Form, _Term)):
+                    raise ValueError('Term argument is invalid.')
+                expression = _Term(_to_finite_non_zero(numerator,
+                                                       denominator),
+                                   argument)
+            elif tag == _FORM_TAG:
+                index, position = _read_size(block, position)
+                tail = table[index]
+                count, position = _read_size(block, position)
+                terms = []
+                for _ in range(count):
+                    index, position = _read_size(block, position)
+                    term = table[index]
+                    if not isinstance(term, _Term):
+                        raise ValueError('Form term is invalid.')
+                    terms.append(term)
+                if not isinstance(tail, (_FiniteNonZero, _Zero)):
+                    raise ValueError('Form tail is invalid.')
+                expression = _Form(terms, tail)
+            elif tag == _FINITE_NON_ZERO_TAG:
+                numerator, position = _read_integer(block, position)
+                denominator, position = _read_size(block, position)
+                expression = _to_finite_non_zero(numerator, denominator)
+            elif tag == _ZERO_TAG:
+                expression = _ZERO
+            elif tag == _INFINITE_TAG:
+                expression = _Infinity if block[position] else -_Infinity
+                position += 1
+            else:
+                raise ValueError(f'Unknown record tag: {tag}.')
+            table.append(expression)
+        return result
+
+
+class Writer:
+    """
+    Represents writer of expressions batches into binary stream.
+
+    Each unique subexpression is written only once
+    into the table shared by all batches of the stream,
+    later occurrences are written as indices in this table.
+
+    >>> import io
+    >>> from symba.base import sqrt
+    >>> stream = io.BytesIO()
+    >>> writer = Writer(stream)
+    >>> writer.write([sqrt(2) + 1, sqrt(2) - 1])
+    >>> size = len(stream.getvalue())
+    >>> writer.write([sqrt(2) + 1])
+    >>> len(stream.getvalue()) - size
+    3
+    """
+
+    _file: _BinaryIO
+    _indices: _Dict[_Key, int]
+
+    __slots__ = '_file', '_indices'
+
+    def __init__(self, file: _BinaryIO) -> None:
+        file.write(MAGIC + bytes((VERSION,)))
+        self._file, self._indices = file, {}
+
+    def write(self, expressions: _Iterable[_Expression]) -> None:
+        """Writes expressions as a single batch."""
+        block = bytearray()
+        roots_indices = [self._to_index(expression, block)
+                         for expression in expressions]
+        for index in roots_indices:
+            block.append(_ROOT_TAG)
+            _write_size(block, index)
+        header = bytearray()
+        _write_size(header, len(block))
+        self._file.write(bytes(header + block))
+
+    def _to_index(self, expression: _Expression, block: bytearray) -> int:
+        key: _Key
+        if isinstance(expression, _Term):
+            scale = expression.scale.raw
+            key = (_TERM_TAG, scale.numerator, scale.denominator,
+                   self._to_index(expression.argument, block))
+        elif isinstance(expression, _Form):
+            key = (_FORM_TAG, self._to_index(expression.tail, block),
+                   *[self._to_index(term, block)
+                     for term in expression.terms])
+        elif isinstance(expression, _FiniteNonZero):
+            raw = expression.raw
+            key = _FINITE_NON_ZERO_TAG, raw.numerator, raw.denominator
+        elif isinstance(expression, _Zero):
+            key = _ZERO_TAG,
+        elif isinstance(expression, _Infinite):
+            key = _INFINITE_TAG, int(expression.is_positive())
+        else:
+            raise TypeError('Unsupported expression type: '
+                            f'{type(expression)}.')
+        try:
+            return self._indices[key]
+        except KeyError:
+            result = self._indices[key] = len(self._indices)
+            _write_record(block, key)
+            return result
+
+
+def dumps(expressions: _Iterable[_Expression]) -> bytes:
+    """
+    Returns serialized expressions as a single batch.
+
+    >>> from symba.base import sqrt
+    >>> loads(dumps([sqrt(2), sqrt(3) + 1])) == [sqrt(2), sqrt(3) + 1]
+    True
+    """
+    stream = _io.BytesIO()
+    Writer(stream).write(expressions)
+    return stream.getvalue()
+
+
+def loads(data: bytes) -> _List[_Expression]:
+    """Returns expressions deserialized from all batches of the data."""
+    return list(Reader(_io.BytesIO(data)))
+
+
+def _read_integer(data: bytes, position: int) -> _Tuple[int, int]:
+    length, position = _read_size(data, position)
+    end = position + length
+    if end > len(data):
+        raise IndexError(end)
+    value = int.from_bytes(data[position:end], 'little')
+    return (-(value >> 1) if value & 1 else value >> 1), end
+
+
+def _read_size(data: bytes, position: int) -> _Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _read_stream_size(file: _BinaryIO) -> _Optional[int]:
+    result = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            if shift:
+                raise ValueError('Stream is truncated.')
+            return None
+        result |= (byte[0] & 0x7f) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+
+
+def _to_finite_non_zero(numerator: int,
+                        denominator: int) -> _FiniteNonZero:
+    if not numerator or denominator <= 0:
+        raise ValueError('Finite non-zero constant is invalid.')
+    return (_ONE
+            if numerator == denominator == 1
+            else _FiniteNonZero(_Fraction(numerator, denominator)))
+
+
+def _write_integer(block: bytearray, value: int) -> None:
+    # sign is stored in the lowest bit of the magnitude,
+    # which is stored with its bytes count
+    # to avoid quadratic variable-length encoding of large integers
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    length = (value.bit_length() + 7) // 8
+    _write_size(block, length)
+    block += value.to_bytes(length, 'little')
+
+
+def _write_record(block: bytearray, key: _Key) -> None:
+    tag = key[0]
+    block.append(tag)
+    if tag == _TERM_TAG or tag == _FINITE_NON_ZERO_TAG:
+        _write_integer(block, key[1])
+        for value in key[2:]:
+            _write_size(block, value)
+    elif tag == _FORM_TAG:
+        _write_size(block, key[1])
+        _write_size(block, len(key) - 2)
+        for value in key[2:]:
+            _write_size(block, value)
+    elif tag == _INFINITE_TAG:
+        block.append(key[1])
+
+
+def _write_size(block: bytearray, value: int) -> None:
+    while value >= 0x80:
+        block.append((value & 0x7f) | 0x80)
+        value >>= 7
+    block.append(value)
@@ -0,0 +1,12 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import (finite_expressions,
+                                         non_zero_finite_expressions,
+                                         reals_or_expressions_lists)
+
+finite_expressions_pairs = strategies.tuples(finite_expressions,
+                                             finite_expressions)
+finite_expressions = finite_expressions
+non_zero_finite_expressions = non_zero_finite_expressions
+precisions = strategies.none() | strategies.integers(-5, 20)
+reals_or_expressions_lists = reals_or_expressions_lists
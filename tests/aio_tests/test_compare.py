@@ -0,0 +1,30 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+from hypothesis import given
+
+from symba.aio import compare
+from symba.base import Expression
+from . import strategies
+
+
+@given(strategies.finite_expressions_pairs)
+def test_basic(pair: Tuple[Expression, Expression]) -> None:
+    left, right = pair
+
+    result = asyncio.run(compare(left, right))
+
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.finite_expressions_pairs)
+def test_connection_with_comparisons(pair: Tuple[Expression, Expression]
+                                     ) -> None:
+    left, right = pair
+
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(compare(left, right,
+                                     executor=executor))
+
+    assert result == (left > right) - (left < right)
@@ -0,0 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from hypothesis import given
+
+from symba.aio import divide
+from symba.base import Expression
+from . import strategies
+
+
+@given(strategies.finite_expressions,
+       strategies.non_zero_finite_expressions)
+def test_connection_with_division(dividend: Expression,
+                                  divisor: Expression) -> None:
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(divide(dividend, divisor,
+                                    executor=executor))
+
+    assert result == dividend / divisor
+
+
+@given(strategies.finite_expressions)
+def test_zero_divisor(dividend: Expression) -> None:
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(divide(dividend, 0))
@@ -0,0 +1,38 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from hypothesis import given
+
+from symba.aio import inverse
+from symba.base import (Expression,
+                        sqrt)
+from . import strategies
+
+
+@given(strategies.non_zero_finite_expressions)
+def test_connection_with_division(expression: Expression) -> None:
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(inverse(expression,
+                                     executor=executor))
+
+    assert result == 1 / expression
+
+
+def test_cancellation() -> None:
+    # takes dozens of seconds if not stopped
+    expression = sum(sqrt(prime)
+                     for prime in [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]) + 1
+
+    async def run() -> None:
+        task = asyncio.ensure_future(inverse(expression,
+                                             executor=executor))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await task
+
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run())
+        # the worker is free for new computations
+        assert executor.submit(sqrt, 2).result(timeout=10) == sqrt(2)
@@ -0,0 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from hypothesis import given
+
+from symba.aio import round_
+from symba.base import Expression
+from . import strategies
+
+
+@given(strategies.finite_expressions, strategies.precisions)
+def test_connection_with_round(expression: Expression,
+                               precision: Optional[int]) -> None:
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(round_(expression, precision,
+                                    executor=executor))
+
+    assert result == round(expression, precision)
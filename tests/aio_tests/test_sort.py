@@ -0,0 +1,34 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.aio import sort
+from symba.base import (Expression,
+                        sort as sequential_sort)
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_connection_with_sequential(values: List[Union[Real, Expression]]
+                                    ) -> None:
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(sort(values,
+                                  executor=executor))
+
+    assert all(element is expected
+               for element, expected in zip(result, sequential_sort(values)))
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_reverse(values: List[Union[Real, Expression]]) -> None:
+    result = asyncio.run(sort(values,
+                              reverse=True))
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sequential_sort(values,
+                                                            reverse=True)))
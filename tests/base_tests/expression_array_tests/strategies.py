@@ -0,0 +1,17 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import (degree_one_expressions,
+                                         degree_one_expressions_lists)
+from tests.strategies.base import finite_reals
+
+expressions_lists = degree_one_expressions_lists
+expressions_lists_pairs = strategies.integers(0, 5).flatmap(
+        lambda size: strategies.tuples(
+                *[strategies.lists(degree_one_expressions,
+                                   min_size=size,
+                                   max_size=size)] * 2
+        )
+)
+rationals = finite_reals
+bits_counts = strategies.integers(1, 128)
+slices = strategies.slices(10)
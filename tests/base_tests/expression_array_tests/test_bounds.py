@@ -0,0 +1,27 @@
+from typing import List
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists, strategies.bits_counts)
+def test_basic(expressions: List[Expression], bits: int) -> None:
+    result = ExpressionArray(expressions).bounds(bits)
+
+    assert len(result) == len(expressions)
+    assert all(lower <= expression <= upper
+               for (lower, upper), expression in zip(result, expressions))
+
+
+@given(strategies.expressions_lists, strategies.bits_counts)
+def test_refinement(expressions: List[Expression], bits: int) -> None:
+    array = ExpressionArray(expressions)
+
+    result = array.bounds(2 * bits)
+
+    assert all(lower <= refined_lower and refined_upper <= upper
+               for (lower, upper), (refined_lower, refined_upper)
+               in zip(array.bounds(bits), result))
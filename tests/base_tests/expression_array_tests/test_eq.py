@@ -0,0 +1,27 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists_pairs)
+def test_elementwise(pair: Tuple[List[Expression], List[Expression]]) -> None:
+    left, right = pair
+
+    result = ExpressionArray(left) == ExpressionArray(right)
+
+    assert result == [left_value == right_value
+                      for left_value, right_value in zip(left, right)]
+
+
+@given(strategies.expressions_lists)
+def test_reflexivity(expressions: List[Expression]) -> None:
+    array = ExpressionArray(expressions)
+
+    assert all(array == array)
+    assert all(array == ExpressionArray(expressions))
+    assert not any(array != ExpressionArray(expressions))
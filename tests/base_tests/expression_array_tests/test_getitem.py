@@ -0,0 +1,27 @@
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists)
+def test_index(expressions: List[Expression]) -> None:
+    array = ExpressionArray(expressions)
+
+    assert all(array[index] == expression
+               and array[index - len(expressions)] == expression
+               for index, expression in enumerate(expressions))
+    with pytest.raises(IndexError):
+        array[len(expressions)]
+
+
+@given(strategies.expressions_lists, strategies.slices)
+def test_slice(expressions: List[Expression], slice_: slice) -> None:
+    result = ExpressionArray(expressions)[slice_]
+
+    assert isinstance(result, ExpressionArray)
+    assert list(result) == expressions[slice_]
@@ -0,0 +1,18 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists_pairs)
+def test_elementwise(pair: Tuple[List[Expression], List[Expression]]) -> None:
+    left, right = pair
+
+    result = ExpressionArray(left) > ExpressionArray(right)
+
+    assert result == [left_value > right_value
+                      for left_value, right_value in zip(left, right)]
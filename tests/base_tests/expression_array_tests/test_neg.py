@@ -0,0 +1,23 @@
+from typing import List
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists)
+def test_basic(expressions: List[Expression]) -> None:
+    result = -ExpressionArray(expressions)
+
+    assert list(result) == [-expression for expression in expressions]
+
+
+@given(strategies.expressions_lists)
+def test_involution(expressions: List[Expression]) -> None:
+    array = ExpressionArray(expressions)
+
+    result = -(-array)
+
+    assert all(result == array)
@@ -0,0 +1,15 @@
+from typing import List
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from . import strategies
+
+
+@given(strategies.expressions_lists)
+def test_basic(expressions: List[Expression]) -> None:
+    result = ExpressionArray(expressions).signs()
+
+    assert result == [(expression > 0) - (expression < 0)
+                      for expression in expressions]
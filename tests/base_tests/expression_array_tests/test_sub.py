@@ -0,0 +1,39 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from symba.core.hints import RawFinite
+from . import strategies
+
+
+@given(strategies.expressions_lists_pairs)
+def test_elementwise(pair: Tuple[List[Expression], List[Expression]]) -> None:
+    left, right = pair
+
+    result = ExpressionArray(left) - ExpressionArray(right)
+
+    assert list(result) == [left_value - right_value
+                            for left_value, right_value in zip(left, right)]
+
+
+@given(strategies.expressions_lists)
+def test_self_inverse(expressions: List[Expression]) -> None:
+    array = ExpressionArray(expressions)
+
+    result = array - array
+
+    assert list(result) == [0] * len(expressions)
+
+
+@given(strategies.expressions_lists, strategies.rationals)
+def test_rational(expressions: List[Expression], rational: RawFinite) -> None:
+    result = ExpressionArray(expressions) - rational
+
+    assert list(result) == [expression - rational
+                            for expression in expressions]
+    assert list(rational - ExpressionArray(expressions)) == [
+        rational - expression for expression in expressions
+    ]
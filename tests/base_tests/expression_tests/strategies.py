@@ -1,10 +1,13 @@
-from operator import neg
+from operator import (add,
+                      mul,
+                      neg)
 
 from hypothesis import strategies
 
 from symba.base import sqrt
 from symba.core.constant import (ONE,
                                  ZERO)
+from symba.core.form import Form
 from tests.strategies.base import (finite_non_negative_reals,
                                    finite_non_zero_reals,
                                    finite_reals,
@@ -115,3 +118,7 @@ summable_expressions_triplets = (
                             finite_expressions | negative_infinite_expressions,
                             finite_expressions | negative_infinite_expressions)
 )
+quadratic_forms = strategies.builds(
+        add, non_zero_finite_reals,
+        strategies.builds(mul, non_zero_finite_reals, finite_square_roots)
+).filter(lambda expression: isinstance(expression, Form))
@@ -0,0 +1,66 @@
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sqrt)
+from symba.core.constant import (ONE,
+                                 FiniteNonZero)
+from symba.core.fingerprint import MODULI
+from symba.core.form import Form
+from symba.core.term import Term
+from tests.utils import (implication,
+                         pickle_round_trip)
+from . import strategies
+
+
+@given(strategies.expressions)
+def test_basic(expression: Expression) -> None:
+    result = expression.fingerprint()
+
+    assert isinstance(result, tuple)
+    assert all(isinstance(residue, int) for residue in result)
+    assert all(0 <= residue < modulus
+               for residue, modulus in zip(result, MODULI))
+
+
+@given(strategies.expressions)
+def test_determinism(expression: Expression) -> None:
+    result = expression.fingerprint()
+
+    assert result == expression.fingerprint()
+
+
+@given(strategies.expressions)
+def test_pickle(expression: Expression) -> None:
+    result = pickle_round_trip(expression)
+
+    assert result.fingerprint() == expression.fingerprint()
+
+
+@given(strategies.expressions, strategies.expressions)
+def test_connection_with_equality(left_expression: Expression,
+                                  right_expression: Expression) -> None:
+    assert implication(left_expression == right_expression,
+                       left_expression.fingerprint()
+                       == right_expression.fingerprint())
+
+
+@given(strategies.finite_expressions, strategies.finite_expressions)
+def test_commutative_sum(left_expression: Expression,
+                         right_expression: Expression) -> None:
+    result = (left_expression + right_expression).fingerprint()
+
+    assert result == (right_expression + left_expression).fingerprint()
+
+
+def test_structure_independence() -> None:
+    two, four = FiniteNonZero(2), FiniteNonZero(4)
+    square_root_of_eight = Term(ONE, FiniteNonZero(8))
+    doubled_square_root_of_two = Term(two, two)
+
+    assert (square_root_of_eight.fingerprint()
+            == doubled_square_root_of_two.fingerprint())
+    assert (Term(ONE, Form([square_root_of_eight], four)).fingerprint()
+            == Term(ONE, Form([doubled_square_root_of_two], four))
+            .fingerprint())
+    assert ((sqrt(2) * sqrt(2 + sqrt(2))).fingerprint()
+            == sqrt(4 + 2 * sqrt(2)).fingerprint())
@@ -0,0 +1,40 @@
+import math
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        approximate)
+from symba.core.constant import (Constant,
+                                 try_to_constant)
+from tests.strategies.base import reals
+from . import strategies
+
+
+@given(strategies.expressions)
+def test_basic(expression: Expression) -> None:
+    result = float(expression)
+
+    assert isinstance(result, float)
+
+
+@given(reals)
+def test_constants(value: float) -> None:
+    assert float(try_to_constant(value)) == float(value)
+
+
+@given(strategies.finite_square_roots)
+def test_square_roots(expression: Expression) -> None:
+    result = float(expression)
+
+    assert math.isclose(result, math.sqrt(float(expression.square())))
+
+
+@given(strategies.finite_square_roots)
+def test_evaluator(expression: Expression) -> None:
+    with approximate(math.log1p):
+        result = float(expression)
+
+    assert (result == float(expression)
+            if isinstance(expression, Constant)
+            else result == (float(expression.scale)
+                            * math.log1p(float(expression.argument))))
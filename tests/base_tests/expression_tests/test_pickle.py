@@ -1,6 +1,13 @@
+import pickle
+
 from hypothesis import given
 
 from symba.base import Expression
+from symba.core.form import Form
+from symba.core.term import Term
+from symba.core.constant import (ONE,
+                                 ZERO,
+                                 Infinity)
 from tests.utils import pickle_round_trip
 from . import strategies
 
@@ -8,3 +15,34 @@ from . import strategies
 @given(strategies.expressions)
 def test_round_trip(expression: Expression) -> None:
     assert pickle_round_trip(expression) == expression
+
+
+@given(strategies.expressions)
+def test_representation(expression: Expression) -> None:
+    assert repr(pickle_round_trip(expression)) == repr(expression)
+
+
+@given(strategies.expressions)
+def test_compactness(expression: Expression) -> None:
+    if isinstance(expression, (Form, Term)):
+        _, (data, arguments) = expression.__reduce__()
+
+        assert all(type(element) is int for element in data)
+        assert all(isinstance(argument, (Form, Term))
+                   for argument in arguments)
+
+
+def test_singletons() -> None:
+    assert pickle_round_trip(ZERO) is ZERO
+    assert pickle_round_trip(ONE) is ONE
+    assert pickle_round_trip(Infinity) is Infinity
+
+
+@given(strategies.expressions)
+def test_shared_singletons(expression: Expression) -> None:
+    result = pickle.loads(pickle.dumps([expression, ZERO, ONE, Infinity]))
+
+    assert result[1:] == [ZERO, ONE, Infinity]
+    assert all(element is singleton
+               for element, singleton in zip(result[1:],
+                                             [ZERO, ONE, Infinity]))
@@ -62,3 +62,10 @@ def test_zero_base_with_negative_exponent(expression: Expression,
                                           exponent: int) -> None:
     with pytest.raises(ZeroDivisionError):
         expression ** exponent
+
+
+@given(strategies.quadratic_forms, strategies.exponents)
+def test_quadratic_forms(expression: Expression, exponent: int) -> None:
+    result = expression ** exponent
+
+    assert repr(result) == repr(Expression.__pow__(expression, exponent))
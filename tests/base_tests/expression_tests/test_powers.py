@@ -0,0 +1,26 @@
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from . import strategies
+
+
+@given(strategies.expressions, strategies.non_negative_exponents)
+def test_basic(expression: Expression, exponent: int) -> None:
+    result = list(expression.powers(exponent))
+
+    assert len(result) == exponent + 1
+    assert all(isinstance(element, Expression) for element in result)
+
+
+@given(strategies.finite_expressions, strategies.non_negative_exponents)
+def test_connection_with_pow(expression: Expression, exponent: int) -> None:
+    result = list(expression.powers(exponent))
+
+    assert result == [expression ** index for index in range(exponent + 1)]
+
+
+@given(strategies.expressions, strategies.negative_exponents)
+def test_negative_exponent(expression: Expression, exponent: int) -> None:
+    with pytest.raises(ValueError):
+        expression.powers(exponent)
@@ -1,9 +1,12 @@
-from operator import neg
+from operator import (mul,
+                      neg)
 
 from hypothesis import strategies
 
-from symba.base import sqrt
+from symba.base import (fsum,
+                        sqrt)
 from tests.strategies.base import (finite_non_negative_reals,
+                                   finite_reals,
                                    negative_reals,
                                    non_negative_reals,
                                    positive_infinite_reals)
@@ -27,3 +30,63 @@ negative_reals_or_expressions = (negative_reals
                                     .map(abs).map(neg)))
 reals_or_expressions = (negative_reals_or_expressions
                         | non_negative_reals_or_expressions)
+reals_or_expressions_lists = strategies.lists(reals_or_expressions,
+                                              max_size=10)
+non_empty_reals_or_expressions_lists = strategies.lists(reals_or_expressions,
+                                                        min_size=1,
+                                                        max_size=10)
+counts = strategies.integers(-1, 12)
+non_negative_reals_or_expressions_lists = strategies.lists(
+        non_negative_reals_or_expressions,
+        max_size=10
+)
+finite_reals_or_expressions = finite_reals | finite_expressions
+finite_reals_or_expressions_lists = strategies.lists(
+        finite_reals_or_expressions,
+        max_size=10
+)
+finite_reals_or_expressions_pairs_lists = strategies.lists(
+        strategies.tuples(finite_reals_or_expressions,
+                          finite_reals_or_expressions),
+        max_size=10
+)
+small_integers = strategies.integers(-10, 10)
+small_square_roots = strategies.builds(mul, small_integers,
+                                       strategies.builds(
+                                               sqrt,
+                                               strategies.integers(0, 100)
+                                       ))
+many_small_integers_or_square_roots_lists = strategies.lists(
+        small_integers | small_square_roots,
+        min_size=20,
+        max_size=100
+)
+non_zero_finite_expressions = finite_expressions.filter(bool)
+exponents_lists = strategies.lists(strategies.integers(-10, 10),
+                                   max_size=5)
+non_negative_exponents_lists = strategies.lists(strategies.integers(0, 10),
+                                                max_size=5)
+expressions_lists = strategies.lists(expressions,
+                                     max_size=5)
+invalid_expressions_texts = strategies.sampled_from(['', 'sqrt(', 'sqrt(2',
+                                                     'sqrt(2) +', '1/0',
+                                                     '0 * sqrt(2)', 'sqrt(0)',
+                                                     'sqrt(2) ++ 1'])
+degree_one_scales = finite_reals | strategies.integers(-10 ** 30, 10 ** 30)
+degree_one_terms = strategies.builds(mul, degree_one_scales,
+                                     strategies.builds(
+                                             sqrt,
+                                             strategies.integers(0, 10 ** 25)
+                                     ))
+degree_one_expressions = strategies.builds(
+        fsum,
+        strategies.lists(degree_one_scales | degree_one_terms,
+                         max_size=5)
+)
+degree_one_expressions_lists = strategies.lists(degree_one_expressions,
+                                                max_size=10)
+bits_counts = strategies.integers(0, 128)
+degree_one_expressions_lists_pairs = strategies.tuples(
+        degree_one_expressions_lists,
+        degree_one_expressions_lists
+)
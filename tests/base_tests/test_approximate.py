@@ -0,0 +1,39 @@
+import math
+from numbers import Real
+from typing import Union
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        approximate,
+                        approximate_sqrt,
+                        sqrt)
+from tests.strategies.base import non_negative_reals
+from . import strategies
+
+
+@given(non_negative_reals)
+def test_evaluator(value: Real) -> None:
+    with approximate(float):
+        result = approximate_sqrt(value)
+
+    assert result == float(value)
+
+
+@given(strategies.non_negative_reals_or_expressions)
+def test_exactness(value: Union[Real, Expression]) -> None:
+    with approximate(float):
+        result = sqrt(value)
+
+    assert isinstance(result, Expression)
+    assert result == sqrt(value)
+
+
+@given(strategies.non_negative_reals_or_expressions)
+def test_exit(value: Union[Real, Expression]) -> None:
+    with approximate(float):
+        pass
+
+    result = approximate_sqrt(value)
+
+    assert result == math.sqrt(float(value))
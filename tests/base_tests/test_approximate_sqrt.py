@@ -0,0 +1,30 @@
+import math
+from numbers import Real
+from typing import Union
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        approximate_sqrt)
+from . import strategies
+
+
+@given(strategies.non_negative_reals_or_expressions)
+def test_basic(value: Union[Real, Expression]) -> None:
+    result = approximate_sqrt(value)
+
+    assert isinstance(result, float)
+
+
+@given(strategies.non_negative_reals_or_expressions)
+def test_value(value: Union[Real, Expression]) -> None:
+    result = approximate_sqrt(value)
+
+    assert result == math.sqrt(float(value))
+
+
+@given(strategies.negative_reals_or_expressions)
+def test_negative_argument(value: Union[Real, Expression]) -> None:
+    with pytest.raises(ValueError):
+        approximate_sqrt(value)
@@ -0,0 +1,41 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        bounds)
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists, strategies.bits_counts)
+def test_basic(values: List[Union[Real, Expression]], bits: int) -> None:
+    result = bounds(values, bits)
+
+    assert isinstance(result, list)
+    assert len(result) == len(values)
+    assert all(isinstance(value_bounds, tuple) and len(value_bounds) == 2
+               for value_bounds in result)
+
+
+@given(strategies.reals_or_expressions_lists, strategies.bits_counts)
+def test_value(values: List[Union[Real, Expression]], bits: int) -> None:
+    result = bounds(values, bits)
+
+    assert all(lower <= value <= upper
+               for (lower, upper), value in zip(result, values))
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_default_precision(values: List[Union[Real, Expression]]) -> None:
+    result = bounds(values)
+
+    assert result == bounds(values, 64)
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_invalid_bits(values: List[Union[Real, Expression]]) -> None:
+    with pytest.raises(ValueError):
+        bounds(values, -1)
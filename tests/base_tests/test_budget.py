@@ -0,0 +1,53 @@
+import pytest
+from hypothesis import given
+
+from symba.base import (BudgetExceeded,
+                        Expression,
+                        budget,
+                        sqrt)
+from . import strategies
+
+
+@given(strategies.non_zero_finite_expressions)
+def test_unlimited(expression: Expression) -> None:
+    with budget():
+        result = 1 / expression
+
+    assert result == 1 / expression
+
+
+@given(strategies.non_zero_finite_expressions)
+def test_sufficient(expression: Expression) -> None:
+    with budget(operations=10 ** 6,
+                seconds=3600):
+        result = 1 / expression
+
+    assert result == 1 / expression
+
+
+def test_operations_exceeded() -> None:
+    with pytest.raises(BudgetExceeded):
+        with budget(operations=0):
+            1 / (sqrt(2) + sqrt(3) + sqrt(5) + 1)
+
+
+def test_time_exceeded() -> None:
+    with pytest.raises(BudgetExceeded):
+        with budget(seconds=0):
+            1 / (sqrt(2) + sqrt(3) + sqrt(5) + sqrt(7) + 1)
+
+
+def test_nested() -> None:
+    with pytest.raises(BudgetExceeded):
+        with budget(operations=0):
+            with budget(operations=10 ** 6):
+                1 / (sqrt(2) + sqrt(3) + sqrt(5) + 1)
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError):
+        with budget(operations=-1):
+            pass
+    with pytest.raises(ValueError):
+        with budget(seconds=-1):
+            pass
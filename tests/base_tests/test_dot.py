@@ -0,0 +1,69 @@
+from numbers import Real
+from typing import (List,
+                    Tuple,
+                    Union)
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        dot,
+                        sqrt)
+from symba.core.constant import (ZERO,
+                                 try_to_constant)
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions_pairs_lists)
+def test_basic(pairs: List[Tuple[Union[Real, Expression],
+                                 Union[Real, Expression]]]) -> None:
+    left, right = [x for x, _ in pairs], [y for _, y in pairs]
+
+    result = dot(left, right)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.finite_reals_or_expressions_pairs_lists)
+def test_connection_with_sum_of_products(
+        pairs: List[Tuple[Union[Real, Expression], Union[Real, Expression]]]
+) -> None:
+    left, right = [x for x, _ in pairs], [y for _, y in pairs]
+
+    result = dot(left, right)
+
+    assert result == sum([x * y for x, y in pairs])
+
+
+@given(strategies.finite_reals_or_expressions_pairs_lists)
+def test_representation_of_sum_of_products(
+        pairs: List[Tuple[Union[Real, Expression], Union[Real, Expression]]]
+) -> None:
+    left, right = [x for x, _ in pairs], [y for _, y in pairs]
+
+    result = dot(left, right)
+
+    assert repr(result) == repr(sum([try_to_constant(x) * try_to_constant(y)
+                                     for x, y in pairs],
+                                    ZERO))
+
+
+def test_representation() -> None:
+    assert repr(dot([sqrt(2)], [sqrt(6)])) == repr(sqrt(2) * sqrt(6))
+
+
+@given(strategies.finite_reals_or_expressions_pairs_lists)
+def test_commutativity(
+        pairs: List[Tuple[Union[Real, Expression], Union[Real, Expression]]]
+) -> None:
+    left, right = [x for x, _ in pairs], [y for _, y in pairs]
+
+    assert dot(left, right) == dot(right, left)
+
+
+@given(strategies.finite_reals_or_expressions_lists,
+       strategies.finite_reals_or_expressions)
+def test_length_mismatch(values: List[Union[Real, Expression]],
+                         value: Union[Real, Expression]) -> None:
+    with pytest.raises(ValueError):
+        dot(values, values + [value])
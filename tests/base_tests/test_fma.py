@@ -0,0 +1,60 @@
+from numbers import Real
+from typing import Union
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        fma,
+                        sqrt)
+from symba.core.constant import try_to_constant
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_basic(first: Union[Real, Expression],
+               second: Union[Real, Expression],
+               third: Union[Real, Expression]) -> None:
+    result = fma(first, second, third)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_connection_with_mul_and_add(first: Union[Real, Expression],
+                                     second: Union[Real, Expression],
+                                     third: Union[Real, Expression]) -> None:
+    result = fma(first, second, third)
+
+    assert result == first * second + third
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_representation_of_mul_and_add(first: Union[Real, Expression],
+                                       second: Union[Real, Expression],
+                                       third: Union[Real, Expression]
+                                       ) -> None:
+    result = fma(first, second, third)
+
+    assert repr(result) == repr(try_to_constant(first)
+                                * try_to_constant(second)
+                                + try_to_constant(third))
+
+
+def test_representation() -> None:
+    assert (repr(fma(sqrt(2), sqrt(6), 1))
+            == repr(sqrt(2) * sqrt(6) + 1))
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_commutativity(first: Union[Real, Expression],
+                       second: Union[Real, Expression],
+                       third: Union[Real, Expression]) -> None:
+    assert fma(first, second, third) == fma(second, first, third)
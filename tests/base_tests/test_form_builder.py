@@ -0,0 +1,48 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        FormBuilder)
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_add(values: List[Union[Real, Expression]]) -> None:
+    builder = FormBuilder()
+
+    for value in values:
+        builder.add(value)
+
+    assert builder.build() == FormBuilder(values).build()
+
+
+@given(strategies.finite_reals_or_expressions_lists,
+       strategies.finite_reals_or_expressions)
+def test_iadd(values: List[Union[Real, Expression]],
+              value: Union[Real, Expression]) -> None:
+    builder = FormBuilder(values)
+
+    builder += value
+
+    assert builder.build() == FormBuilder(values + [value]).build()
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_build_idempotence(values: List[Union[Real, Expression]]) -> None:
+    builder = FormBuilder(values)
+
+    assert builder.build() == builder.build()
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_add_product(first: Union[Real, Expression],
+                     second: Union[Real, Expression]) -> None:
+    builder = FormBuilder()
+
+    builder.add_product(first, second)
+
+    assert builder.build() == first * second
@@ -0,0 +1,54 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        fsum,
+                        sqrt)
+from symba.core.constant import (ZERO,
+                                 try_to_constant)
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = fsum(values)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_connection_with_sum(values: List[Union[Real, Expression]]) -> None:
+    result = fsum(values)
+
+    assert result == sum(values)
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_permutation(values: List[Union[Real, Expression]]) -> None:
+    result = fsum(values)
+
+    assert result == fsum(values[::-1])
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_representation_of_sum(values: List[Union[Real, Expression]]
+                               ) -> None:
+    result = fsum(values)
+
+    assert repr(result) == repr(sum(map(try_to_constant, values), ZERO))
+
+
+@given(strategies.many_small_integers_or_square_roots_lists)
+def test_representation_of_long_sum(values: List[Union[int, Expression]]
+                                    ) -> None:
+    result = fsum(values)
+
+    assert repr(result) == repr(sum(map(try_to_constant, values), ZERO))
+
+
+def test_representation() -> None:
+    assert repr(fsum([sqrt(12), 1])) == repr(sqrt(12) + 1)
+    assert repr(fsum([sqrt(2), sqrt(8)])) == repr(sqrt(2) + sqrt(8))
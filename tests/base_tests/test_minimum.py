@@ -0,0 +1,38 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        minimum)
+from . import strategies
+
+
+@given(strategies.non_empty_reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = minimum(values)
+
+    assert any(result is value for value in values)
+
+
+@given(strategies.non_empty_reals_or_expressions_lists)
+def test_value(values: List[Union[Real, Expression]]) -> None:
+    result = minimum(values)
+
+    assert all(result <= value for value in values)
+
+
+@given(strategies.non_empty_reals_or_expressions_lists)
+def test_connection_with_builtin(
+        values: List[Union[Real, Expression]]
+) -> None:
+    result = minimum(values)
+
+    assert result is min(values)
+
+
+def test_empty() -> None:
+    with pytest.raises(ValueError):
+        minimum([])
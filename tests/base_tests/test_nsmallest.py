@@ -0,0 +1,27 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        nsmallest)
+from . import strategies
+
+
+@given(strategies.counts, strategies.reals_or_expressions_lists)
+def test_basic(count: int, values: List[Union[Real, Expression]]) -> None:
+    result = nsmallest(count, values)
+
+    assert isinstance(result, list)
+    assert len(result) == max(min(count, len(values)), 0)
+
+
+@given(strategies.counts, strategies.reals_or_expressions_lists)
+def test_connection_with_sorted(count: int,
+                                values: List[Union[Real, Expression]]) -> None:
+    result = nsmallest(count, values)
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sorted(values)))
@@ -0,0 +1,26 @@
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        parse)
+from . import strategies
+
+
+@given(strategies.expressions)
+def test_round_trip(expression: Expression) -> None:
+    result = parse(str(expression))
+
+    assert result == expression
+
+
+@given(strategies.expressions)
+def test_representation(expression: Expression) -> None:
+    result = parse(str(expression))
+
+    assert repr(result) == repr(expression)
+
+
+@given(strategies.invalid_expressions_texts)
+def test_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse(text)
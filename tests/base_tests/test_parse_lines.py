@@ -0,0 +1,18 @@
+import io
+from typing import List
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        parse_lines)
+from . import strategies
+
+
+@given(strategies.expressions_lists)
+def test_round_trip(expressions: List[Expression]) -> None:
+    lines = io.StringIO(''.join(f'{expression}\n\n'
+                                for expression in expressions))
+
+    result = list(parse_lines(lines))
+
+    assert result == expressions
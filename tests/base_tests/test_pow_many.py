@@ -0,0 +1,46 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        pow_many)
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.non_negative_exponents_lists)
+def test_basic(base: Union[Real, Expression], exponents: List[int]) -> None:
+    result = pow_many(base, exponents)
+
+    assert isinstance(result, list)
+    assert len(result) == len(exponents)
+    assert all(isinstance(element, Expression) for element in result)
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.non_negative_exponents_lists)
+def test_connection_with_pow(base: Union[Real, Expression],
+                             exponents: List[int]) -> None:
+    result = pow_many(base, exponents)
+
+    assert result == [base ** exponent for exponent in exponents]
+
+
+@given(strategies.non_zero_finite_expressions,
+       strategies.exponents_lists)
+def test_negative_exponents(base: Expression, exponents: List[int]) -> None:
+    result = pow_many(base, exponents)
+
+    assert result == [base ** exponent for exponent in exponents]
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.non_negative_exponents_lists)
+def test_duplicates(base: Union[Real, Expression],
+                    exponents: List[int]) -> None:
+    result = pow_many(base, exponents + exponents)
+
+    assert all(element is duplicate
+               for element, duplicate in zip(result, result[len(exponents):]))
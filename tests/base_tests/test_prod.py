@@ -0,0 +1,48 @@
+from functools import reduce
+from numbers import Real
+from operator import mul
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        prod,
+                        sqrt)
+from symba.core.constant import try_to_constant
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = prod(values)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_connection_with_mul(values: List[Union[Real, Expression]]) -> None:
+    result = prod(values)
+
+    assert result == reduce(mul, values, 1)
+
+
+@given(strategies.finite_reals_or_expressions,
+       strategies.finite_reals_or_expressions)
+def test_representation_of_mul(first: Union[Real, Expression],
+                               second: Union[Real, Expression]) -> None:
+    result = prod([first, second])
+
+    assert repr(result) == repr(try_to_constant(first)
+                                * try_to_constant(second))
+
+
+def test_representation() -> None:
+    assert repr(prod([sqrt(2), sqrt(6)])) == repr(sqrt(2) * sqrt(6))
+
+
+@given(strategies.finite_reals_or_expressions_lists)
+def test_streaming(values: List[Union[Real, Expression]]) -> None:
+    result = prod(iter(values))
+
+    assert result == prod(values)
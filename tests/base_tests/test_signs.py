@@ -0,0 +1,26 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        signs)
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = signs(values)
+
+    assert isinstance(result, list)
+    assert len(result) == len(values)
+    assert all(sign in (-1, 0, 1) for sign in result)
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_value(values: List[Union[Real, Expression]]) -> None:
+    result = signs(values)
+
+    assert all(sign == (value > 0) - (value < 0)
+               for sign, value in zip(result, values))
@@ -0,0 +1,44 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sort)
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = sort(values)
+
+    assert isinstance(result, list)
+    assert len(result) == len(values)
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_order(values: List[Union[Real, Expression]]) -> None:
+    result = sort(values)
+
+    assert all(element <= next_element
+               for element, next_element in zip(result, result[1:]))
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_stability(values: List[Union[Real, Expression]]) -> None:
+    result = sort(values)
+
+    assert all(element is expected
+               for element, expected in zip(result, sorted(values)))
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_reverse(values: List[Union[Real, Expression]]) -> None:
+    result = sort(values,
+                  reverse=True)
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sorted(values,
+                                                   reverse=True)))
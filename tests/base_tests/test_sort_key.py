@@ -0,0 +1,56 @@
+import bisect
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sort,
+                        sort_key)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.reals_or_expressions, strategies.reals_or_expressions)
+def test_connection_with_lt(
+        first: Union[Real, Expression],
+        second: Union[Real, Expression]
+) -> None:
+    assert equivalence(sort_key(first) < sort_key(second), first < second)
+
+
+@given(strategies.reals_or_expressions, strategies.reals_or_expressions)
+def test_connection_with_le(
+        first: Union[Real, Expression],
+        second: Union[Real, Expression]
+) -> None:
+    assert equivalence(sort_key(first) <= sort_key(second), first <= second)
+
+
+@given(strategies.reals_or_expressions, strategies.reals_or_expressions)
+def test_connection_with_gt(
+        first: Union[Real, Expression],
+        second: Union[Real, Expression]
+) -> None:
+    assert equivalence(sort_key(first) > sort_key(second), first > second)
+
+
+@given(strategies.reals_or_expressions, strategies.reals_or_expressions)
+def test_connection_with_ge(
+        first: Union[Real, Expression],
+        second: Union[Real, Expression]
+) -> None:
+    assert equivalence(sort_key(first) >= sort_key(second), first >= second)
+
+
+@given(strategies.reals_or_expressions_lists,
+       strategies.reals_or_expressions)
+def test_bisect(values: List[Union[Real, Expression]],
+                value: Union[Real, Expression]) -> None:
+    keys = [sort_key(element) for element in sort(values)]
+
+    result = bisect.bisect_left(keys, sort_key(value))
+
+    assert all(key.expression < value for key in keys[:result])
+    assert all(key.expression >= value for key in keys[result:])
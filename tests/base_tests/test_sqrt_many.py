@@ -0,0 +1,45 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sqrt,
+                        sqrt_many)
+from . import strategies
+
+
+@given(strategies.non_negative_reals_or_expressions_lists)
+def test_basic(values: List[Union[Real, Expression]]) -> None:
+    result = sqrt_many(values)
+
+    assert isinstance(result, list)
+    assert all(isinstance(element, Expression) for element in result)
+    assert len(result) == len(values)
+
+
+@given(strategies.non_negative_reals_or_expressions_lists)
+def test_connection_with_sqrt(values: List[Union[Real, Expression]]
+                              ) -> None:
+    result = sqrt_many(values)
+
+    assert result == [sqrt(value) for value in values]
+    assert list(map(repr, result)) == [repr(sqrt(value)) for value in values]
+
+
+@given(strategies.non_negative_reals_or_expressions_lists)
+def test_duplicates(values: List[Union[Real, Expression]]) -> None:
+    result = sqrt_many(values + values)
+
+    assert all(element is duplicate
+               for element, duplicate in zip(result, result[len(values):]))
+
+
+@given(strategies.non_negative_reals_or_expressions_lists,
+       strategies.negative_reals_or_expressions)
+def test_negative_argument(values: List[Union[Real, Expression]],
+                           negative_value: Union[Real, Expression]) -> None:
+    with pytest.raises(ValueError):
+        sqrt_many(values + [negative_value])
@@ -0,0 +1,62 @@
+from numbers import Real
+from typing import (List,
+                    Tuple,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        ExpressionArray)
+from symba.core.utils import sqrt_floor
+from tests.utils import run_concurrently
+from . import strategies
+
+
+@given(strategies.finite_reals_or_expressions_pairs_lists)
+def test_mixed_arithmetic(
+        pairs: List[Tuple[Union[Real, Expression], Union[Real, Expression]]]
+) -> None:
+    def compute() -> List[Tuple[Union[Real, Expression], ...]]:
+        return [(left + right, left - right, left * right, abs(left),
+                 left < right, left == right)
+                for left, right in pairs]
+
+    expected = compute()
+
+    results = run_concurrently(compute)
+
+    assert all(result == expected for result in results)
+
+
+@given(strategies.degree_one_expressions_lists_pairs)
+def test_shared_kernels(
+        lists_pair: Tuple[List[Expression], List[Expression]]
+) -> None:
+    left, right = lists_pair
+    size = min(len(left), len(right))
+    left, right = left[:size], right[:size]
+    kernels = ExpressionArray().kernels
+
+    def compute() -> Tuple[List[Expression], List[int]]:
+        products = (ExpressionArray(left, kernels)
+                    * ExpressionArray(right, kernels))
+        return list(products), products.signs()
+
+    expected = ([left_value * right_value
+                 for left_value, right_value in zip(left, right)],
+                [(value > 0) - (value < 0)
+                 for value in (left_value * right_value
+                               for left_value, right_value in zip(left,
+                                                                  right))])
+
+    results = run_concurrently(compute)
+
+    assert all(result == expected for result in results)
+    assert all(not _are_in_same_square_class(kernel, other_kernel)
+               for index, kernel in enumerate(kernels.kernels)
+               for other_kernel in kernels.kernels[index + 1:])
+
+
+def _are_in_same_square_class(kernel: int, other_kernel: int) -> bool:
+    product = kernel * other_kernel
+    return sqrt_floor(product) ** 2 == product
@@ -0,0 +1,43 @@
+import math
+from fractions import Fraction
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import (Expression,
+                        to_numpy)
+from . import strategies
+
+pytest.importorskip('numpy')
+
+
+@given(strategies.expressions_lists)
+def test_basic(expressions: List[Expression]) -> None:
+    result = to_numpy(expressions)
+
+    assert result.dtype.name == 'float64'
+    assert result.shape == (len(expressions),)
+
+
+@given(strategies.expressions_lists)
+def test_errors_bounds(expressions: List[Expression]) -> None:
+    values, errors = to_numpy(expressions,
+                              with_errors=True)
+
+    assert all(value == float(expression)
+               if math.isinf(value)
+               else (abs(expression - Fraction(value)) <= Fraction(error))
+               for value, error, expression in zip(values.tolist(),
+                                                   errors.tolist(),
+                                                   expressions))
+
+
+@given(strategies.expressions_lists)
+def test_accuracy(expressions: List[Expression]) -> None:
+    result = to_numpy(expressions)
+
+    assert all(math.isclose(value, float(expression),
+                            rel_tol=1e-12,
+                            abs_tol=1e-12)
+               for value, expression in zip(result.tolist(), expressions))
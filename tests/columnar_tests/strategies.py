@@ -0,0 +1,8 @@
+from tests.base_tests.strategies import (degree_one_expressions_lists,
+                                         finite_expressions,
+                                         infinite_expressions)
+
+unsupported_expressions = (
+        finite_expressions.filter(lambda expression: expression.degree > 1)
+        | infinite_expressions
+)
@@ -0,0 +1,55 @@
+import os
+import tempfile
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.columnar import (ColumnarStore,
+                            dump)
+from . import strategies
+from .utils import to_store
+
+
+@given(strategies.degree_one_expressions_lists)
+def test_round_trip(expressions: List[Expression]) -> None:
+    with to_store(expressions) as store:
+        result = list(store)
+
+    assert result == expressions
+
+
+@given(strategies.degree_one_expressions_lists)
+def test_representation(expressions: List[Expression]) -> None:
+    with to_store(expressions) as store:
+        result = list(store)
+
+    assert list(map(repr, result)) == list(map(repr, expressions))
+
+
+@given(strategies.degree_one_expressions_lists)
+def test_indexing(expressions: List[Expression]) -> None:
+    with to_store(expressions) as store:
+        assert len(store) == len(expressions)
+        assert all(store[index] == expressions[index]
+                   and store[index - len(expressions)] == expressions[index]
+                   for index in range(len(expressions)))
+        with pytest.raises(IndexError):
+            store[len(expressions)]
+
+
+@given(strategies.unsupported_expressions)
+def test_unsupported(expression: Expression) -> None:
+    with tempfile.TemporaryFile() as file:
+        with pytest.raises(ValueError):
+            dump([expression], file)
+
+
+def test_invalid_file() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'store.bin')
+        with open(path, 'wb') as file:
+            file.write(b'not a columnar store')
+        with pytest.raises(ValueError):
+            ColumnarStore(path)
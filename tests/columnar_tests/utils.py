@@ -0,0 +1,19 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import (Iterator,
+                    List)
+
+from symba.base import Expression
+from symba.columnar import (ColumnarStore,
+                            dump)
+
+
+@contextmanager
+def to_store(expressions: List[Expression]) -> Iterator[ColumnarStore]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'store.bin')
+        with open(path, 'wb') as file:
+            dump(expressions, file)
+        with ColumnarStore(path) as store:
+            yield store
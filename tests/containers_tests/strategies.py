@@ -0,0 +1,6 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import reals_or_expressions
+
+reals_or_expressions_lists = strategies.lists(reals_or_expressions,
+                                              max_size=10)
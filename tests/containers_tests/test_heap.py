@@ -0,0 +1,46 @@
+import builtins
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.containers import Heap
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_order(values: List[Union[Real, Expression]]) -> None:
+    heap = Heap((value, index) for index, value in enumerate(values))
+
+    result = [heap.pop() for _ in range(len(heap))]
+
+    assert not heap
+    assert [priority for priority, _ in result] == builtins.sorted(values)
+    assert builtins.sorted(index for _, index in result) == list(
+            range(len(values))
+    )
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_push(values: List[Union[Real, Expression]]) -> None:
+    heap: Heap[None] = Heap()
+
+    for value in values:
+        heap.push(value)
+
+    assert len(heap) == len(values)
+    assert [heap.pop()[0] for _ in range(len(heap))] == builtins.sorted(values)
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_statistics(values: List[Union[Real, Expression]]) -> None:
+    heap = Heap((value, None) for value in values)
+
+    while heap:
+        heap.pop()
+
+    assert heap.statistics.exact >= 0
+    assert heap.statistics.interval >= 0
+    assert 0 <= heap.statistics.exact_ratio <= 1
@@ -0,0 +1,57 @@
+import builtins
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.containers import SortedList
+from tests.base_tests.strategies import reals_or_expressions
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists)
+def test_order(values: List[Union[Real, Expression]]) -> None:
+    result = SortedList(values)
+
+    assert list(result) == builtins.sorted(values)
+    assert list(reversed(result)) == builtins.sorted(values,
+                                                     reverse=True)
+
+
+@given(strategies.reals_or_expressions_lists, reals_or_expressions)
+def test_add(values: List[Union[Real, Expression]],
+             value: Union[Real, Expression]) -> None:
+    result = SortedList(values)
+
+    result.add(value)
+
+    assert value in result
+    assert list(result) == builtins.sorted([*values, value])
+
+
+@given(strategies.reals_or_expressions_lists, reals_or_expressions)
+def test_bisect(values: List[Union[Real, Expression]],
+                value: Union[Real, Expression]) -> None:
+    result = SortedList(values)
+
+    left_index = result.bisect_left(value)
+    right_index = result.bisect_right(value)
+
+    assert left_index <= right_index
+    assert all(element < value for element in result[:left_index])
+    assert all(element == value
+               for element in result[left_index:right_index])
+    assert all(element > value for element in result[right_index:])
+
+
+@given(strategies.reals_or_expressions_lists, reals_or_expressions)
+def test_remove(values: List[Union[Real, Expression]],
+                value: Union[Real, Expression]) -> None:
+    result = SortedList([*values, value])
+
+    result.remove(value)
+
+    assert len(result) == len(values)
+    assert list(result) == builtins.sorted(values)
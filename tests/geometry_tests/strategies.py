@@ -0,0 +1,21 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import finite_square_roots
+from tests.strategies.base import finite_reals
+
+dimensions = strategies.integers(0, 3)
+rational_coordinates = finite_reals
+rational_vectors = strategies.lists(rational_coordinates,
+                                    max_size=3)
+vectors = strategies.lists(finite_reals | finite_square_roots,
+                           max_size=3)
+rational_points_lists = dimensions.flatmap(
+        lambda dimension: strategies.lists(
+                strategies.lists(rational_coordinates,
+                                 min_size=dimension,
+                                 max_size=dimension),
+                max_size=8
+        )
+)
+coordinates = finite_reals | finite_square_roots
+points = strategies.tuples(coordinates, coordinates)
@@ -0,0 +1,38 @@
+from numbers import Real
+from typing import List
+
+from hypothesis import given
+
+from symba.geometry import (DistanceMatrix,
+                            hypot)
+from . import strategies
+
+
+@given(strategies.rational_points_lists)
+def test_basic(points: List[List[Real]]) -> None:
+    result = DistanceMatrix(points)
+
+    assert len(result) == len(points)
+    assert all(len(row) == len(points) for row in result)
+
+
+@given(strategies.rational_points_lists)
+def test_symmetry(points: List[List[Real]]) -> None:
+    result = DistanceMatrix(points)
+
+    assert all(result[row_index, column_index]
+               is result[column_index, row_index]
+               for row_index in range(len(points))
+               for column_index in range(len(points)))
+
+
+@given(strategies.rational_points_lists)
+def test_connection_with_hypot(points: List[List[Real]]) -> None:
+    result = DistanceMatrix(points)
+
+    assert all(result[row_index, column_index]
+               == hypot(*[coordinate - other_coordinate
+                          for coordinate, other_coordinate
+                          in zip(point, other_point)])
+               for row_index, point in enumerate(points)
+               for column_index, other_point in enumerate(points))
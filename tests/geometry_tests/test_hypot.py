@@ -0,0 +1,42 @@
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sqrt)
+from symba.geometry import hypot
+from . import strategies
+
+
+@given(strategies.vectors)
+def test_basic(coordinates: List[Union[Real, Expression]]) -> None:
+    result = hypot(*coordinates)
+
+    assert isinstance(result, Expression)
+    assert result >= 0
+
+
+@given(strategies.vectors)
+def test_connection_with_sqrt(coordinates: List[Union[Real, Expression]]
+                              ) -> None:
+    result = hypot(*coordinates)
+
+    assert result == sqrt(sum([coordinate * coordinate
+                               for coordinate in coordinates]))
+
+
+@given(strategies.rational_vectors)
+def test_interning(coordinates: List[Real]) -> None:
+    result = hypot(*coordinates)
+
+    assert result is hypot(*coordinates[::-1]) or not coordinates
+
+
+@given(strategies.rational_vectors)
+def test_representation(coordinates: List[Real]) -> None:
+    result = hypot(*coordinates)
+
+    assert repr(result) == repr(sqrt(sum([coordinate * coordinate
+                                          for coordinate in coordinates])))
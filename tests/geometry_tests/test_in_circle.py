@@ -0,0 +1,55 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.geometry import in_circle
+from . import strategies
+from .utils import to_exact_in_circle
+
+Point = Tuple[Expression, Expression]
+
+
+@given(strategies.points, strategies.points, strategies.points,
+       strategies.points)
+def test_basic(first_vertex: Point,
+               second_vertex: Point,
+               third_vertex: Point,
+               point: Point) -> None:
+    result = in_circle(first_vertex, second_vertex, third_vertex, point)
+
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.points, strategies.points, strategies.points,
+       strategies.points)
+def test_connection_with_exact(first_vertex: Point,
+                               second_vertex: Point,
+                               third_vertex: Point,
+                               point: Point) -> None:
+    result = in_circle(first_vertex, second_vertex, third_vertex, point)
+
+    assert result == to_exact_in_circle(first_vertex, second_vertex,
+                                        third_vertex, point)
+
+
+@given(strategies.points, strategies.points, strategies.points,
+       strategies.points)
+def test_antisymmetry(first_vertex: Point,
+                      second_vertex: Point,
+                      third_vertex: Point,
+                      point: Point) -> None:
+    result = in_circle(first_vertex, second_vertex, third_vertex, point)
+
+    assert result == -in_circle(second_vertex, first_vertex, third_vertex,
+                                point)
+
+
+@given(strategies.points, strategies.points, strategies.points)
+def test_degenerate(first_vertex: Point,
+                    second_vertex: Point,
+                    third_vertex: Point) -> None:
+    result = in_circle(first_vertex, second_vertex, third_vertex,
+                       first_vertex)
+
+    assert result == 0
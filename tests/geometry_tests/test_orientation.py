@@ -0,0 +1,53 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.geometry import (orientation,
+                            predicates_statistics)
+from . import strategies
+from .utils import to_exact_orientation
+
+Point = Tuple[Expression, Expression]
+
+
+@given(strategies.points, strategies.points, strategies.points)
+def test_basic(vertex: Point,
+               first_ray_point: Point,
+               second_ray_point: Point) -> None:
+    result = orientation(vertex, first_ray_point, second_ray_point)
+
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.points, strategies.points, strategies.points)
+def test_connection_with_exact(vertex: Point,
+                               first_ray_point: Point,
+                               second_ray_point: Point) -> None:
+    result = orientation(vertex, first_ray_point, second_ray_point)
+
+    assert result == to_exact_orientation(vertex, first_ray_point,
+                                          second_ray_point)
+
+
+@given(strategies.points, strategies.points, strategies.points)
+def test_antisymmetry(vertex: Point,
+                      first_ray_point: Point,
+                      second_ray_point: Point) -> None:
+    result = orientation(vertex, first_ray_point, second_ray_point)
+
+    assert result == -orientation(vertex, second_ray_point, first_ray_point)
+
+
+@given(strategies.points, strategies.points)
+def test_degenerate(vertex: Point, ray_point: Point) -> None:
+    vertex_x, vertex_y = vertex
+    ray_point_x, ray_point_y = ray_point
+    collinear_point = (2 * ray_point_x - vertex_x,
+                       2 * ray_point_y - vertex_y)
+    exact_count = predicates_statistics.exact
+
+    result = orientation(vertex, ray_point, collinear_point)
+
+    assert result == 0
+    assert predicates_statistics.exact - exact_count in (0, 1)
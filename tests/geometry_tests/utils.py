@@ -0,0 +1,37 @@
+from typing import Sequence
+
+from symba.base import Expression
+
+
+def to_sign(value: Expression) -> int:
+    return (value > 0) - (value < 0)
+
+
+def to_exact_orientation(vertex: Sequence[Expression],
+                         first_ray_point: Sequence[Expression],
+                         second_ray_point: Sequence[Expression]) -> int:
+    vertex_x, vertex_y = vertex
+    first_x, first_y = first_ray_point
+    second_x, second_y = second_ray_point
+    return to_sign((first_x - vertex_x) * (second_y - vertex_y)
+                   - (first_y - vertex_y) * (second_x - vertex_x))
+
+
+def to_exact_in_circle(first_vertex: Sequence[Expression],
+                       second_vertex: Sequence[Expression],
+                       third_vertex: Sequence[Expression],
+                       point: Sequence[Expression]) -> int:
+    point_x, point_y = point
+    ((first_dx, first_dy, first_lifted),
+     (second_dx, second_dy, second_lifted),
+     (third_dx, third_dy, third_lifted)) = [
+        (x - point_x, y - point_y,
+         (x - point_x) * (x - point_x) + (y - point_y) * (y - point_y))
+        for x, y in (first_vertex, second_vertex, third_vertex)
+    ]
+    return to_sign(first_dx * (second_dy * third_lifted
+                               - second_lifted * third_dy)
+                   - first_dy * (second_dx * third_lifted
+                                 - second_lifted * third_dx)
+                   + first_lifted * (second_dx * third_dy
+                                     - second_dy * third_dx))
@@ -0,0 +1,42 @@
+from operator import add
+
+from hypothesis import strategies
+
+from symba.base import sqrt
+
+small_integers = strategies.integers(-5, 5)
+radicals = strategies.builds(sqrt, strategies.sampled_from([2, 3, 5]))
+entries = (small_integers
+           | strategies.builds(add,
+                               small_integers,
+                               strategies.builds(lambda scale, radical:
+                                                 scale * radical,
+                                                 small_integers,
+                                                 radicals)))
+sizes = strategies.integers(0, 3)
+square_matrices = sizes.flatmap(
+        lambda size: strategies.lists(strategies.lists(entries,
+                                                       min_size=size,
+                                                       max_size=size),
+                                      min_size=size,
+                                      max_size=size)
+)
+matrices = strategies.tuples(sizes, sizes).flatmap(
+        lambda shape: strategies.lists(strategies.lists(entries,
+                                                        min_size=shape[1],
+                                                        max_size=shape[1]),
+                                       min_size=shape[0],
+                                       max_size=shape[0])
+)
+square_matrices_with_vectors = sizes.flatmap(
+        lambda size: strategies.tuples(
+                strategies.lists(strategies.lists(entries,
+                                                  min_size=size,
+                                                  max_size=size),
+                                 min_size=size,
+                                 max_size=size),
+                strategies.lists(entries,
+                                 min_size=size,
+                                 max_size=size)
+        )
+)
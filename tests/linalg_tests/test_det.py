@@ -0,0 +1,31 @@
+from typing import List
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.linalg import det
+from . import strategies
+from .utils import to_minor
+
+
+@given(strategies.square_matrices)
+def test_basic(matrix: List[List[Expression]]) -> None:
+    result = det(matrix)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.square_matrices)
+def test_laplace_expansion(matrix: List[List[Expression]]) -> None:
+    result = det(matrix)
+
+    assert result == (sum([(-1) ** column * value
+                           * det(to_minor(matrix, 0, column))
+                           for column, value in enumerate(matrix[0])])
+                      if matrix
+                      else 1)
+
+
+@given(strategies.square_matrices)
+def test_transpose(matrix: List[List[Expression]]) -> None:
+    assert det(matrix) == det([list(column) for column in zip(*matrix)])
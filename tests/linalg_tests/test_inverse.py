@@ -0,0 +1,33 @@
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.linalg import (det,
+                          inverse)
+from . import strategies
+from .utils import (multiply_matrices,
+                    to_identity_matrix)
+
+
+@given(strategies.square_matrices)
+def test_basic(matrix: List[List[Expression]]) -> None:
+    if det(matrix):
+        result = inverse(matrix)
+
+        assert isinstance(result, list)
+        assert len(result) == len(matrix)
+    else:
+        with pytest.raises(ValueError):
+            inverse(matrix)
+
+
+@given(strategies.square_matrices)
+def test_round_trip(matrix: List[List[Expression]]) -> None:
+    if det(matrix):
+        result = inverse(matrix)
+
+        assert (multiply_matrices(matrix, result)
+                == multiply_matrices(result, matrix)
+                == to_identity_matrix(len(matrix)))
@@ -0,0 +1,26 @@
+from typing import List
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.linalg import (det,
+                          rank)
+from . import strategies
+
+
+@given(strategies.matrices)
+def test_basic(matrix: List[List[Expression]]) -> None:
+    result = rank(matrix)
+
+    assert isinstance(result, int)
+    assert 0 <= result <= min(len(matrix), len(matrix[0]) if matrix else 0)
+
+
+@given(strategies.matrices)
+def test_transpose(matrix: List[List[Expression]]) -> None:
+    assert rank(matrix) == rank([list(column) for column in zip(*matrix)])
+
+
+@given(strategies.square_matrices)
+def test_connection_with_det(matrix: List[List[Expression]]) -> None:
+    assert (rank(matrix) == len(matrix)) is bool(det(matrix))
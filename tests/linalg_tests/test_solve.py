@@ -0,0 +1,39 @@
+from typing import (List,
+                    Tuple)
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.linalg import (det,
+                          solve)
+from . import strategies
+from .utils import multiply_matrices
+
+
+@given(strategies.square_matrices_with_vectors)
+def test_basic(matrix_with_vector: Tuple[List[List[Expression]],
+                                         List[Expression]]) -> None:
+    matrix, vector = matrix_with_vector
+
+    if det(matrix):
+        result = solve(matrix, vector)
+
+        assert isinstance(result, list)
+        assert all(isinstance(element, Expression) for element in result)
+        assert len(result) == len(vector)
+    else:
+        with pytest.raises(ValueError):
+            solve(matrix, vector)
+
+
+@given(strategies.square_matrices_with_vectors)
+def test_solution(matrix_with_vector: Tuple[List[List[Expression]],
+                                            List[Expression]]) -> None:
+    matrix, vector = matrix_with_vector
+
+    if det(matrix):
+        result = solve(matrix, vector)
+
+        assert (multiply_matrices(matrix, [[value] for value in result])
+                == [[value] for value in vector])
@@ -0,0 +1,28 @@
+from typing import (List,
+                    Sequence)
+
+from symba.base import Expression
+
+
+def multiply_matrices(left: Sequence[Sequence[Expression]],
+                      right: Sequence[Sequence[Expression]]
+                      ) -> List[List[Expression]]:
+    return [[sum([left_row[index] * right[index][column]
+                  for index in range(len(right))])
+             for column in range(len(right[0]) if right else 0)]
+            for left_row in left]
+
+
+def to_identity_matrix(size: int) -> List[List[int]]:
+    return [[int(row == column) for column in range(size)]
+            for row in range(size)]
+
+
+def to_minor(matrix: Sequence[Sequence[Expression]],
+             row: int,
+             column: int) -> List[List[Expression]]:
+    return [[value
+             for value_column, value in enumerate(matrix_row)
+             if value_column != column]
+            for matrix_row_index, matrix_row in enumerate(matrix)
+            if matrix_row_index != row]
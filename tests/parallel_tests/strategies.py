@@ -0,0 +1,23 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import (finite_expressions,
+                                         reals_or_expressions_lists,
+                                         small_square_roots)
+
+chunk_sizes = strategies.integers(1, 4)
+finite_expressions_lists = strategies.lists(finite_expressions,
+                                            max_size=10)
+non_empty_finite_expressions_lists = strategies.lists(finite_expressions,
+                                                      min_size=1,
+                                                      max_size=10)
+reals_or_expressions_lists = reals_or_expressions_lists
+finite_expressions_pairs = strategies.tuples(finite_expressions,
+                                             finite_expressions)
+small_square_roots_sums = strategies.builds(
+        sum,
+        strategies.lists(small_square_roots,
+                         max_size=5)
+)
+small_square_roots_sums_pairs = strategies.tuples(small_square_roots_sums,
+                                                  small_square_roots_sums)
+thresholds = strategies.integers(1, 10)
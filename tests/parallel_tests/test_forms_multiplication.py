@@ -0,0 +1,54 @@
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.parallel import forms_multiplication
+from . import strategies
+
+
+@given(strategies.finite_expressions_pairs, strategies.thresholds)
+def test_basic(expressions_pair: Tuple[Expression, Expression],
+               threshold: int) -> None:
+    left, right = expressions_pair
+
+    with forms_multiplication(max_workers=2,
+                              threshold=threshold):
+        result = left * right
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.finite_expressions_pairs, strategies.thresholds)
+def test_connection_with_serial(
+        expressions_pair: Tuple[Expression, Expression],
+        threshold: int
+) -> None:
+    left, right = expressions_pair
+
+    with forms_multiplication(max_workers=2,
+                              threshold=threshold):
+        result = left * right
+
+    assert result == left * right
+
+
+@given(strategies.small_square_roots_sums_pairs, strategies.thresholds)
+def test_representation_of_serial(
+        expressions_pair: Tuple[Expression, Expression],
+        threshold: int
+) -> None:
+    left, right = expressions_pair
+
+    with forms_multiplication(max_workers=2,
+                              threshold=threshold):
+        result = left * right
+
+    assert repr(result) == repr(left * right)
+
+
+def test_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        with forms_multiplication(threshold=0):
+            pass
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from operator import neg
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.parallel import map
+from . import strategies
+
+
+@given(strategies.finite_expressions_lists, strategies.chunk_sizes)
+def test_basic(expressions: List[Expression], chunk_size: int) -> None:
+    result = map(neg, expressions,
+                 chunk_size=chunk_size,
+                 max_workers=2)
+
+    assert isinstance(result, list)
+    assert len(result) == len(expressions)
+    assert all(isinstance(element, Expression) for element in result)
+
+
+@given(strategies.finite_expressions_lists, strategies.chunk_sizes)
+def test_value(expressions: List[Expression], chunk_size: int) -> None:
+    result = map(neg, expressions,
+                 chunk_size=chunk_size,
+                 max_workers=2)
+
+    assert result == [-expression for expression in expressions]
+
+
+@given(strategies.finite_expressions_lists, strategies.chunk_sizes)
+def test_non_expressions_results(expressions: List[Expression],
+                                 chunk_size: int) -> None:
+    result = map(bool, expressions,
+                 chunk_size=chunk_size,
+                 max_workers=2)
+
+    assert result == [bool(expression) for expression in expressions]
+
+
+@given(strategies.finite_expressions_lists, strategies.chunk_sizes)
+def test_executor(expressions: List[Expression], chunk_size: int) -> None:
+    with ThreadPoolExecutor(2) as executor:
+        result = map(neg, expressions,
+                     chunk_size=chunk_size,
+                     executor=executor)
+
+    assert result == [-expression for expression in expressions]
+
+
+@given(strategies.finite_expressions_lists)
+def test_invalid_chunk_size(expressions: List[Expression]) -> None:
+    with pytest.raises(ValueError):
+        map(neg, expressions,
+            chunk_size=0)
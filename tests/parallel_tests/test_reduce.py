@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce as sequential_reduce
+from operator import add
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.parallel import reduce
+from . import strategies
+
+
+@given(strategies.non_empty_finite_expressions_lists,
+       strategies.chunk_sizes)
+def test_basic(expressions: List[Expression], chunk_size: int) -> None:
+    result = reduce(add, expressions,
+                    chunk_size=chunk_size,
+                    max_workers=2)
+
+    assert isinstance(result, Expression)
+
+
+@given(strategies.non_empty_finite_expressions_lists,
+       strategies.chunk_sizes)
+def test_connection_with_sequential(expressions: List[Expression],
+                                    chunk_size: int) -> None:
+    result = reduce(add, expressions,
+                    chunk_size=chunk_size,
+                    max_workers=2)
+
+    assert result == sequential_reduce(add, expressions)
+
+
+@given(strategies.non_empty_finite_expressions_lists,
+       strategies.chunk_sizes)
+def test_executor(expressions: List[Expression], chunk_size: int) -> None:
+    with ThreadPoolExecutor(2) as executor:
+        result = reduce(add, expressions,
+                        chunk_size=chunk_size,
+                        executor=executor)
+
+    assert result == sequential_reduce(add, expressions)
+
+
+def test_empty() -> None:
+    with pytest.raises(ValueError):
+        reduce(add, [])
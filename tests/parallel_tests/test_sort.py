@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Real
+from typing import (List,
+                    Union)
+
+from hypothesis import given
+
+from symba.base import (Expression,
+                        sort as sequential_sort)
+from symba.parallel import sort
+from . import strategies
+
+
+@given(strategies.reals_or_expressions_lists, strategies.chunk_sizes)
+def test_basic(values: List[Union[Real, Expression]],
+               chunk_size: int) -> None:
+    result = sort(values,
+                  chunk_size=chunk_size,
+                  max_workers=2)
+
+    assert isinstance(result, list)
+    assert len(result) == len(values)
+    assert all(any(element is value for value in values)
+               for element in result)
+
+
+@given(strategies.reals_or_expressions_lists, strategies.chunk_sizes)
+def test_connection_with_sequential(values: List[Union[Real, Expression]],
+                                    chunk_size: int) -> None:
+    result = sort(values,
+                  chunk_size=chunk_size,
+                  max_workers=2)
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sequential_sort(values)))
+
+
+@given(strategies.reals_or_expressions_lists, strategies.chunk_sizes)
+def test_reverse(values: List[Union[Real, Expression]],
+                 chunk_size: int) -> None:
+    result = sort(values,
+                  chunk_size=chunk_size,
+                  max_workers=2,
+                  reverse=True)
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sequential_sort(values,
+                                                            reverse=True)))
+
+
+@given(strategies.reals_or_expressions_lists, strategies.chunk_sizes)
+def test_executor(values: List[Union[Real, Expression]],
+                  chunk_size: int) -> None:
+    with ThreadPoolExecutor(2) as executor:
+        result = sort(values,
+                      chunk_size=chunk_size,
+                      executor=executor)
+
+    assert all(element is expected
+               for element, expected in zip(result,
+                                            sequential_sort(values)))
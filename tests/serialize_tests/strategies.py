@@ -0,0 +1,11 @@
+from hypothesis import strategies
+
+from tests.base_tests.strategies import expressions
+
+expressions_lists = strategies.lists(expressions,
+                                     max_size=5)
+expressions_batches = strategies.lists(expressions_lists,
+                                       max_size=3)
+non_empty_expressions_lists = strategies.lists(expressions,
+                                               min_size=1,
+                                               max_size=5)
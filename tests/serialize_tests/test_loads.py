@@ -0,0 +1,44 @@
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from symba.base import Expression
+from symba.serialize import (MAGIC,
+                             dumps,
+                             loads)
+from . import strategies
+
+
+@given(strategies.expressions_lists)
+def test_round_trip(expressions: List[Expression]) -> None:
+    result = loads(dumps(expressions))
+
+    assert result == expressions
+
+
+@given(strategies.expressions_lists)
+def test_representation(expressions: List[Expression]) -> None:
+    result = loads(dumps(expressions))
+
+    assert list(map(repr, result)) == list(map(repr, expressions))
+
+
+@given(strategies.expressions_lists)
+def test_deduplication(expressions: List[Expression]) -> None:
+    assert len(dumps(expressions + expressions)) < 2 * len(dumps(expressions))
+
+
+@given(strategies.non_empty_expressions_lists)
+def test_truncation(expressions: List[Expression]) -> None:
+    data = dumps(expressions)
+
+    with pytest.raises(ValueError):
+        loads(data[:-1])
+
+
+def test_invalid_header() -> None:
+    with pytest.raises(ValueError):
+        loads(b'')
+    with pytest.raises(ValueError):
+        loads(MAGIC + bytes((0,)))
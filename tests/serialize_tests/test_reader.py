@@ -0,0 +1,37 @@
+import io
+from typing import List
+
+from hypothesis import given
+
+from symba.base import Expression
+from symba.serialize import (Reader,
+                             Writer)
+from . import strategies
+
+
+@given(strategies.expressions_batches)
+def test_batches(batches: List[List[Expression]]) -> None:
+    stream = io.BytesIO()
+    writer = Writer(stream)
+    for batch in batches:
+        writer.write(batch)
+    stream.seek(0)
+    reader = Reader(stream)
+
+    result = [reader.read() for _ in range(len(batches))]
+
+    assert result == batches
+    assert reader.read() is None
+
+
+@given(strategies.expressions_batches)
+def test_iteration(batches: List[List[Expression]]) -> None:
+    stream = io.BytesIO()
+    writer = Writer(stream)
+    for batch in batches:
+        writer.write(batch)
+    stream.seek(0)
+
+    result = list(Reader(stream))
+
+    assert result == [expression for batch in batches for expression in batch]
@@ -1,8 +1,15 @@
 import pickle
-from typing import TypeVar
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Callable,
+                    List,
+                    TypeVar)
 
 Value = TypeVar('Value')
 
+THREADS_COUNT = 8
+
 MAX_VALUE = 10 ** 15
 MIN_VALUE = -MAX_VALUE
 SQRT_MAX_VALUE = 10 ** 2
@@ -19,3 +26,22 @@ def implication(antecedent: bool, consequent: bool) -> bool:
 
 def pickle_round_trip(value: Value) -> Value:
     return pickle.loads(pickle.dumps(value))
+
+
+def run_concurrently(function: Callable[[], Value],
+                     threads_count: int = THREADS_COUNT) -> List[Value]:
+    barrier = threading.Barrier(threads_count)
+
+    def run() -> Value:
+        barrier.wait()
+        return function()
+
+    switch_interval = sys.getswitchinterval()
+    # frequent switches make interleavings more likely on GIL builds
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(threads_count) as executor:
+            futures = [executor.submit(run) for _ in range(threads_count)]
+            return [future.result() for future in futures]
+    finally:
+        sys.setswitchinterval(switch_interval)